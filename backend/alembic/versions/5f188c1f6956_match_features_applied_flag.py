@@ -0,0 +1,43 @@
+"""match features applied flag
+
+Revision ID: 5f188c1f6956
+Revises: a767cefdfe49
+Create Date: 2026-10-18 18:04:24.153694
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f188c1f6956'
+down_revision: Union[str, None] = 'a767cefdfe49'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('matches', sa.Column('features_applied', sa.Boolean(), server_default=sa.false(), nullable=False))
+    # Matches up to both teams' marks are already in the season's features
+    applied_to = """
+        EXISTS (
+            SELECT 1 FROM team_features
+            WHERE team_features.season_id = matches.season_id
+              AND team_features.team_id = matches.{side}_team_id
+              AND (matches.match_date < team_features.last_match_date
+                   OR (matches.match_date = team_features.last_match_date
+                       AND matches.id <= team_features.last_match_id))
+        )
+    """
+    op.execute(f"""
+        UPDATE matches SET features_applied = TRUE
+        WHERE status IN ('FT', 'AET', 'PEN')
+          AND home_score IS NOT NULL AND away_score IS NOT NULL
+          AND {applied_to.format(side='home')}
+          AND {applied_to.format(side='away')}
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('matches', 'features_applied')
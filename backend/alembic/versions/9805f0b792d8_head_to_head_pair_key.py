@@ -0,0 +1,34 @@
+"""head to head pair key
+
+Revision ID: 9805f0b792d8
+Revises: 4d917b553ddd
+Create Date: 2026-10-18 17:02:26.501526
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9805f0b792d8'
+down_revision: Union[str, None] = '4d917b553ddd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Batch mode: SQLite can only add constraints by recreating the table
+    with op.batch_alter_table('head_to_head') as batch_op:
+        batch_op.add_column(sa.Column('last_match_date', sa.DateTime(timezone=True), nullable=True))
+        batch_op.add_column(sa.Column('source', sa.String(length=10), server_default='local', nullable=False))
+        batch_op.create_unique_constraint('uq_head_to_head_pair', ['team1_id', 'team2_id'])
+        batch_op.create_check_constraint('canonical_pair', 'team1_id < team2_id')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('head_to_head') as batch_op:
+        batch_op.drop_constraint('canonical_pair', type_='check')
+        batch_op.drop_constraint('uq_head_to_head_pair', type_='unique')
+        batch_op.drop_column('source')
+        batch_op.drop_column('last_match_date')
@@ -0,0 +1,65 @@
+"""match elo applied flag
+
+Revision ID: a767cefdfe49
+Revises: ed24cc24bd52
+Create Date: 2026-10-18 18:02:47.692421
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a767cefdfe49'
+down_revision: Union[str, None] = 'ed24cc24bd52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('matches', sa.Column('elo_applied', sa.Boolean(), server_default=sa.false(), nullable=False))
+    # Matches up to their league's mark are already in the ratings
+    op.execute("""
+        UPDATE matches SET elo_applied = TRUE
+        WHERE status IN ('FT', 'AET', 'PEN')
+          AND home_score IS NOT NULL AND away_score IS NOT NULL
+          AND EXISTS (
+            SELECT 1 FROM seasons
+            JOIN rating_marks ON rating_marks.league_id = seasons.league_id
+            WHERE seasons.id = matches.season_id
+              AND (matches.match_date < rating_marks.last_match_date
+                   OR (matches.match_date = rating_marks.last_match_date
+                       AND matches.id <= rating_marks.last_match_id))
+          )
+    """)
+    op.drop_table('rating_marks')
+
+
+def downgrade() -> None:
+    op.create_table('rating_marks',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('league_id', sa.Integer(), nullable=False),
+    sa.Column('last_match_date', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('last_match_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+    sa.ForeignKeyConstraint(['league_id'], ['leagues.id'], name=op.f('fk_rating_marks_league_id_leagues')),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_rating_marks')),
+    sa.UniqueConstraint('league_id', name=op.f('uq_rating_marks_league_id'))
+    )
+    # The latest applied match of each league becomes its mark
+    op.execute("""
+        INSERT INTO rating_marks (league_id, last_match_date, last_match_id)
+        SELECT seasons.league_id, matches.match_date, matches.id
+        FROM matches JOIN seasons ON seasons.id = matches.season_id
+        WHERE matches.elo_applied = TRUE
+          AND NOT EXISTS (
+            SELECT 1 FROM matches later JOIN seasons later_season ON later_season.id = later.season_id
+            WHERE later_season.league_id = seasons.league_id
+              AND later.elo_applied = TRUE
+              AND (later.match_date > matches.match_date
+                   OR (later.match_date = matches.match_date AND later.id > matches.id))
+          )
+    """)
+    op.drop_column('matches', 'elo_applied')
@@ -2,11 +2,17 @@
 Admin API endpoints.
 """
 
-from fastapi import APIRouter, Depends
+import uuid
+from typing import Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.dependencies import get_admin_user
+from app.core.http import http_clients
+from app.integrations.football_api import api_football_client
+from app.repositories.sync_job_repository import SyncJobRepository
 from app.services.sync_service import SyncService
 
 router = APIRouter()
@@ -15,35 +21,116 @@ router = APIRouter()
 @router.post("/sync")
 async def trigger_sync(
     season: int = 2024,
+    concurrent: bool = False,
+    incremental: bool = False,
+    refresh: bool = False,
+    force: bool = False,
+    run_id: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
 ):
-    """Trigger a full data sync from API-Football."""
+    """
+    Trigger a full data sync from API-Football.
+
+    `refresh` skips the response cache, `force` re-runs stages that completed
+    recently, and `run_id` resumes an interrupted run.
+    """
     sync_service = SyncService(db)
-    results = await sync_service.sync_all(season_year=season)
-    return {"status": "completed", "results": results}
+    run_id = run_id or uuid.uuid4().hex
+    if refresh:
+        with api_football_client.bypass_cache():
+            results = await sync_service.sync_all(
+                season_year=season, concurrent=concurrent, incremental=incremental,
+                run_id=run_id, force=force,
+            )
+    else:
+        results = await sync_service.sync_all(
+            season_year=season, concurrent=concurrent, incremental=incremental,
+            run_id=run_id, force=force,
+        )
+    return {"status": "completed", "run_id": run_id, "results": results}
 
 
 @router.post("/sync/{league_code}")
 async def sync_league(
     league_code: str,
     season: int = 2024,
+    refresh: bool = False,
+    force: bool = False,
     db: AsyncSession = Depends(get_db),
 ):
-    """Sync a specific league."""
+    """Sync a specific league (`refresh` skips the response cache, `force` re-runs fresh stages)."""
     sync_service = SyncService(db)
-
-    teams = await sync_service.sync_teams(league_code.upper(), season)
-    standings = await sync_service.sync_standings(league_code.upper(), season)
-    fixtures = await sync_service.sync_fixtures(league_code.upper(), season)
-
+    if refresh:
+        with api_football_client.bypass_cache():
+            results = await sync_service.sync_league(league_code.upper(), season, force=force)
+    else:
+        results = await sync_service.sync_league(league_code.upper(), season, force=force)
+
+    return {"league": league_code.upper(), **results}
+
+
+@router.get("/sync/runs")
+async def list_sync_runs(limit: int = 10, db: AsyncSession = Depends(get_db)):
+    """Recent sync runs with their stage outcomes and time spent per stage."""
+    states = await SyncJobRepository(db).get_recent_runs(limit)
+    runs: Dict[str, dict] = {}
+    for state in reversed(states):
+        run = runs.setdefault(state.run_id, {
+            "run_id": state.run_id,
+            "season": state.season_year,
+            "started_at": state.started_at,
+            "finished_at": state.finished_at,
+            "stages": {"completed": 0, "failed": 0, "running": 0},
+            "stage_ms": {},
+        })
+        run["finished_at"] = state.finished_at or run["finished_at"]
+        run["stages"][state.status] = run["stages"].get(state.status, 0) + 1
+        run["stage_ms"][state.stage] = run["stage_ms"].get(state.stage, 0) + (state.duration_ms or 0)
+    return {"runs": list(reversed(runs.values()))}
+
+
+@router.get("/sync/runs/{run_id}")
+async def get_sync_run(run_id: str, db: AsyncSession = Depends(get_db)):
+    """Per league and stage state of one sync run."""
+    states = await SyncJobRepository(db).get_run(run_id)
+    if not states:
+        raise HTTPException(status_code=404, detail="Sync run not found")
     return {
-        "league": league_code.upper(),
-        "teams": teams,
-        "standings": standings,
-        "fixtures": fixtures,
+        "run_id": run_id,
+        "stages": [
+            {
+                "league": state.league_code,
+                "stage": state.stage,
+                "status": state.status,
+                "started_at": state.started_at,
+                "finished_at": state.finished_at,
+                "duration_ms": state.duration_ms,
+                "result": state.result,
+                "error": state.error,
+            }
+            for state in states
+        ],
     }
 
 
+@router.get("/api-cache/stats")
+async def api_cache_stats():
+    """API-Football response cache hit/miss counters."""
+    return await api_football_client.cache.get_stats()
+
+
+@router.get("/api-rate-limit")
+async def api_rate_limit_stats():
+    """API-Football quota as last reported by the upstream headers."""
+    return api_football_client.rate_limiter.get_stats()
+
+
+@router.get("/http-pools")
+async def http_pool_stats():
+    """Outbound HTTP connection pools: size, open/idle connections and request counters."""
+    return http_clients.get_stats()
+
+
 @router.post("/seed-leagues")
 async def seed_leagues(db: AsyncSession = Depends(get_db)):
     """Seed the 14 leagues from config."""
@@ -53,32 +140,53 @@ async def seed_leagues(db: AsyncSession = Depends(get_db)):
 
 
 @router.post("/compute-predictions")
-async def compute_predictions(db: AsyncSession = Depends(get_db)):
-    """Trigger predictions calculation for upcoming matches."""
+async def compute_predictions(model_version: Optional[str] = None, db: AsyncSession = Depends(get_db)):
+    """
+    Refresh predictions for upcoming matches; only changed ones are written.
+
+    `model_version` overrides PREDICTION_MODEL_VERSION for this run (the
+    next sync-driven refresh switches the rows back to the configured model).
+    """
     from app.services.prediction_service import PredictionService
-    from app.repositories.match_repository import MatchRepository
-    from app.models.season import Season
-    from sqlalchemy import select
 
-    pred_service = PredictionService(db)
-    match_repo = MatchRepository(db)
+    try:
+        pred_service = PredictionService(db, model_version=model_version)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    count = await pred_service.refresh_current()
+    await db.commit()
+    return {"status": "completed", "predictions_written": count}
+
+
+@router.post("/head-to-head/rebuild")
+async def rebuild_head_to_head(db: AsyncSession = Depends(get_db)):
+    """Recompute the head-to-head table from every finished match."""
+    from app.services.head_to_head_service import HeadToHeadService
+
+    pairs = await HeadToHeadService(db).rebuild()
+    await db.commit()
+    return {"status": "completed", "pairs": pairs}
+
+
+@router.post("/ratings/rebuild")
+async def rebuild_ratings(db: AsyncSession = Depends(get_db)):
+    """Recompute every team's Elo rating from all played matches."""
+    from app.services.elo_service import EloService
+
+    applied = await EloService(db).rebuild()
+    await db.commit()
+    return {"status": "completed", "matches_applied": applied}
 
-    # Get all current seasons
-    seasons = (await db.execute(
-        select(Season).where(Season.is_current == True)
-    )).scalars().all()
 
-    count = 0
-    for season in seasons:
-        upcoming = await match_repo.get_upcoming(season.id)
-        for match in upcoming:
-            if not match.prediction:
-                prediction = await pred_service.predict_match(match)
-                db.add(prediction)
-                count += 1
+@router.post("/features/rebuild")
+async def rebuild_features(db: AsyncSession = Depends(get_db)):
+    """Recompute the rolling team features of the current seasons from their played matches."""
+    from app.services.team_feature_service import TeamFeatureService
 
+    applied = await TeamFeatureService(db).rebuild()
     await db.commit()
-    return {"status": "completed", "predictions_created": count}
+    return {"status": "completed", "matches_applied": applied}
 
 
 @router.post("/send-digest")
@@ -4,7 +4,7 @@ League API endpoints.
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -17,6 +17,7 @@ from app.models.team import Team
 from app.repositories.league_repository import LeagueRepository
 from app.repositories.standing_repository import StandingRepository
 from app.schemas.league import LeagueResponse, LeagueListResponse, LeagueDetailResponse, SeasonSummary
+from app.schemas.projection import LeagueProjectionsResponse
 from app.schemas.standing import StandingResponse, StandingsTableResponse
 
 router = APIRouter()
@@ -115,6 +116,39 @@ async def get_standings(code: str, db: AsyncSession = Depends(get_db)):
     )
 
 
+@router.get("/{code}/projections", response_model=LeagueProjectionsResponse)
+async def get_projections(
+    code: str,
+    iterations: int = Query(default=None, ge=1000, le=100000),
+    db: AsyncSession = Depends(get_db),
+):
+    """Title, G3 and Z3 probabilities from simulating the rest of the current season."""
+    from app.services.projection_service import ProjectionService
+
+    league_repo = LeagueRepository(db)
+    league = await league_repo.get_by_code(code.upper())
+    if not league:
+        raise HTTPException(status_code=404, detail=f"League '{code}' not found")
+
+    result = await db.execute(
+        select(Season)
+        .where(Season.league_id == league.id, Season.is_current == True)
+        .order_by(Season.year.desc())
+        .limit(1)
+    )
+    season = result.scalars().first()
+    if not season:
+        return LeagueProjectionsResponse(league_code=code, league_name=league.name, season_year="N/A")
+
+    projection = await ProjectionService(db).project(season.id, iterations)
+    return LeagueProjectionsResponse(
+        league_code=code,
+        league_name=league.name,
+        season_year=season.year,
+        **{key: value for key, value in projection.items() if key != "season_id"},
+    )
+
+
 @router.get("/{code}/fixtures")
 async def get_fixtures(code: str, db: AsyncSession = Depends(get_db)):
     """Get upcoming fixtures for a league."""
@@ -2,14 +2,17 @@
 Match API endpoints.
 """
 
+from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.models.team_feature import TeamFeature
 from app.repositories.match_repository import MatchRepository
 from app.schemas.match import G3vsZ3Response
+from app.services.head_to_head_service import HeadToHeadService
 
 router = APIRouter()
 
@@ -101,6 +104,7 @@ async def get_match_detail(match_id: int, db: AsyncSession = Depends(get_db)):
         "away_ht_score": match.away_ht_score,
         "home_xg": match.home_xg,
         "away_xg": match.away_xg,
+        "statistics": match.statistics,
         "status": match.status,
         "match_date": match.match_date.isoformat(),
         "matchday": match.matchday,
@@ -109,6 +113,19 @@ async def get_match_detail(match_id: int, db: AsyncSession = Depends(get_db)):
         "is_g3_vs_z3": match.is_g3_vs_z3,
     }
 
+    # Head-to-head, from the home team's side
+    h2h = await HeadToHeadService(db).get(match.home_team_id, match.away_team_id)
+    if h2h:
+        home_is_team1 = h2h.team1_id == match.home_team_id
+        result["head_to_head"] = {
+            "total_matches": h2h.total_matches,
+            "home_wins": h2h.team1_wins if home_is_team1 else h2h.team2_wins,
+            "away_wins": h2h.team2_wins if home_is_team1 else h2h.team1_wins,
+            "draws": h2h.draws,
+            "total_goals": h2h.total_goals,
+            "last_matches": h2h.last_matches,
+        }
+
     # Prediction
     if match.prediction:
         result["prediction"] = {
@@ -139,6 +156,7 @@ async def analyze_match(match_id: int, db: AsyncSession = Depends(get_db)):
     from app.integrations.llm_client import get_llm_provider
     from sqlalchemy import select
     from app.models.standing import Standing
+    from app.repositories.team_feature_repository import TeamFeatureRepository
 
     repo = MatchRepository(db)
     match = await repo.get_match_detail(match_id)
@@ -162,6 +180,12 @@ async def analyze_match(match_id: int, db: AsyncSession = Depends(get_db)):
         select(Standing).where(Standing.season_id == match.season_id, Standing.team_id == match.away_team_id)
     )).scalar_one_or_none()
 
+    features = await TeamFeatureRepository(db).get_by_keys(
+        [(match.season_id, match.home_team_id), (match.season_id, match.away_team_id)]
+    )
+    home_features = features.get((match.season_id, match.home_team_id))
+    away_features = features.get((match.season_id, match.away_team_id))
+
     # Build prompt
     home_name = match.home_team.name if match.home_team else "Home Team"
     away_name = match.away_team.name if match.away_team else "Away Team"
@@ -179,6 +203,7 @@ async def analyze_match(match_id: int, db: AsyncSession = Depends(get_db)):
     - Form: {home_standing.form if home_standing else 'N/A'}
     - Played/Won/Drawn/Lost: {home_standing.played if home_standing else 'N/A'}/{home_standing.won if home_standing else 'N/A'}/{home_standing.drawn if home_standing else 'N/A'}/{home_standing.lost if home_standing else 'N/A'}
     - Goal Diff: {home_standing.goal_difference if home_standing else 'N/A'}
+    {_features_prompt(home_features, match.match_date)}
     
     Away Team Standing:
     - Position: {away_standing.position if away_standing else 'N/A'}
@@ -186,6 +211,7 @@ async def analyze_match(match_id: int, db: AsyncSession = Depends(get_db)):
     - Form: {away_standing.form if away_standing else 'N/A'}
     - Played/Won/Drawn/Lost: {away_standing.played if away_standing else 'N/A'}/{away_standing.won if away_standing else 'N/A'}/{away_standing.drawn if away_standing else 'N/A'}/{away_standing.lost if away_standing else 'N/A'}
     - Goal Diff: {away_standing.goal_difference if away_standing else 'N/A'}
+    {_features_prompt(away_features, match.match_date)}
     
     Provide your analysis in Markdown, structured into three sections:
     1. ### 🏟️ Tactical Preview & Analysis
@@ -214,3 +240,18 @@ async def analyze_match(match_id: int, db: AsyncSession = Depends(get_db)):
         "model": ai_analysis.model_name,
     }
 
+
+def _features_prompt(feature: Optional[TeamFeature], kickoff: datetime) -> str:
+    """Rolling team features as prompt lines (oldest result first)."""
+    if feature is None:
+        return "- Recent form: N/A"
+    lines = [
+        f"- Last 10 (oldest first): {feature.form or 'N/A'} ({feature.points_10} pts), home {feature.home_form or 'N/A'}, away {feature.away_form or 'N/A'}",
+        f"- Current streak: {feature.streak_result}{feature.streak_length}" if feature.streak_result else "- Current streak: N/A",
+        f"- Goals for/against (weighted recent average): {feature.goals_for_ewma:.2f}/{feature.goals_against_ewma:.2f}"
+        if feature.goals_for_ewma is not None else "- Goals for/against: N/A",
+        f"- xG for/against per match (last {feature.xg_matches}): {feature.xg_for_avg:.2f}/{feature.xg_against_avg:.2f}"
+        if feature.xg_matches else "- xG: N/A",
+        f"- Rest days before kickoff: {feature.rest_days(kickoff)}",
+    ]
+    return "\n    ".join(lines)
@@ -4,19 +4,26 @@ Team API endpoints.
 
 import hashlib
 import os
-import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import Response, FileResponse
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.http import http_clients
+from app.models.match import Match
 from app.repositories.match_repository import MatchRepository
+from app.repositories.team_feature_repository import TeamFeatureRepository
+from app.repositories.team_rating_repository import TeamRatingRepository
 from app.repositories.team_repository import TeamRepository
-from app.schemas.team import TeamResponse, TeamSearchResponse
+from app.schemas.team import (
+    TeamDetailResponse, TeamFeatureResponse, TeamRatingResponse, TeamResponse, TeamSearchResponse,
+)
 
 router = APIRouter()
 
+http_clients.register("media", verify=False, timeout=8.0)
+
 # Directory to cache logos locally.
 CACHE_DIR = os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
@@ -59,20 +66,19 @@ async def logo_proxy(url: str = Query(..., description="The original logo URL fr
 
     # Fetch from remote server using patched DNS resolving and verifying=False
     try:
-        async with httpx.AsyncClient(verify=False, timeout=8.0) as client:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            }
-            response = await client.get(url, headers=headers)
-            if response.status_code == 200:
-                with open(cache_path, "wb") as f:
-                    f.write(response.content)
-                return Response(
-                    content=response.content,
-                    media_type=response.headers.get("content-type", f"image/{ext}")
-                )
-            else:
-                logger.warning(f"Failed to fetch team logo, remote returned status {response.status_code} for {url}")
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        }
+        response = await http_clients.get("media").get(url, headers=headers)
+        if response.status_code == 200:
+            with open(cache_path, "wb") as f:
+                f.write(response.content)
+            return Response(
+                content=response.content,
+                media_type=response.headers.get("content-type", f"image/{ext}")
+            )
+        else:
+            logger.warning(f"Failed to fetch team logo, remote returned status {response.status_code} for {url}")
     except Exception as e:
         logger.error(f"Error fetching team logo from remote {url}: {e}")
 
@@ -92,59 +98,81 @@ async def search_teams(q: str, limit: int = 20, db: AsyncSession = Depends(get_d
     )
 
 
-@router.get("/{team_id}", response_model=TeamResponse)
+@router.get("/{team_id}", response_model=TeamDetailResponse)
 async def get_team(team_id: int, db: AsyncSession = Depends(get_db)):
-    """Get team details."""
+    """Get team details with the team's Elo rating."""
     repo = TeamRepository(db)
     team = await repo.get_by_id(team_id)
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
-    return TeamResponse.model_validate(team)
+    rating = await TeamRatingRepository(db).get_by_team(team_id)
+    return TeamDetailResponse(
+        **TeamResponse.model_validate(team).model_dump(),
+        elo=TeamRatingResponse.model_validate(rating) if rating else None,
+    )
 
 
 @router.get("/{team_id}/form")
-async def get_team_form(team_id: int, limit: int = 10, db: AsyncSession = Depends(get_db)):
-    """Get team's recent form (last N matches)."""
+async def get_team_form(
+    team_id: int,
+    limit: int = 10,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get team's recent form (last N finished matches) and rolling features.
+
+    Served from the latest season's feature window when it holds `limit`
+    matches; longer requests (over TeamFeatureService.WINDOW) and early
+    season windows fall back to the match history across seasons.
+    """
     team_repo = TeamRepository(db)
     team = await team_repo.get_by_id(team_id)
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
 
-    match_repo = MatchRepository(db)
-    matches = await match_repo.get_team_matches(team_id, limit=limit)
-
-    form = []
-    for m in matches:
-        if m.home_team_id == team_id:
-            if m.home_score is not None and m.away_score is not None:
-                if m.home_score > m.away_score:
-                    form.append("W")
-                elif m.home_score < m.away_score:
-                    form.append("L")
-                else:
-                    form.append("D")
-        else:
-            if m.away_score is not None and m.home_score is not None:
-                if m.away_score > m.home_score:
-                    form.append("W")
-                elif m.away_score < m.home_score:
-                    form.append("L")
-                else:
-                    form.append("D")
+    feature = await TeamFeatureRepository(db).get_latest(team_id)
+    if feature and len(feature.recent) >= limit:
+        recent = list(reversed(feature.recent))[:limit]
+    else:
+        matches = await MatchRepository(db).get_team_matches(team_id, limit=limit)
+        recent = [_history_entry(match, team_id) for match in matches]
+    opponents = await team_repo.get_names(entry["opponent_id"] for entry in recent)
 
     return {
         "team": TeamResponse.model_validate(team),
-        "form": "".join(form),
+        "form": "".join(_result(entry) for entry in recent if entry["goals_for"] is not None),
+        "features": TeamFeatureResponse.model_validate(feature) if feature else None,
         "matches": [
             {
-                "id": m.id,
-                "opponent": (m.away_team.name if m.home_team_id == team_id else m.home_team.name)
-                if m.home_team and m.away_team else "?",
-                "home_score": m.home_score,
-                "away_score": m.away_score,
-                "is_home": m.home_team_id == team_id,
-                "date": m.match_date.isoformat(),
+                "id": entry["match_id"],
+                "opponent": opponents.get(entry["opponent_id"], "?"),
+                "home_score": entry["goals_for"] if entry["home"] else entry["goals_against"],
+                "away_score": entry["goals_against"] if entry["home"] else entry["goals_for"],
+                "is_home": entry["home"],
+                "date": entry["date"],
             }
-            for m in matches
+            for entry in recent
         ],
     }
+
+
+def _history_entry(match: Match, team_id: int) -> dict:
+    """A finished match in the shape of a team feature window entry."""
+    home = match.home_team_id == team_id
+    return {
+        "match_id": match.id,
+        "date": match.match_date.isoformat(),
+        "home": home,
+        "opponent_id": match.away_team_id if home else match.home_team_id,
+        "goals_for": match.home_score if home else match.away_score,
+        "goals_against": match.away_score if home else match.home_score,
+    }
+
+
+def _result(entry: dict) -> str:
+    """W/D/L of a team feature window entry."""
+    if entry["goals_for"] > entry["goals_against"]:
+        return "W"
+    if entry["goals_for"] < entry["goals_against"]:
+        return "L"
+    return "D"
@@ -4,7 +4,7 @@ Centralized settings management using Pydantic Settings.
 """
 
 from functools import lru_cache
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -41,6 +41,57 @@ class Settings(BaseSettings):
     # --- API-Football ---
     API_FOOTBALL_KEY: str = ""
     API_FOOTBALL_BASE_URL: str = "https://v3.football.api-sports.io"
+    API_FOOTBALL_RATE_LIMIT_ENABLED: bool = True
+    API_FOOTBALL_RATE_LIMIT_PER_MINUTE: int = 10  # Plan's per-minute cap; updated from response headers
+    API_FOOTBALL_CACHE_ENABLED: bool = True
+    # Response cache TTLs in seconds per endpoint (JSON object in env); 0 disables caching
+    API_FOOTBALL_CACHE_TTLS: Dict[str, int] = {
+        "/leagues": 86400,
+        "/teams": 86400,
+        "/teams/statistics": 3600,
+        "/standings": 1800,
+        "/fixtures": 300,
+        "/fixtures:live": 15,
+        "/fixtures/headtohead": 21600,
+        "/players/topscorers": 3600,
+        "/predictions": 3600,
+    }
+    # Raw response archive (append-only JSONL) replayed by reprocess_archive.py
+    API_FOOTBALL_ARCHIVE_ENABLED: bool = True
+    API_FOOTBALL_ARCHIVE_DIR: str = "data/api_archive"
+    API_FOOTBALL_ARCHIVE_COMPRESSION: str = "gzip"  # "gzip" or "zstd" (needs zstandard)
+    # Parse full-season fixture responses incrementally (needs ijson); bypasses the response cache
+    API_FOOTBALL_STREAM_FIXTURES: bool = False
+
+    # --- Sync ---
+    SYNC_MAX_CONCURRENCY: int = 4  # Leagues synced in parallel by sync_all(concurrent=True)
+    SYNC_STAGE_FRESHNESS_MINUTES: int = 60  # Stages completed this recently are skipped on re-runs
+    # Incremental fixture sync: rolling window around now, extended back to unfinished matches
+    FIXTURES_WINDOW_PAST_DAYS: int = 3
+    FIXTURES_WINDOW_AHEAD_DAYS: int = 7
+    FIXTURES_PENDING_LOOKBACK_DAYS: int = 14
+    FIXTURE_REFRESH_KICKOFF_HOURS: int = 3  # refresh_stale_fixtures covers kickoffs this close
+    FIXTURE_STATS_DELAY_HOURS: int = 3  # Fetch statistics this long after kickoff, once they are final
+
+    # --- Live poller ---
+    LIVE_POLL_INTERVAL_SECONDS: int = 20
+    LIVE_POLL_KICKOFF_LEAD_MINUTES: int = 15  # Start polling this long before the first kickoff
+    MATCH_EVENTS_CHANNEL: str = "football:match-events"  # Redis pub/sub channel for match changes
+
+    # --- Predictions ---
+    PREDICTION_MODEL_VERSION: str = "v1.0-bayesian"  # "v1.0-bayesian" or "v2.0-dixon-coles"
+    DIXON_COLES_DECAY_PER_DAY: float = 0.0019  # Time decay of older results (half-life ~1 year)
+    DIXON_COLES_CACHE_TTL_SECONDS: int = 7 * 86400
+    PROJECTION_ITERATIONS: int = 10000  # Simulated seasons per league projection
+    PROJECTION_CACHE_TTL_SECONDS: int = 86400
+    SCORING_WORKERS: int = 0  # Processes scoring predictions per league (0 = one per CPU, 1 = inline)
+
+    # --- Outbound HTTP ---
+    HTTP2_ENABLED: bool = True  # Only takes effect when the h2 package is installed
+    HTTP_POOL_DEFAULT_SIZE: int = 10
+    # Max connections per upstream registered in app.core.http
+    HTTP_POOL_SIZES: Dict[str, int] = {"api_football": 10, "telegram": 4, "whatsapp": 4, "media": 16}
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
 
     # --- LLM ---
     OPENAI_API_KEY: Optional[str] = None
@@ -50,6 +50,8 @@ if settings.DATABASE_URL.startswith("sqlite"):
     engine = create_async_engine(
         settings.DATABASE_URL,
         echo=settings.APP_DEBUG,
+        # Concurrent league syncs queue for the single writer instead of failing after 5s
+        connect_args={"timeout": 30},
     )
 else:
     engine = create_async_engine(
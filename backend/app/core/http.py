@@ -0,0 +1,128 @@
+"""
+Football Intelligence Dashboard - HTTP Client Registry
+Shared keep-alive httpx clients, one pool per outbound upstream.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+import httpx
+from loguru import logger
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+try:
+    import h2  # noqa: F401 - httpx needs it for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class HttpClientRegistry:
+    """
+    Named httpx.AsyncClient pools shared by the whole process.
+
+    Integrations `register()` their upstream once at import time; clients are
+    opened by the FastAPI lifespan / Celery worker init (or lazily on first
+    use) and closed on shutdown. A client is rebuilt if the running event
+    loop changed, since pooled connections cannot cross loops.
+    """
+
+    def __init__(self):
+        self._configs: Dict[str, Dict[str, Any]] = {}
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._loops: Dict[str, asyncio.AbstractEventLoop] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def register(self, name: str, **client_kwargs: Any) -> None:
+        """Declare an upstream; `client_kwargs` are passed to httpx.AsyncClient."""
+        self._configs[name] = client_kwargs
+        self._counters.setdefault(name, {"requests": 0, "errors": 0})
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """The pooled client for `name`, created on first use in the running loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(name)
+        if client is None or client.is_closed or self._loops.get(name) is not loop:
+            client = self._build(name)
+            self._clients[name] = client
+            self._loops[name] = loop
+        return client
+
+    def _build(self, name: str) -> httpx.AsyncClient:
+        if name not in self._configs:
+            raise KeyError(f"HTTP upstream '{name}' is not registered")
+        max_connections = settings.HTTP_POOL_SIZES.get(name, settings.HTTP_POOL_DEFAULT_SIZE)
+        counters = self._counters[name]
+
+        async def on_request(request: httpx.Request) -> None:
+            counters["requests"] += 1
+
+        async def on_response(response: httpx.Response) -> None:
+            if response.status_code >= 500:
+                counters["errors"] += 1
+
+        return httpx.AsyncClient(
+            http2=settings.HTTP2_ENABLED and HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            event_hooks={"request": [on_request], "response": [on_response]},
+            **self._configs[name],
+        )
+
+    async def open(self) -> None:
+        """Create every registered client in the running loop."""
+        for name in self._configs:
+            self.get(name)
+        logger.info(f"HTTP pools open: {', '.join(self._configs) or 'none'}")
+
+    async def close(self, name: Optional[str] = None) -> None:
+        """Close one client, or all of them."""
+        names = [name] if name else list(self._clients)
+        for client_name in names:
+            client = self._clients.pop(client_name, None)
+            self._loops.pop(client_name, None)
+            if client is None or client.is_closed:
+                continue
+            try:
+                await client.aclose()
+            except Exception as e:
+                # A client from a loop that is already gone can't be closed cleanly
+                logger.debug(f"HTTP pool {client_name} close failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool size, open/idle connections and request counters per upstream."""
+        stats = {}
+        for name in self._configs:
+            client = self._clients.get(name)
+            entry: Dict[str, Any] = {
+                "open": client is not None and not client.is_closed,
+                "http2": settings.HTTP2_ENABLED and HTTP2_AVAILABLE,
+                "max_connections": settings.HTTP_POOL_SIZES.get(name, settings.HTTP_POOL_DEFAULT_SIZE),
+                **self._counters[name],
+            }
+            if entry["open"]:
+                entry.update(_pool_usage(client))
+            stats[name] = entry
+        return stats
+
+
+def _pool_usage(client: httpx.AsyncClient) -> Dict[str, int]:
+    """Connection counts from the httpcore pool behind an httpx client."""
+    try:
+        connections = client._transport._pool.connections
+    except AttributeError:
+        return {}
+    return {
+        "connections": len(connections),
+        "idle": sum(1 for conn in connections if conn.is_idle()),
+    }
+
+
+# Process-wide registry
+http_clients = HttpClientRegistry()
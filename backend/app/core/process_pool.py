@@ -0,0 +1,71 @@
+"""
+Football Intelligence Dashboard - CPU Process Pool
+Worker processes for CPU-bound scoring, kept off the event loop.
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class ProcessPool:
+    """
+    A ProcessPoolExecutor shared by the whole process, started on first use.
+
+    `run()` awaits a picklable function in a worker process, so the event
+    loop keeps serving while every core scores. Functions run inline instead
+    with SCORING_WORKERS=1 or inside a daemonic process: Celery's prefork
+    children may not start processes of their own, so the "scoring" queue has
+    a `--pool solo` worker (see docker-compose.yml). The threads pool is not an
+    option: tasks share one event loop per process (see workers/tasks.py).
+    """
+
+    def __init__(self):
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._inline_logged = False
+
+    @property
+    def workers(self) -> int:
+        return settings.SCORING_WORKERS or os.cpu_count() or 1
+
+    def _get(self) -> Optional[ProcessPoolExecutor]:
+        if self._executor is not None:
+            return self._executor
+        if self.workers <= 1 or multiprocessing.current_process().daemon:
+            if not self._inline_logged:
+                logger.info("Scoring runs inline (single worker or daemonic process)")
+                self._inline_logged = True
+            return None
+        # Spawned, not forked: children must not inherit the loop, sockets or DB connections
+        self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+        logger.info(f"Scoring process pool started with {self.workers} workers")
+        return self._executor
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """`fn(*args)` in a worker process (or inline, see above)."""
+        executor = self._get()
+        if executor is None:
+            return fn(*args)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); start a fresh pool on the next call
+            self._executor = None
+            raise
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+process_pool = ProcessPool()
@@ -4,67 +4,266 @@ Async client for api-football.com (via api-sports.io).
 Handles rate limiting, caching, and data transformation.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 import httpx
+import orjson
 from loguru import logger
 
+try:
+    import ijson
+except ImportError:  # optional: streaming falls back to decoding the whole body
+    ijson = None
+
 from app.core.config import get_settings
+from app.core.http import http_clients
+from app.integrations.rate_limiter import (
+    PRIORITY_DEFAULT,
+    PRIORITY_LIVE,
+    QuotaExhaustedError,
+    RateLimiter,
+)
+from app.integrations.raw_archive import RawArchive
+from app.integrations.response_cache import ResponseCache
+from app.models.match import LIVE_STATUSES
 
 settings = get_settings()
 
+# Set inside `APIFootballClient.bypass_cache()` to force fresh upstream reads
+_bypass_cache: ContextVar[bool] = ContextVar("api_football_bypass_cache", default=False)
+# Set inside `APIFootballClient.priority()` to override the default request priority
+_request_priority: ContextVar[Optional[int]] = ContextVar("api_football_priority", default=None)
+
+
+class APIFootballError(Exception):
+    """
+    A request got no usable answer: refused for quota, still rate limited
+    after retries, an HTTP or transport failure, or an API `errors` payload.
+    """
+
 
 class APIFootballClient:
     """Client for the API-Football v3 API."""
 
+    # Extra attempts after an upstream rate-limit rejection
+    RATE_LIMIT_RETRIES = 2
+    # Upper bound of fixture IDs accepted by a single `/fixtures?ids=` lookup
+    MAX_IDS_PER_REQUEST = 20
+
     def __init__(self):
         self.base_url = settings.API_FOOTBALL_BASE_URL
         self.api_key = settings.API_FOOTBALL_KEY
         self.headers = {
             "x-apisports-key": self.api_key,
         }
-        self._client: Optional[httpx.AsyncClient] = None
+        http_clients.register(
+            "api_football",
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=30.0,
+            verify=False,
+        )
+        self.cache = ResponseCache(
+            namespace="apifootball",
+            ttls=settings.API_FOOTBALL_CACHE_TTLS,
+            enabled=settings.API_FOOTBALL_CACHE_ENABLED,
+        )
+        self.rate_limiter = RateLimiter(
+            name="apifootball",
+            per_minute=settings.API_FOOTBALL_RATE_LIMIT_PER_MINUTE,
+            enabled=settings.API_FOOTBALL_RATE_LIMIT_ENABLED,
+        )
+        self.archive = RawArchive(
+            root=settings.API_FOOTBALL_ARCHIVE_DIR,
+            enabled=settings.API_FOOTBALL_ARCHIVE_ENABLED,
+            compression=settings.API_FOOTBALL_ARCHIVE_COMPRESSION,
+        )
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                headers=self.headers,
-                timeout=30.0,
-                verify=False,
-            )
-        return self._client
-
-    async def _request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make a GET request to the API."""
+        """Get the shared pooled HTTP client."""
+        return http_clients.get("api_football")
+
+    @contextmanager
+    def bypass_cache(self) -> Iterator[None]:
+        """Skip cache reads for requests made in this context (responses are still cached)."""
+        token = _bypass_cache.set(True)
+        try:
+            yield
+        finally:
+            _bypass_cache.reset(token)
+
+    @contextmanager
+    def priority(self, level: int) -> Iterator[None]:
+        """Queue requests made in this context at `level` (see app.integrations.rate_limiter)."""
+        token = _request_priority.set(level)
+        try:
+            yield
+        finally:
+            _request_priority.reset(token)
+
+    @staticmethod
+    def _is_live_query(endpoint: str, params: Optional[Dict]) -> bool:
+        params = params or {}
+        return endpoint == "/fixtures" and (
+            "live" in params or params.get("status") in LIVE_STATUSES
+        )
+
+    def _cache_ttl(self, endpoint: str, params: Optional[Dict]) -> int:
+        """TTL in seconds for an endpoint; live fixture queries use the short `/fixtures:live` TTL."""
+        if self._is_live_query(endpoint, params):
+            return self.cache.ttls.get("/fixtures:live", 0)
+        return self.cache.ttls.get(endpoint, 0)
+
+    def _resolve_priority(self, endpoint: str, params: Optional[Dict]) -> int:
+        """Context priority if set, else live fixture queries jump ahead of everything else."""
+        level = _request_priority.get()
+        if level is not None:
+            return level
+        return PRIORITY_LIVE if self._is_live_query(endpoint, params) else PRIORITY_DEFAULT
+
+    async def _request(
+        self, endpoint: str, params: Optional[Dict] = None, force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        """Make a GET request to the API, served from the response cache when fresh."""
+        ttl = self._cache_ttl(endpoint, params) if self.cache.enabled else 0
+        cache_key = self.cache.key(endpoint, params)
+        if ttl > 0:
+            if force_refresh or _bypass_cache.get():
+                self.cache.record_bypass()
+            else:
+                cached = await self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
         client = await self._get_client()
+        priority = self._resolve_priority(endpoint, params)
         try:
-            response = await client.get(endpoint, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            # Check API-level errors
-            if data.get("errors"):
-                logger.error(f"API-Football error: {data['errors']}")
-                return {"response": []}
-
-            # Log remaining requests
-            remaining = data.get("paging", {})
-            logger.debug(f"API-Football {endpoint}: {remaining}")
-
-            return data
-        except httpx.HTTPStatusError as e:
-            logger.error(f"API-Football HTTP error {e.response.status_code}: {e}")
-            return {"response": []}
+            for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+                # Wait for quota rather than spending it on requests that will be rejected
+                await self.rate_limiter.acquire(priority)
+                response = await client.get(endpoint, params=params)
+                await self.rate_limiter.update_from_headers(response.headers)
+
+                if response.status_code == 429:
+                    logger.warning(f"API-Football rate limited on {endpoint}, waiting for next window")
+                    await self.rate_limiter.block_until_next_window()
+                    continue
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+
+                # Check API-level errors
+                errors = data.get("errors")
+                if isinstance(errors, dict) and "rateLimit" in errors:
+                    logger.warning(f"API-Football rate limited on {endpoint}: {errors['rateLimit']}")
+                    await self.rate_limiter.block_until_next_window()
+                    continue
+                if errors:
+                    raise APIFootballError(f"{endpoint}: API error {errors}")
+
+                # Log remaining requests
+                remaining = data.get("paging", {})
+                logger.debug(f"API-Football {endpoint}: {remaining}")
+
+                await self.archive.write(endpoint, params, data)
+                if ttl > 0:
+                    await self.cache.set(cache_key, data, ttl)
+                return data
+
+            raise APIFootballError(f"{endpoint}: still rate limited after {self.RATE_LIMIT_RETRIES} retries")
+        except APIFootballError as e:
+            logger.error(f"API-Football {e}")
+            raise
         except Exception as e:
-            logger.error(f"API-Football request error: {e}")
-            return {"response": []}
+            raise self._request_error(endpoint, e) from e
+
+    async def stream(self, endpoint: str, params: Optional[Dict] = None) -> AsyncIterator[Dict]:
+        """
+        Yield the items of a response's `response` array one at a time.
+
+        The body is parsed incrementally with ijson and teed into the raw
+        archive, so it is never held in memory. Streamed responses bypass the
+        response cache. Without ijson this falls back to `_request`.
+        Failures raise APIFootballError, also after items were yielded, so a
+        cut-off stream is never mistaken for the whole response.
+        """
+        if ijson is None:
+            async for item in self._stream_buffered(endpoint, params):
+                yield item
+            return
+
+        client = await self._get_client()
+        priority = self._resolve_priority(endpoint, params)
+        try:
+            for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+                await self.rate_limiter.acquire(priority)
+                async with client.stream("GET", endpoint, params=params) as response:
+                    await self.rate_limiter.update_from_headers(response.headers)
+                    if response.status_code == 429:
+                        logger.warning(f"API-Football rate limited on {endpoint}, waiting for next window")
+                        await self.rate_limiter.block_until_next_window()
+                        continue
+                    response.raise_for_status()
+
+                    archive = self.archive.open_stream(endpoint, params)
+                    reader = _ChunkReader(response.aiter_bytes(), archive.write if archive else None)
+                    yielded = 0
+                    errors = None
+                    try:
+                        async for kind, value in _iter_response_items(reader):
+                            if kind == "errors":
+                                errors = value
+                                continue
+                            yielded += 1
+                            yield value
+                    except BaseException:
+                        if archive:
+                            archive.discard()
+                        raise
+
+                    if errors:
+                        if archive:
+                            archive.discard()
+                        if isinstance(errors, dict) and "rateLimit" in errors and not yielded:
+                            logger.warning(f"API-Football rate limited on {endpoint}: {errors['rateLimit']}")
+                            await self.rate_limiter.block_until_next_window()
+                            continue
+                        raise APIFootballError(f"{endpoint}: API error after {yielded} items: {errors}")
+                    if archive:
+                        await archive.commit()
+                    logger.debug(f"API-Football {endpoint}: streamed {yielded} items")
+                    return
+
+            raise APIFootballError(f"{endpoint}: still rate limited after {self.RATE_LIMIT_RETRIES} retries")
+        except APIFootballError as e:
+            logger.error(f"API-Football {e}")
+            raise
+        except Exception as e:
+            raise self._request_error(endpoint, e) from e
+
+    @staticmethod
+    def _request_error(endpoint: str, error: Exception) -> APIFootballError:
+        """Log a failed request and wrap the cause in APIFootballError."""
+        if isinstance(error, QuotaExhaustedError):
+            message = f"{endpoint}: request refused: {error}"
+        elif isinstance(error, httpx.HTTPStatusError):
+            message = f"{endpoint}: HTTP error {error.response.status_code}"
+        else:
+            message = f"{endpoint}: request error: {error!r}"
+        logger.error(f"API-Football {message}")
+        return APIFootballError(message)
+
+    async def _stream_buffered(self, endpoint: str, params: Optional[Dict] = None) -> AsyncIterator[Dict]:
+        """`stream` fallback: one full request, then yield its items."""
+        data = await self._request(endpoint, params)
+        for item in data.get("response", []):
+            yield item
 
     async def close(self):
         """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        await http_clients.close("api_football")
 
     # === League Endpoints ===
 
@@ -103,6 +302,35 @@ class APIFootballClient:
         next_: Optional[int] = None,
     ) -> List[Dict]:
         """Get fixtures with optional filters."""
+        params = self._fixture_params(league_id, season, status, from_date, to_date, last, next_)
+        data = await self._request("/fixtures", params)
+        return data.get("response", [])
+
+    def iter_fixtures(
+        self,
+        league_id: int,
+        season: int,
+        status: Optional[str] = None,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        last: Optional[int] = None,
+        next_: Optional[int] = None,
+    ) -> AsyncIterator[Dict]:
+        """Stream fixtures one by one (see `stream`); same filters as `get_fixtures`."""
+        params = self._fixture_params(league_id, season, status, from_date, to_date, last, next_)
+        return self.stream("/fixtures", params)
+
+    @staticmethod
+    def _fixture_params(
+        league_id: int,
+        season: int,
+        status: Optional[str],
+        from_date: Optional[str],
+        to_date: Optional[str],
+        last: Optional[int],
+        next_: Optional[int],
+    ) -> Dict[str, Any]:
+        """Query parameters for a /fixtures lookup by league and season."""
         params: Dict[str, Any] = {"league": league_id, "season": season}
         if status:
             params["status"] = status
@@ -114,8 +342,7 @@ class APIFootballClient:
             params["last"] = last
         if next_:
             params["next"] = next_
-        data = await self._request("/fixtures", params)
-        return data.get("response", [])
+        return params
 
     async def get_fixture_by_id(self, fixture_id: int) -> Optional[Dict]:
         """Get a specific fixture by ID."""
@@ -123,6 +350,21 @@ class APIFootballClient:
         results = data.get("response", [])
         return results[0] if results else None
 
+    async def get_fixtures_by_ids(self, fixture_ids: List[int]) -> List[Dict]:
+        """Get fixtures by ID, batched into `ids=` lookups of up to 20 (the API maximum)."""
+        fixtures: List[Dict] = []
+        for start in range(0, len(fixture_ids), self.MAX_IDS_PER_REQUEST):
+            chunk = fixture_ids[start:start + self.MAX_IDS_PER_REQUEST]
+            data = await self._request("/fixtures", {"ids": "-".join(str(i) for i in chunk)})
+            fixtures.extend(data.get("response", []))
+        return fixtures
+
+    async def get_live_fixtures(self, league_ids: Optional[List[int]] = None) -> List[Dict]:
+        """Get all in-play fixtures, optionally restricted to the given leagues."""
+        live = "-".join(str(league_id) for league_id in league_ids) if league_ids else "all"
+        data = await self._request("/fixtures", {"live": live})
+        return data.get("response", [])
+
     # === Teams ===
 
     async def get_teams(self, league_id: int, season: int) -> List[Dict]:
@@ -162,5 +404,97 @@ class APIFootballClient:
         return results[0] if results else None
 
 
+class ArchiveReplayClient(APIFootballClient):
+    """
+    Serves requests from the raw payload archive instead of the network.
+
+    Each request returns the most recently archived response for the same
+    endpoint and params, or an empty response if it was never archived.
+    """
+
+    def __init__(self, archive: Optional[RawArchive] = None):
+        super().__init__()
+        self.archive = archive or self.archive
+        self.served = 0
+        self.missing = 0
+        # (endpoint, league, season) partition -> {cache key: latest response}
+        self._partitions: Dict[Tuple[str, str, str], Dict[str, Dict[str, Any]]] = {}
+
+    def _load_partition(self, endpoint: str, league: str, season: str) -> Dict[str, Dict[str, Any]]:
+        partition = (endpoint, league, season)
+        if partition not in self._partitions:
+            latest: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+            for record in self.archive.records(endpoint, league, season):
+                key = self.cache.key(record["endpoint"], record["params"])
+                if key not in latest or record["fetched_at"] >= latest[key][0]:
+                    latest[key] = (record["fetched_at"], record["data"])
+            self._partitions[partition] = {key: data for key, (_, data) in latest.items()}
+        return self._partitions[partition]
+
+    async def _request(
+        self, endpoint: str, params: Optional[Dict] = None, force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        params = params or {}
+        responses = await asyncio.to_thread(
+            self._load_partition,
+            endpoint,
+            str(params.get("league", "_")),
+            str(params.get("season", "_")),
+        )
+        data = responses.get(self.cache.key(endpoint, params))
+        if data is None:
+            self.missing += 1
+            logger.debug(f"Archive replay: no {endpoint} response for {params}")
+            return {"response": []}
+        self.served += 1
+        return data
+
+    async def stream(self, endpoint: str, params: Optional[Dict] = None) -> AsyncIterator[Dict]:
+        async for item in self._stream_buffered(endpoint, params):
+            yield item
+
+    async def close(self):
+        self._partitions.clear()
+
+
+class _ChunkReader:
+    """Async file-like view over an httpx byte stream for ijson, optionally teeing each chunk."""
+
+    def __init__(self, chunks: AsyncIterator[bytes], tee=None):
+        self._chunks = chunks.__aiter__()
+        self._tee = tee
+        self._buffer = b""
+
+    async def read(self, size: int = -1) -> bytes:
+        while not self._buffer:
+            try:
+                chunk = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                return b""
+            if self._tee:
+                self._tee(chunk)
+            self._buffer = chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+async def _iter_response_items(reader: _ChunkReader) -> AsyncIterator[Tuple[str, Any]]:
+    """Parse an API-Football body incrementally, yielding ("item", obj) per `response` entry and ("errors", obj)."""
+    builder = None
+    target = None
+    async for prefix, event, value in ijson.parse_async(reader, use_float=True):
+        if builder is None:
+            if prefix in ("response.item", "errors") and event in ("start_map", "start_array"):
+                builder, target = ijson.ObjectBuilder(), prefix
+            else:
+                continue
+        builder.event(event, value)
+        if prefix == target and event in ("end_map", "end_array"):
+            yield ("item" if target == "response.item" else "errors", builder.value)
+            builder = None
+
+
 # Singleton instance
 api_football_client = APIFootballClient()
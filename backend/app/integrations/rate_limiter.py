@@ -0,0 +1,255 @@
+"""
+Football Intelligence Dashboard - API Rate Limiter
+Quota-aware token bucket shared across processes through Redis.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Mapping, Optional, Tuple
+
+import redis.asyncio as aioredis
+from loguru import logger
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# Request priorities (lower is served first)
+PRIORITY_LIVE = 0
+PRIORITY_DEFAULT = 5
+PRIORITY_BACKFILL = 10
+
+# Share of the bucket background (backfill) requests may never consume,
+# so live and regular requests from other processes keep headroom.
+BACKFILL_RESERVE = 0.2
+
+
+class QuotaExhaustedError(Exception):
+    """The daily request quota is used up; requests are refused until it resets."""
+
+
+class RateLimiter:
+    """
+    Token bucket refilled at `per_minute / 60` tokens per second.
+
+    Bucket state, and the daily-quota block, live in Redis so every API and
+    worker process draws from the same budget; if Redis is unreachable an
+    in-process bucket is used. While tokens are plentiful every waiter takes
+    one straight away. Once the bucket runs short, waiters inside a process
+    are granted tokens one at a time in priority order.
+    """
+
+    # KEYS[1] = bucket hash, KEYS[2] = daily-quota block.
+    # ARGV = capacity, refill per second, minimum tokens left after taking.
+    # Returns 0 when a token was taken, -1 while the daily quota is exhausted, otherwise milliseconds to wait.
+    TAKE_SCRIPT = """
+    if redis.call('EXISTS', KEYS[2]) == 1 then
+        return -1
+    end
+    local capacity = tonumber(ARGV[1])
+    local rate = tonumber(ARGV[2])
+    local reserve = tonumber(ARGV[3])
+    local t = redis.call('TIME')
+    local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'blocked_until')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    local blocked = tonumber(state[3]) or 0
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) / 1000 * rate)
+    local wait = 0
+    if blocked > now then
+        wait = blocked - now
+    elseif tokens >= 1 + reserve then
+        tokens = tokens - 1
+    else
+        wait = math.ceil((1 + reserve - tokens) / rate * 1000)
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    redis.call('PEXPIRE', KEYS[1], 3600000)
+    return wait
+    """
+
+    MAX_SLEEP = 5.0
+
+    def __init__(self, name: str, per_minute: int, enabled: bool = True):
+        self.name = name
+        self.per_minute = max(1, per_minute)
+        self.enabled = enabled
+        self.daily_remaining: Optional[int] = None
+        self.minute_remaining: Optional[int] = None
+        self._waiters: List[Tuple[int, int]] = []
+        self._seq = itertools.count()
+        # Set once a take comes up short: from then on only the head of the queue tries
+        self._short = False
+        self._wakeups: List[asyncio.Future] = []
+        self._redis: Optional[aioredis.Redis] = None
+        self._redis_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._script = None
+        # In-process fallback bucket
+        self._tokens = float(self.per_minute)
+        self._ts = time.monotonic()
+        self._blocked_until = 0.0
+        self._daily_exhausted_until: Optional[datetime] = None
+
+    @property
+    def _key(self) -> str:
+        return f"ratelimit:{self.name}"
+
+    @property
+    def _daily_key(self) -> str:
+        return f"ratelimit:{self.name}:daily-exhausted"
+
+    def _get_redis(self) -> aioredis.Redis:
+        """Get a Redis client bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._redis is None or self._redis_loop is not loop:
+            self._redis = aioredis.from_url(settings.REDIS_URL)
+            self._redis_loop = loop
+            self._script = self._redis.register_script(self.TAKE_SCRIPT)
+        return self._redis
+
+    async def acquire(self, priority: int = PRIORITY_DEFAULT) -> None:
+        """Wait for a token; lower priority values are served first."""
+        if not self.enabled:
+            return
+        self._check_daily()
+
+        entry = (priority, next(self._seq))
+        heapq.heappush(self._waiters, entry)
+        waited = False
+        try:
+            while True:
+                head = self._waiters[0] == entry
+                if head or not self._short:
+                    wait = await self._take(priority)
+                    if wait <= 0:
+                        # A head served without waiting means the shortage is over
+                        if head and not waited:
+                            self._short = False
+                        return
+                    self._short = True
+                    waited = True
+                    if self._waiters[0] == entry:
+                        await asyncio.sleep(min(wait, self.MAX_SLEEP))
+                        continue
+                await self._wait_for_queue()
+        finally:
+            self._waiters.remove(entry)
+            heapq.heapify(self._waiters)
+            if not self._waiters:
+                self._short = False
+            self._wake_all()
+
+    async def _wait_for_queue(self) -> None:
+        """Sleep until a waiter leaves the queue (bounded, in case a wakeup is missed)."""
+        wakeup = asyncio.get_running_loop().create_future()
+        self._wakeups.append(wakeup)
+        try:
+            await asyncio.wait({wakeup}, timeout=self.MAX_SLEEP)
+        finally:
+            if wakeup in self._wakeups:
+                self._wakeups.remove(wakeup)
+
+    def _wake_all(self) -> None:
+        wakeups, self._wakeups = self._wakeups, []
+        for wakeup in wakeups:
+            if not wakeup.done():
+                wakeup.set_result(None)
+
+    def _check_daily(self) -> None:
+        if self._daily_exhausted_until and datetime.now(timezone.utc) < self._daily_exhausted_until:
+            raise QuotaExhaustedError(
+                f"{self.name} daily quota exhausted until {self._daily_exhausted_until.isoformat()}"
+            )
+
+    async def _take(self, priority: int) -> float:
+        """Try to take a token. Returns 0 on success, else seconds to wait."""
+        # Backfill leaves a share of the bucket untouched, but can always take its last token
+        reserve = 0
+        if priority >= PRIORITY_BACKFILL:
+            reserve = min(self.per_minute * BACKFILL_RESERVE, self.per_minute - 1)
+        try:
+            self._get_redis()
+            wait_ms = int(await self._script(
+                keys=[self._key, self._daily_key], args=[self.per_minute, self.per_minute / 60, reserve]
+            ))
+        except Exception as e:
+            logger.debug(f"Rate limiter using local bucket ({e})")
+            return self._take_local(reserve)
+        if wait_ms < 0:
+            raise QuotaExhaustedError(f"{self.name} daily quota exhausted (reported by another process)")
+        return wait_ms / 1000
+
+    def _take_local(self, reserve: float) -> float:
+        now = time.monotonic()
+        if self._blocked_until > now:
+            return self._blocked_until - now
+        rate = self.per_minute / 60
+        self._tokens = min(self.per_minute, self._tokens + (now - self._ts) * rate)
+        self._ts = now
+        if self._tokens >= 1 + reserve:
+            self._tokens -= 1
+            return 0
+        return (1 + reserve - self._tokens) / rate
+
+    async def block(self, seconds: float) -> None:
+        """Drain the bucket and refuse tokens for `seconds` (after an upstream rejection)."""
+        self._tokens = 0
+        self._blocked_until = time.monotonic() + seconds
+        try:
+            redis = self._get_redis()
+            blocked_until_ms = int((time.time() + seconds) * 1000)
+            await redis.hset(self._key, mapping={"tokens": 0, "blocked_until": blocked_until_ms})
+        except Exception as e:
+            logger.debug(f"Rate limiter block not shared ({e})")
+
+    async def block_until_next_window(self) -> None:
+        """Hold requests until the upstream per-minute window rolls over."""
+        await self.block(60 - datetime.now(timezone.utc).second)
+
+    async def update_from_headers(self, headers: Mapping[str, Any]) -> None:
+        """Sync the bucket with the quota headers returned by API-Football."""
+        minute_limit = _int_header(headers, "x-ratelimit-limit")
+        minute_remaining = _int_header(headers, "x-ratelimit-remaining")
+        daily_remaining = _int_header(headers, "x-ratelimit-requests-remaining")
+
+        if minute_limit:
+            self.per_minute = minute_limit
+        if minute_remaining is not None:
+            self.minute_remaining = minute_remaining
+            if minute_remaining <= 0:
+                await self.block_until_next_window()
+        if daily_remaining is not None:
+            self.daily_remaining = daily_remaining
+            if daily_remaining <= 0:
+                tomorrow = datetime.now(timezone.utc).date() + timedelta(days=1)
+                await self._block_daily(datetime(tomorrow.year, tomorrow.month, tomorrow.day, tzinfo=timezone.utc))
+
+    async def _block_daily(self, until: datetime) -> None:
+        """Refuse requests in every process until the daily quota resets at `until`."""
+        self._daily_exhausted_until = until
+        logger.error(f"{self.name} daily quota exhausted until {until.isoformat()}")
+        try:
+            redis = self._get_redis()
+            await redis.set(self._daily_key, 1, pxat=int(until.timestamp() * 1000))
+        except Exception as e:
+            logger.debug(f"Rate limiter daily block not shared ({e})")
+
+    def get_stats(self) -> dict:
+        return {
+            "per_minute": self.per_minute,
+            "minute_remaining": self.minute_remaining,
+            "daily_remaining": self.daily_remaining,
+            "waiting": len(self._waiters),
+        }
+
+
+def _int_header(headers: Mapping[str, Any], name: str) -> Optional[int]:
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,220 @@
+"""
+Football Intelligence Dashboard - Raw API Payload Archive
+Append-only, compressed JSONL store of upstream API responses.
+
+Layout: {root}/{endpoint}/league={id}/season={year}/date={YYYY-MM-DD}/part-{pid}.jsonl.{gz|zst}
+Each line holds one response: {"fetched_at", "endpoint", "params", "data"}.
+"""
+
+import asyncio
+import gzip
+import io
+import os
+import shutil
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import IO, Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+import orjson
+from loguru import logger
+
+try:
+    import zstandard
+except ImportError:  # optional: gzip is used when zstandard is not installed
+    zstandard = None
+
+EXTENSIONS = {"gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+
+
+class RawArchive:
+    """Archives every raw response so sync parsers can be re-run without the network."""
+
+    def __init__(self, root: str, enabled: bool = True, compression: str = "gzip"):
+        if compression == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed; archiving API responses with gzip")
+            compression = "gzip"
+        if compression not in EXTENSIONS:
+            raise ValueError(f"Unsupported archive compression: {compression}")
+        self.root = root
+        self.enabled = enabled
+        self.compression = compression
+        self._lock = threading.Lock()
+
+    # --- writing ---
+
+    async def write(self, endpoint: str, params: Optional[Dict[str, Any]], data: Dict[str, Any]) -> None:
+        """Append a response to its partition; failures are logged, never raised."""
+        if not self.enabled:
+            return
+        try:
+            await asyncio.to_thread(self._append, endpoint, params or {}, data)
+        except Exception as e:
+            logger.warning(f"Raw archive write failed for {endpoint}: {e}")
+
+    def _append(self, endpoint: str, params: Dict[str, Any], data: Dict[str, Any]) -> None:
+        fetched_at = datetime.now(timezone.utc)
+        line = orjson.dumps({**self._header(endpoint, params, fetched_at), "data": data}) + b"\n"
+
+        directory = os.path.join(self.root, *self._partition(endpoint, params, fetched_at))
+        with self._lock:
+            os.makedirs(directory, exist_ok=True)
+            with open(self._part_path(directory), "ab") as f:
+                # Each append is a complete gzip member / zstd frame; readers decode them back to back
+                if self.compression == "zstd":
+                    f.write(zstandard.ZstdCompressor().compress(line))
+                else:
+                    f.write(gzip.compress(line))
+
+    def open_stream(self, endpoint: str, params: Optional[Dict[str, Any]]) -> Optional["ArchiveStream"]:
+        """
+        Start archiving a response body that arrives in chunks.
+
+        Chunks are compressed into a temporary file next to the partition and
+        appended to it on `commit()`, so the body is never held in memory.
+        Returns None when archiving is disabled or the file can't be opened.
+        """
+        if not self.enabled:
+            return None
+        params = params or {}
+        fetched_at = datetime.now(timezone.utc)
+        directory = os.path.join(self.root, *self._partition(endpoint, params, fetched_at))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            header = orjson.dumps(self._header(endpoint, params, fetched_at))
+            return ArchiveStream(self, directory, header[:-1] + b',"data":')
+        except Exception as e:
+            logger.warning(f"Raw archive stream failed for {endpoint}: {e}")
+            return None
+
+    def _part_path(self, directory: str) -> str:
+        # One file per process: appends from API and worker processes never interleave
+        return os.path.join(directory, f"part-{os.getpid()}{EXTENSIONS[self.compression]}")
+
+    @staticmethod
+    def _header(endpoint: str, params: Dict[str, Any], fetched_at: datetime) -> Dict[str, Any]:
+        return {
+            "fetched_at": fetched_at.isoformat(),
+            "endpoint": endpoint,
+            "params": {k: str(v) for k, v in params.items()},
+        }
+
+    @staticmethod
+    def _partition(endpoint: str, params: Dict[str, Any], fetched_at: datetime) -> Tuple[str, ...]:
+        return (
+            endpoint.strip("/").replace("/", "_") or "root",
+            f"league={params.get('league', '_')}",
+            f"season={params.get('season', '_')}",
+            f"date={fetched_at.date().isoformat()}",
+        )
+
+    # --- reading ---
+
+    def files(
+        self,
+        endpoint: Optional[str] = None,
+        league: Optional[Any] = None,
+        season: Optional[Any] = None,
+    ) -> List[str]:
+        """Archive files matching the filters, oldest partition first."""
+        base = self.root
+        if endpoint:
+            base = os.path.join(base, endpoint.strip("/").replace("/", "_") or "root")
+        matches = []
+        for dirpath, _, filenames in os.walk(base):
+            parts = dirpath.split(os.sep)
+            if league is not None and f"league={league}" not in parts:
+                continue
+            if season is not None and f"season={season}" not in parts:
+                continue
+            matches.extend(
+                os.path.join(dirpath, name)
+                for name in filenames
+                if name.endswith(tuple(EXTENSIONS.values()))
+            )
+        return sorted(matches, key=lambda p: (_date_part(p), p))
+
+    def records(
+        self,
+        endpoint: Optional[str] = None,
+        league: Optional[Any] = None,
+        season: Optional[Any] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield archived records matching the filters, in fetch order per file."""
+        for path in self.files(endpoint, league, season):
+            with self._open(path) as f:
+                for line in f:
+                    if line.strip():
+                        yield orjson.loads(line)
+
+    def seasons(self) -> List[int]:
+        """Seasons present in the archive."""
+        found = set()
+        for dirpath, _, _ in os.walk(self.root):
+            name = os.path.basename(dirpath)
+            if name.startswith("season=") and name[7:].isdigit():
+                found.add(int(name[7:]))
+        return sorted(found)
+
+    @staticmethod
+    def _open(path: str) -> IO[bytes]:
+        if path.endswith(EXTENSIONS["zstd"]):
+            if zstandard is None:
+                raise RuntimeError(f"zstandard is required to read {path}")
+            return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(
+                open(path, "rb"), read_across_frames=True, closefd=True
+            ))
+        return gzip.open(path, "rb")
+
+
+class ArchiveStream:
+    """Compresses one streamed response into a temp file, appended to its partition on commit."""
+
+    def __init__(self, archive: RawArchive, directory: str, prefix: bytes):
+        self.archive = archive
+        self.directory = directory
+        self.tmp_path = os.path.join(directory, f".stream-{os.getpid()}-{uuid.uuid4().hex}.tmp")
+        self._file = open(self.tmp_path, "wb")
+        self._writer: BinaryIO
+        if archive.compression == "zstd":
+            self._writer = zstandard.ZstdCompressor().stream_writer(self._file, closefd=False)
+        else:
+            self._writer = gzip.GzipFile(fileobj=self._file, mode="wb")
+        self._writer.write(prefix)
+
+    def write(self, chunk: bytes) -> None:
+        # Raw newlines can only be JSON whitespace; dropping them keeps one record per line
+        self._writer.write(chunk.replace(b"\n", b" ").replace(b"\r", b" "))
+
+    async def commit(self) -> None:
+        try:
+            await asyncio.to_thread(self._commit)
+        except Exception as e:
+            logger.warning(f"Raw archive stream commit failed: {e}")
+            self.discard()
+
+    def _commit(self) -> None:
+        self._writer.write(b"}\n")
+        self._writer.close()
+        self._file.close()
+        with self.archive._lock:
+            with open(self.tmp_path, "rb") as src, open(self.archive._part_path(self.directory), "ab") as dst:
+                shutil.copyfileobj(src, dst)
+        os.remove(self.tmp_path)
+
+    def discard(self) -> None:
+        """Drop a partial or failed response."""
+        for handle in (self._writer, self._file):
+            try:
+                handle.close()
+            except Exception:
+                pass
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+def _date_part(path: str) -> str:
+    for part in path.split(os.sep):
+        if part.startswith("date="):
+            return part
+    return ""
@@ -0,0 +1,93 @@
+"""
+Football Intelligence Dashboard - API Response Cache
+Redis-backed, compressed cache for upstream API responses.
+"""
+
+import asyncio
+import zlib
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+import orjson
+import redis.asyncio as aioredis
+from loguru import logger
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class ResponseCache:
+    """Stores JSON responses zlib-compressed in Redis with per-endpoint TTLs."""
+
+    STATS_KEY = "stats"
+
+    def __init__(self, namespace: str, ttls: Dict[str, int], enabled: bool = True):
+        self.namespace = namespace
+        self.ttls = ttls
+        self.enabled = enabled
+        self.stats = {"hits": 0, "misses": 0, "bypassed": 0, "errors": 0}
+        self._redis: Optional[aioredis.Redis] = None
+        self._redis_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_redis(self) -> aioredis.Redis:
+        """Get a Redis client bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._redis is None or self._redis_loop is not loop:
+            # Pooled connections can't cross loops: rebind when this process's loop was replaced
+            # (e.g. a worker whose loop was closed and rebuilt, or asyncio.run in a script)
+            self._redis = aioredis.from_url(settings.REDIS_URL)
+            self._redis_loop = loop
+        return self._redis
+
+    def key(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Cache key from endpoint plus normalized (sorted, stringified) params."""
+        normalized = urlencode(sorted((k, str(v)) for k, v in (params or {}).items()))
+        return f"{self.namespace}:{endpoint}?{normalized}"
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response, or None on a miss or Redis failure."""
+        try:
+            raw = await self._get_redis().get(key)
+        except Exception as e:
+            logger.warning(f"Response cache unavailable: {e}")
+            self.stats["errors"] += 1
+            return None
+
+        counter = "hits" if raw is not None else "misses"
+        self.stats[counter] += 1
+        await self._incr_shared(counter)
+        if raw is None:
+            return None
+        return orjson.loads(zlib.decompress(raw))
+
+    async def set(self, key: str, data: Dict[str, Any], ttl: int) -> None:
+        """Store a response for `ttl` seconds."""
+        if ttl <= 0:
+            return
+        try:
+            payload = zlib.compress(orjson.dumps(data))
+            await self._get_redis().set(key, payload, ex=ttl)
+        except Exception as e:
+            logger.warning(f"Response cache write failed: {e}")
+            self.stats["errors"] += 1
+
+    def record_bypass(self) -> None:
+        self.stats["bypassed"] += 1
+
+    async def _incr_shared(self, counter: str) -> None:
+        """Bump the cross-process counters kept alongside the cached entries."""
+        try:
+            await self._get_redis().hincrby(f"{self.namespace}:{self.STATS_KEY}", counter, 1)
+        except Exception:
+            pass
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Counters for this process plus the totals shared through Redis."""
+        shared: Dict[str, int] = {}
+        try:
+            raw = await self._get_redis().hgetall(f"{self.namespace}:{self.STATS_KEY}")
+            shared = {k.decode(): int(v) for k, v in raw.items()}
+        except Exception as e:
+            logger.warning(f"Response cache stats unavailable: {e}")
+        return {"enabled": self.enabled, "process": dict(self.stats), "shared": shared}
@@ -3,13 +3,15 @@ Football Intelligence Dashboard - Telegram Integration
 Uses Telegram Bot API for sending notifications.
 """
 
-import httpx
 from loguru import logger
 
 from app.core.config import get_settings
+from app.core.http import http_clients
 
 settings = get_settings()
 
+http_clients.register("telegram", timeout=30.0)
+
 
 class TelegramClient:
     """Telegram Bot API client."""
@@ -23,15 +25,14 @@ class TelegramClient:
     ) -> bool:
         """Send a Telegram message."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/sendMessage",
-                    json={
-                        "chat_id": chat_id,
-                        "text": message,
-                        "parse_mode": parse_mode,
-                    },
-                )
+            response = await http_clients.get("telegram").post(
+                f"{self.base_url}/sendMessage",
+                json={
+                    "chat_id": chat_id,
+                    "text": message,
+                    "parse_mode": parse_mode,
+                },
+            )
 
             data = response.json()
             if data.get("ok"):
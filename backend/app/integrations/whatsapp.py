@@ -5,13 +5,15 @@ Uses CallMeBot API for sending WhatsApp messages.
 
 from urllib.parse import quote_plus
 
-import httpx
 from loguru import logger
 
 from app.core.config import get_settings
+from app.core.http import http_clients
 
 settings = get_settings()
 
+http_clients.register("whatsapp", timeout=30.0)
+
 
 class WhatsAppClient:
     """CallMeBot WhatsApp client."""
@@ -25,8 +27,7 @@ class WhatsAppClient:
             encoded_message = quote_plus(message)
             url = f"{self.base_url}?phone={phone}&apikey={apikey}&text={encoded_message}"
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url)
+            response = await http_clients.get("whatsapp").get(url)
 
             if response.status_code == 200:
                 logger.info(f"WhatsApp message sent to {phone}")
@@ -43,9 +43,16 @@ async def lifespan(app: FastAPI):
     redis = await get_redis()
     logger.info("🔴 Redis connected")
 
+    # Shared outbound HTTP pools (API-Football, Telegram, WhatsApp, logo proxy)
+    from app.core.http import http_clients
+    await http_clients.open()
+
     yield
 
     # Cleanup
+    await http_clients.close()
+    from app.core.process_pool import process_pool
+    process_pool.shutdown()
     if redis:
         await redis.close()
     logger.info("🏟️  Football Intelligence Dashboard shutting down...")
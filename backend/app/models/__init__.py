@@ -13,6 +13,9 @@ from app.models.prediction import Prediction
 from app.models.ai_analysis import AIAnalysis
 from app.models.notification_log import NotificationLog
 from app.models.user import User
+from app.models.sync_job import SyncJobState
+from app.models.team_rating import TeamRating
+from app.models.team_feature import TeamFeature
 
 __all__ = [
     "League",
@@ -25,4 +28,7 @@ __all__ = [
     "AIAnalysis",
     "NotificationLog",
     "User",
+    "SyncJobState",
+    "TeamRating",
+    "TeamFeature",
 ]
@@ -1,8 +1,9 @@
 """Head-to-head record model."""
 
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import ForeignKey, Integer, JSON
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Integer, JSON, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base, TimestampMixin
@@ -12,9 +13,17 @@ if TYPE_CHECKING:
 
 
 class HeadToHead(Base, TimestampMixin):
-    """Historical head-to-head record between two teams."""
+    """
+    Historical head-to-head record between two teams.
+
+    Stored once per pair under the canonical key team1_id < team2_id.
+    """
 
     __tablename__ = "head_to_head"
+    __table_args__ = (
+        UniqueConstraint("team1_id", "team2_id", name="uq_head_to_head_pair"),
+        CheckConstraint("team1_id < team2_id", name="canonical_pair"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     team1_id: Mapped[int] = mapped_column(ForeignKey("teams.id"), nullable=False, index=True)
@@ -25,6 +34,9 @@ class HeadToHead(Base, TimestampMixin):
     draws: Mapped[int] = mapped_column(Integer, default=0)
     total_goals: Mapped[int] = mapped_column(Integer, default=0)
     last_matches: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)  # Last N encounters
+    last_match_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    # "local" = computed from our matches table, "api" = fetched for a pair with no local history
+    source: Mapped[str] = mapped_column(String(10), nullable=False, default="local", server_default="local")
 
     # Relationships
     team1: Mapped["Team"] = relationship("Team", foreign_keys=[team1_id])
@@ -1,9 +1,9 @@
 """Match model."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import JSON, Boolean, DateTime, Float, ForeignKey, Integer, String, false
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base, TimestampMixin
@@ -16,6 +16,14 @@ if TYPE_CHECKING:
     from app.models.team import Team
 
 
+# API-Football status codes
+LIVE_STATUSES = ("1H", "HT", "2H", "ET", "P")
+FINAL_STATUSES = ("FT", "AET", "PEN", "CANC", "ABD", "AWD", "WO")
+POSTPONED_STATUSES = ("TBD", "PST", "SUSP")
+# Final statuses of matches that were actually played out (and so have statistics)
+PLAYED_STATUSES = ("FT", "AET", "PEN")
+
+
 class Match(Base, TimestampMixin):
     """A football match / fixture."""
 
@@ -35,9 +43,17 @@ class Match(Base, TimestampMixin):
     away_ht_score: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     home_xg: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     away_xg: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    # Per-side fixture statistics ({"home": {type: value}, "away": {...}}) as reported by API-Football
+    statistics: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
+    # Set once statistics were fetched for the finished match; it is never fetched again
+    stats_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     venue: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
     referee: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
     is_g3_vs_z3: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
+    # Set once the result is folded into the Elo ratings (see EloService); late results are still pending
+    elo_applied: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+    # Likewise for the season's team features (see TeamFeatureService)
+    features_applied: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
 
     # Relationships
     season: Mapped["Season"] = relationship("Season", back_populates="matches")
@@ -59,7 +75,7 @@ class Match(Base, TimestampMixin):
 
     @property
     def is_live(self) -> bool:
-        return self.status in ("1H", "HT", "2H", "ET", "P")
+        return self.status in LIVE_STATUSES
 
     @property
     def score_display(self) -> str:
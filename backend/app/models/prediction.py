@@ -25,6 +25,8 @@ class Prediction(Base, TimestampMixin):
     btts_prob: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # Both teams to score
     model_inputs: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
     model_version: Mapped[str] = mapped_column(String(50), default="v1.0")
+    # Digest of the model version, inputs and probabilities; unchanged digests are not rewritten
+    inputs_hash: Mapped[Optional[str]] = mapped_column(String(40), nullable=True)
 
     # Relationships
     match: Mapped["Match"] = relationship("Match", back_populates="prediction")
@@ -0,0 +1,33 @@
+"""Sync job state model."""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import DateTime, Index, Integer, JSON, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base, TimestampMixin
+
+
+class SyncJobState(Base, TimestampMixin):
+    """Progress of one (league, stage) step of a sync run, used to resume and time runs."""
+
+    __tablename__ = "sync_job_states"
+    __table_args__ = (
+        Index("ix_sync_job_states_lookup", "season_year", "league_code", "stage", "status"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    run_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    season_year: Mapped[int] = mapped_column(Integer, nullable=False)
+    league_code: Mapped[str] = mapped_column(String(10), nullable=False)
+    stage: Mapped[str] = mapped_column(String(30), nullable=False)  # "teams", "standings", "fixtures", ...
+    status: Mapped[str] = mapped_column(String(20), nullable=False)  # "running", "completed", "failed"
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    duration_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    result: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<SyncJobState {self.run_id} {self.league_code}/{self.stage}: {self.status}>"
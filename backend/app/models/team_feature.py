@@ -0,0 +1,81 @@
+"""Team feature model."""
+
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional
+
+from sqlalchemy import JSON, DateTime, Float, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.database import Base, TimestampMixin
+
+if TYPE_CHECKING:
+    from app.models.team import Team
+
+
+class TeamFeature(Base, TimestampMixin):
+    """
+    Rolling features of a team within a season, maintained as matches finish.
+
+    `recent` holds the last ten matches (oldest first) as
+    {match_id, date, home, opponent_id, goals_for, goals_against, xg_for,
+    xg_against}; the form, points and xG columns are derived from it.
+    Result strings read oldest to newest, like Standing.form.
+    """
+
+    __tablename__ = "team_features"
+    __table_args__ = (
+        UniqueConstraint("season_id", "team_id", name="uq_team_feature_season_team"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    season_id: Mapped[int] = mapped_column(ForeignKey("seasons.id"), nullable=False, index=True)
+    team_id: Mapped[int] = mapped_column(ForeignKey("teams.id"), nullable=False, index=True)
+    matches_played: Mapped[int] = mapped_column(Integer, default=0)
+
+    # Rolling form
+    form: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)  # last 10 results, e.g. "WWDLWLWWDW"
+    points_5: Mapped[int] = mapped_column(Integer, default=0)
+    points_10: Mapped[int] = mapped_column(Integer, default=0)
+    home_form: Mapped[Optional[str]] = mapped_column(String(5), nullable=True)  # last 5 home results
+    away_form: Mapped[Optional[str]] = mapped_column(String(5), nullable=True)  # last 5 away results
+    streak_result: Mapped[Optional[str]] = mapped_column(String(1), nullable=True)  # W, D or L
+    streak_length: Mapped[int] = mapped_column(Integer, default=0)
+
+    # Goals (exponentially weighted) and expected goals (window average)
+    goals_for_ewma: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    goals_against_ewma: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    xg_matches: Mapped[int] = mapped_column(Integer, default=0)
+    xg_for_avg: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    xg_against_avg: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+    # Last applied match
+    last_match_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_match_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    recent: Mapped[List[dict]] = mapped_column(JSON, default=list)
+
+    # Relationships
+    team: Mapped["Team"] = relationship("Team")
+
+    @property
+    def form_5(self) -> Optional[str]:
+        return self.form[-5:] if self.form else self.form
+
+    @property
+    def xg_diff(self) -> Optional[float]:
+        """Average xG for minus xG against over the window's matches with xG."""
+        if not self.xg_matches:
+            return None
+        return self.xg_for_avg - self.xg_against_avg
+
+    def rest_days(self, kickoff: datetime) -> Optional[float]:
+        """Days between the team's last match and `kickoff`."""
+        if self.last_match_date is None:
+            return None
+        last = self.last_match_date
+        if (last.tzinfo is None) != (kickoff.tzinfo is None):
+            # SQLite returns naive datetimes
+            last, kickoff = last.replace(tzinfo=None), kickoff.replace(tzinfo=None)
+        return round((kickoff - last).total_seconds() / 86400, 1)
+
+    def __repr__(self) -> str:
+        return f"<TeamFeature Team#{self.team_id} Season#{self.season_id}: {self.form}>"
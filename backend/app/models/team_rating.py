@@ -0,0 +1,31 @@
+"""Team rating models."""
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.database import Base, TimestampMixin
+
+if TYPE_CHECKING:
+    from app.models.team import Team
+
+
+class TeamRating(Base, TimestampMixin):
+    """Elo rating of a team, carried across seasons."""
+
+    __tablename__ = "team_ratings"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    team_id: Mapped[int] = mapped_column(ForeignKey("teams.id"), unique=True, nullable=False, index=True)
+    rating: Mapped[float] = mapped_column(Float, nullable=False)
+    matches_played: Mapped[int] = mapped_column(Integer, default=0)
+    last_match_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_season_id: Mapped[Optional[int]] = mapped_column(ForeignKey("seasons.id"), nullable=True)
+
+    # Relationships
+    team: Mapped["Team"] = relationship("Team")
+
+    def __repr__(self) -> str:
+        return f"<TeamRating Team#{self.team_id}: {self.rating:.0f}>"
@@ -19,6 +19,14 @@ class BaseRepository(Generic[T]):
         self.model = model
         self.session = session
 
+    def _insert(self):
+        """Dialect-specific INSERT construct supporting ON CONFLICT clauses."""
+        if self.session.get_bind().dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        return insert(self.model)
+
     async def get_by_id(self, id: int) -> Optional[T]:
         """Get a record by primary key."""
         return await self.session.get(self.model, id)
@@ -0,0 +1,67 @@
+"""Head-to-head repository."""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.head_to_head import HeadToHead
+from app.repositories.base_repository import BaseRepository
+
+Pair = Tuple[int, int]
+
+
+def canonical_pair(team_a_id: int, team_b_id: int) -> Pair:
+    """The (lower id, higher id) key a pair is stored under."""
+    return (team_a_id, team_b_id) if team_a_id < team_b_id else (team_b_id, team_a_id)
+
+
+class HeadToHeadRepository(BaseRepository[HeadToHead]):
+    """Data access layer for head-to-head records."""
+
+    # Pairs per IN clause; keeps bound parameters under driver limits.
+    PAIR_BATCH_SIZE = 500
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(HeadToHead, session)
+
+    async def get_pair(self, team_a_id: int, team_b_id: int) -> Optional[HeadToHead]:
+        """The record for two teams, in either order."""
+        team1_id, team2_id = canonical_pair(team_a_id, team_b_id)
+        result = await self.session.execute(
+            select(HeadToHead).where(HeadToHead.team1_id == team1_id, HeadToHead.team2_id == team2_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_pairs(self, pairs: Iterable[Pair]) -> Dict[Pair, HeadToHead]:
+        """Records for many canonical pairs, keyed by pair."""
+        pairs = list(set(pairs))
+        records: Dict[Pair, HeadToHead] = {}
+        for start in range(0, len(pairs), self.PAIR_BATCH_SIZE):
+            result = await self.session.execute(
+                select(HeadToHead).where(
+                    tuple_(HeadToHead.team1_id, HeadToHead.team2_id).in_(pairs[start:start + self.PAIR_BATCH_SIZE])
+                )
+            )
+            for record in result.scalars().all():
+                records[(record.team1_id, record.team2_id)] = record
+        return records
+
+    async def bulk_upsert(self, rows: List[dict]) -> int:
+        """
+        Insert or overwrite records keyed on uq_head_to_head_pair.
+
+        Every row must carry canonical `team1_id`/`team2_id` plus the same
+        columns. Returns the number of rows written.
+        """
+        for start in range(0, len(rows), self.PAIR_BATCH_SIZE):
+            stmt = self._insert().values(rows[start:start + self.PAIR_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[HeadToHead.team1_id, HeadToHead.team2_id],
+                set_={
+                    **{column: stmt.excluded[column] for column in rows[0] if column not in ("team1_id", "team2_id")},
+                    "updated_at": func.now(),
+                },
+            )
+            await self.session.execute(stmt)
+        return len(rows)
@@ -1,19 +1,27 @@
 """Match repository."""
 
-from datetime import datetime, timezone
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, case, func, or_, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, joinedload
 
-from app.models.match import Match
+from app.models.match import FINAL_STATUSES, LIVE_STATUSES, PLAYED_STATUSES, POSTPONED_STATUSES, Match
+from app.models.prediction import Prediction
+from app.models.season import Season
+from app.models.team import Team
 from app.repositories.base_repository import BaseRepository
 
 
 class MatchRepository(BaseRepository[Match]):
     """Data access layer for matches."""
 
+    # Rows per INSERT statement; keeps bound parameters under driver limits.
+    UPSERT_BATCH_SIZE = 1000
+    # Team pairs per IN clause in head-to-head lookups
+    PAIR_BATCH_SIZE = 500
+
     def __init__(self, session: AsyncSession):
         super().__init__(Match, session)
 
@@ -24,6 +32,137 @@ class MatchRepository(BaseRepository[Match]):
         )
         return result.scalar_one_or_none()
 
+    async def get_id_map(self, api_ids: Iterable[int]) -> Dict[int, int]:
+        """Map API-Football fixture IDs to local match IDs in a single query."""
+        api_ids = {api_id for api_id in api_ids if api_id is not None}
+        if not api_ids:
+            return {}
+        result = await self.session.execute(
+            select(Match.api_football_id, Match.id).where(Match.api_football_id.in_(api_ids))
+        )
+        return {api_id: match_id for api_id, match_id in result.all()}
+
+    async def get_finished_api_ids(self, api_ids: Iterable[int]) -> Set[int]:
+        """The API-Football fixture IDs among `api_ids` already stored with a final status."""
+        api_ids = {api_id for api_id in api_ids if api_id is not None}
+        if not api_ids:
+            return set()
+        result = await self.session.execute(
+            select(Match.api_football_id).where(
+                Match.api_football_id.in_(api_ids),
+                Match.status.in_(FINAL_STATUSES),
+            )
+        )
+        return set(result.scalars().all())
+
+    async def get_pair_results(self, pairs: Iterable[Tuple[int, int]]) -> List[dict]:
+        """
+        Scored finished matches between any of the canonical (low, high) team pairs.
+
+        Rows carry the pair key, newest first.
+        """
+        pairs = list(set(pairs))
+        team1 = case((Match.home_team_id < Match.away_team_id, Match.home_team_id), else_=Match.away_team_id)
+        team2 = case((Match.home_team_id < Match.away_team_id, Match.away_team_id), else_=Match.home_team_id)
+        rows: List[dict] = []
+        for start in range(0, len(pairs), self.PAIR_BATCH_SIZE):
+            result = await self.session.execute(
+                select(
+                    team1.label("team1_id"),
+                    team2.label("team2_id"),
+                    Match.id.label("match_id"),
+                    Match.home_team_id,
+                    Match.away_team_id,
+                    Match.home_score,
+                    Match.away_score,
+                    Match.match_date,
+                )
+                .where(
+                    tuple_(team1, team2).in_(pairs[start:start + self.PAIR_BATCH_SIZE]),
+                    Match.status.in_(FINAL_STATUSES),
+                    Match.home_score.is_not(None),
+                    Match.away_score.is_not(None),
+                )
+                .order_by(Match.match_date.desc())
+            )
+            rows.extend(dict(row._mapping) for row in result.all())
+        rows.sort(key=lambda row: row["match_date"], reverse=True)
+        return rows
+
+    async def get_finished_pairs(self) -> Set[Tuple[int, int]]:
+        """Every canonical (low, high) team pair with at least one scored finished match."""
+        team1 = case((Match.home_team_id < Match.away_team_id, Match.home_team_id), else_=Match.away_team_id)
+        team2 = case((Match.home_team_id < Match.away_team_id, Match.away_team_id), else_=Match.home_team_id)
+        result = await self.session.execute(
+            select(team1, team2)
+            .where(
+                Match.status.in_(FINAL_STATUSES),
+                Match.home_score.is_not(None),
+                Match.away_score.is_not(None),
+            )
+            .distinct()
+        )
+        return {(team1_id, team2_id) for team1_id, team2_id in result.all()}
+
+    async def bulk_upsert(self, rows: List[dict], update_columns: Sequence[str]) -> int:
+        """
+        Insert or update matches keyed on api_football_id.
+
+        Every row must carry the same keys. On conflict only `update_columns`
+        (plus updated_at) are overwritten. Returns the number of rows written.
+        """
+        for start in range(0, len(rows), self.UPSERT_BATCH_SIZE):
+            stmt = self._insert().values(rows[start:start + self.UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Match.api_football_id],
+                set_={
+                    **{column: stmt.excluded[column] for column in update_columns},
+                    "updated_at": func.now(),
+                },
+            )
+            await self.session.execute(stmt)
+        return len(rows)
+
+    async def bulk_update(self, rows: List[dict]) -> int:
+        """Update matches by primary key; every row needs an `id` plus the columns to set."""
+        if not rows:
+            return 0
+        now = datetime.now(timezone.utc)
+        await self.session.execute(update(Match), [{**row, "updated_at": now} for row in rows])
+        return len(rows)
+
+    async def recompute_g3_vs_z3(self, season_id: int, g3_ids: Set[int], z3_ids: Set[int]) -> int:
+        """
+        Re-derive is_g3_vs_z3 for the season's unfinished matches in one UPDATE.
+
+        Finished matches keep the flag they were played with. Returns the
+        number of matches whose flag flipped.
+        """
+        if g3_ids and z3_ids:
+            flag = case(
+                (
+                    or_(
+                        and_(Match.home_team_id.in_(g3_ids), Match.away_team_id.in_(z3_ids)),
+                        and_(Match.home_team_id.in_(z3_ids), Match.away_team_id.in_(g3_ids)),
+                    ),
+                    True,
+                ),
+                else_=False,
+            )
+        else:
+            flag = False
+        result = await self.session.execute(
+            update(Match)
+            .where(
+                Match.season_id == season_id,
+                Match.status.notin_(FINAL_STATUSES),
+                Match.is_g3_vs_z3.is_distinct_from(flag),
+            )
+            .values(is_g3_vs_z3=flag, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount or 0
+
     async def get_by_season(
         self, season_id: int, status: Optional[str] = None, limit: int = 50
     ) -> List[Match]:
@@ -55,6 +194,38 @@ class MatchRepository(BaseRepository[Match]):
         )
         return list(result.scalars().unique().all())
 
+    async def get_remaining(self, season_id: int) -> List[Match]:
+        """
+        Every fixture of a season without a final result, any date.
+
+        Not started, postponed and in-play matches alike: the standings only
+        count finished matches, so a live one is still to be simulated.
+        """
+        result = await self.session.execute(
+            select(Match)
+            .where(
+                Match.season_id == season_id,
+                Match.status.notin_(FINAL_STATUSES),
+            )
+            .order_by(Match.match_date, Match.id)
+        )
+        return list(result.scalars().all())
+
+    async def get_upcoming_prediction_hashes(self, season_id: int) -> List[Tuple[Match, Optional[str]]]:
+        """Upcoming fixtures (not started) of a season with their prediction's inputs_hash (None if unpredicted)."""
+        now = datetime.now(timezone.utc)
+        result = await self.session.execute(
+            select(Match, Prediction.inputs_hash)
+            .outerjoin(Prediction, Prediction.match_id == Match.id)
+            .where(
+                Match.season_id == season_id,
+                Match.status == "NS",
+                Match.match_date >= now,
+            )
+            .order_by(Match.match_date, Match.id)
+        )
+        return [(match, inputs_hash) for match, inputs_hash in result.all()]
+
     async def get_recent_results(self, season_id: int, limit: int = 20) -> List[Match]:
         """Get recent finished matches."""
         result = await self.session.execute(
@@ -93,21 +264,266 @@ class MatchRepository(BaseRepository[Match]):
                 or_(Match.home_team_id == team_id, Match.away_team_id == team_id),
                 Match.status == "FT",
             )
-            .order_by(Match.match_date.desc())
+            .order_by(Match.match_date.desc(), Match.id.desc())
             .limit(limit)
         )
         return list(result.scalars().unique().all())
 
+    async def get_season_results(
+        self, season_ids: Iterable[int]
+    ) -> Dict[int, List[Tuple[int, int, int, int, datetime]]]:
+        """
+        Played matches per season as (home id, away id, home goals, away goals, kickoff).
+
+        Oldest first, ties by id, so the lists are stable between calls.
+        """
+        season_ids = set(season_ids)
+        if not season_ids:
+            return {}
+        result = await self.session.execute(
+            select(
+                Match.season_id, Match.home_team_id, Match.away_team_id,
+                Match.home_score, Match.away_score, Match.match_date,
+            )
+            .where(
+                Match.season_id.in_(season_ids),
+                Match.status.in_(PLAYED_STATUSES),
+                Match.home_score.is_not(None),
+                Match.away_score.is_not(None),
+            )
+            .order_by(Match.season_id, Match.match_date, Match.id)
+        )
+        results: Dict[int, List[Tuple[int, int, int, int, datetime]]] = {season_id: [] for season_id in season_ids}
+        for season_id, *row in result.all():
+            results[season_id].append(tuple(row))
+        return results
+
+    async def get_unrated(self, league_id: int) -> List[Tuple[int, int, int, int, int, int, datetime]]:
+        """
+        Played matches of a league not yet applied to the Elo ratings, in kickoff order.
+
+        Returns (id, season id, home id, away id, home goals, away goals, kickoff).
+        """
+        result = await self.session.execute(
+            select(
+                Match.id, Match.season_id, Match.home_team_id, Match.away_team_id,
+                Match.home_score, Match.away_score, Match.match_date,
+            )
+            .join(Season, Match.season_id == Season.id)
+            .where(
+                Season.league_id == league_id,
+                Match.status.in_(PLAYED_STATUSES),
+                Match.home_score.is_not(None),
+                Match.away_score.is_not(None),
+                Match.elo_applied == False,
+            )
+            .order_by(Match.match_date, Match.id)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def claim_unrated(self, match_ids: Iterable[int]) -> Set[int]:
+        """
+        Flag matches as applied to the Elo ratings; returns the ids this call flagged.
+
+        Ids another writer flagged first are left out, so of two updaters that
+        read the same matches each applies a match at most once.
+        """
+        match_ids = list(match_ids)
+        if not match_ids:
+            return set()
+        result = await self.session.execute(
+            update(Match)
+            .where(Match.id.in_(match_ids), Match.elo_applied == False)
+            .values(elo_applied=True)
+            .returning(Match.id)
+        )
+        return set(result.scalars().all())
+
+    async def reset_elo_applied(self) -> None:
+        """Mark every match as not applied to the Elo ratings (before a rebuild)."""
+        await self.session.execute(
+            update(Match).where(Match.elo_applied == True).values(elo_applied=False)
+        )
+
+    async def get_season_unfeatured(
+        self, season_id: int
+    ) -> List[Tuple[int, int, int, int, int, datetime, Optional[float], Optional[float]]]:
+        """
+        Played matches of a season not yet applied to the team features, in kickoff order.
+
+        Returns (id, home id, away id, home goals, away goals, kickoff, home xG, away xG).
+        """
+        result = await self.session.execute(
+            select(
+                Match.id, Match.home_team_id, Match.away_team_id,
+                Match.home_score, Match.away_score, Match.match_date,
+                Match.home_xg, Match.away_xg,
+            )
+            .where(
+                Match.season_id == season_id,
+                Match.status.in_(PLAYED_STATUSES),
+                Match.home_score.is_not(None),
+                Match.away_score.is_not(None),
+                Match.features_applied == False,
+            )
+            .order_by(Match.match_date, Match.id)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def claim_unfeatured(self, match_ids: Iterable[int]) -> Set[int]:
+        """Flag matches as applied to the team features; returns the ids this call flagged (see `claim_unrated`)."""
+        match_ids = list(match_ids)
+        if not match_ids:
+            return set()
+        result = await self.session.execute(
+            update(Match)
+            .where(Match.id.in_(match_ids), Match.features_applied == False)
+            .values(features_applied=True)
+            .returning(Match.id)
+        )
+        return set(result.scalars().all())
+
+    async def reset_features_applied(self, season_ids: Iterable[int]) -> None:
+        """Mark the seasons' matches as not applied to the team features (before a rebuild)."""
+        await self.session.execute(
+            update(Match)
+            .where(Match.season_id.in_(set(season_ids)), Match.features_applied == True)
+            .values(features_applied=False)
+        )
+
+    async def get_league_history(
+        self, league_id: int
+    ) -> List[Tuple[int, str, datetime, int, int, int, int, Optional[float], Optional[float]]]:
+        """
+        Every played match of a league, by season year and kickoff.
+
+        Returns (id, season year, kickoff, home id, away id, home goals, away goals, home xG, away xG).
+        """
+        result = await self.session.execute(
+            select(
+                Match.id, Season.year, Match.match_date,
+                Match.home_team_id, Match.away_team_id,
+                Match.home_score, Match.away_score,
+                Match.home_xg, Match.away_xg,
+            )
+            .join(Season, Match.season_id == Season.id)
+            .where(
+                Season.league_id == league_id,
+                Match.status.in_(PLAYED_STATUSES),
+                Match.home_score.is_not(None),
+                Match.away_score.is_not(None),
+            )
+            .order_by(Season.year, Match.match_date, Match.id)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def get_missing_statistics(self, season_id: int, finished_before: datetime) -> List[Tuple[int, int, int, int]]:
+        """
+        Played matches of a season kicked off before `finished_before` whose statistics were never fetched.
+
+        Returns (match id, API fixture id, home team API id, away team API id), oldest first.
+        """
+        home_team = aliased(Team)
+        away_team = aliased(Team)
+        result = await self.session.execute(
+            select(Match.id, Match.api_football_id, home_team.api_football_id, away_team.api_football_id)
+            .join(home_team, Match.home_team_id == home_team.id)
+            .join(away_team, Match.away_team_id == away_team.id)
+            .where(
+                Match.season_id == season_id,
+                Match.status.in_(PLAYED_STATUSES),
+                Match.match_date < finished_before,
+                Match.stats_synced_at.is_(None),
+            )
+            .order_by(Match.match_date, Match.id)
+        )
+        return [tuple(row) for row in result.all()]
+
     async def get_live_matches(self) -> List[Match]:
         """Get all currently live matches."""
         result = await self.session.execute(
             select(Match)
             .options(joinedload(Match.home_team), joinedload(Match.away_team))
-            .where(Match.status.in_(["1H", "HT", "2H", "ET", "P"]))
+            .where(Match.status.in_(LIVE_STATUSES))
             .order_by(Match.match_date)
         )
         return list(result.scalars().unique().all())
 
+    async def get_oldest_pending_date(
+        self, season_id: int, since: datetime, before: datetime
+    ) -> Optional[datetime]:
+        """Earliest kickoff in [since, before) of a match still lacking a final status."""
+        result = await self.session.execute(
+            select(func.min(Match.match_date)).where(
+                Match.season_id == season_id,
+                Match.match_date >= since,
+                Match.match_date < before,
+                Match.status.notin_(FINAL_STATUSES + POSTPONED_STATUSES),
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def has_live_or_imminent(self, lead: timedelta, kicked_off_within: timedelta) -> bool:
+        """Whether any match is live, or due to kick off / recently kicked off but still NS."""
+        now = datetime.now(timezone.utc)
+        result = await self.session.execute(
+            select(Match.id)
+            .where(
+                or_(
+                    Match.status.in_(LIVE_STATUSES),
+                    and_(
+                        Match.status == "NS",
+                        Match.match_date >= now - kicked_off_within,
+                        Match.match_date <= now + lead,
+                    ),
+                )
+            )
+            .limit(1)
+        )
+        return result.first() is not None
+
+    async def get_live_candidates(self, api_ids: Iterable[int]) -> List[Match]:
+        """Matches that are live in our DB or appear in the upstream live feed."""
+        api_ids = {api_id for api_id in api_ids if api_id is not None}
+        condition = Match.status.in_(LIVE_STATUSES)
+        if api_ids:
+            condition = or_(condition, Match.api_football_id.in_(api_ids))
+        result = await self.session.execute(select(Match).where(condition))
+        return list(result.scalars().all())
+
+    async def get_needing_refresh(
+        self, kickoff_within: timedelta, lookback: timedelta
+    ) -> Dict[int, int]:
+        """
+        Matches whose upstream state is likely to have changed, as {api_football_id: season_id}.
+
+        Covers matches that kicked off (within `lookback`) without reaching a
+        final status, matches starting within `kickoff_within`, and finished
+        matches still missing their score.
+        """
+        now = datetime.now(timezone.utc)
+        result = await self.session.execute(
+            select(Match.api_football_id, Match.season_id).where(
+                or_(
+                    and_(
+                        Match.match_date <= now,
+                        Match.match_date >= now - lookback,
+                        Match.status.notin_(FINAL_STATUSES + POSTPONED_STATUSES),
+                    ),
+                    and_(
+                        Match.status == "NS",
+                        Match.match_date > now,
+                        Match.match_date <= now + kickoff_within,
+                    ),
+                    and_(
+                        Match.status.in_(("FT", "AET", "PEN")),
+                        or_(Match.home_score.is_(None), Match.away_score.is_(None)),
+                    ),
+                )
+            )
+        )
+        return {api_id: season_id for api_id, season_id in result.all()}
+
     async def get_match_detail(self, match_id: int) -> Optional[Match]:
         """Get match with all related data loaded."""
         result = await self.session.execute(
@@ -0,0 +1,33 @@
+"""Prediction repository."""
+
+from typing import List
+
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.prediction import Prediction
+from app.repositories.base_repository import BaseRepository
+
+
+class PredictionRepository(BaseRepository[Prediction]):
+    """Data access layer for predictions."""
+
+    # Rows per INSERT statement; keeps bound parameters under driver limits.
+    UPSERT_BATCH_SIZE = 500
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(Prediction, session)
+
+    async def bulk_upsert(self, rows: List[dict]) -> int:
+        """Insert or overwrite predictions keyed on match_id. Returns the number of rows written."""
+        for start in range(0, len(rows), self.UPSERT_BATCH_SIZE):
+            stmt = self._insert().values(rows[start:start + self.UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Prediction.match_id],
+                set_={
+                    **{column: stmt.excluded[column] for column in rows[0] if column != "match_id"},
+                    "updated_at": func.now(),
+                },
+            )
+            await self.session.execute(stmt)
+        return len(rows)
@@ -1,8 +1,8 @@
 """Standing repository."""
 
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -56,6 +56,18 @@ class StandingRepository(BaseRepository[Standing]):
         )
         return list(result.scalars().unique().all())
 
+    async def get_g3_z3_team_ids(self, season_id: int) -> Tuple[Set[int], Set[int]]:
+        """Team IDs in the top three (G3) and bottom three (Z3); empty for tables under six teams."""
+        result = await self.session.execute(
+            select(Standing.team_id)
+            .where(Standing.season_id == season_id)
+            .order_by(Standing.position)
+        )
+        team_ids = list(result.scalars().all())
+        if len(team_ids) < 6:
+            return set(), set()
+        return set(team_ids[:3]), set(team_ids[-3:])
+
     async def upsert(self, season_id: int, team_id: int, data: dict) -> Standing:
         """Insert or update a standing record."""
         existing = await self.get_team_standing(season_id, team_id)
@@ -66,3 +78,33 @@ class StandingRepository(BaseRepository[Standing]):
         else:
             standing = Standing(season_id=season_id, team_id=team_id, **data)
             return await self.create(standing)
+
+    async def bulk_upsert(self, season_id: int, rows: List[dict]) -> int:
+        """
+        Write a season's whole table in one statement keyed on uq_standing_season_team.
+
+        Every row must carry `team_id` plus the same standing columns, which
+        are overwritten on conflict. Returns the number of rows written.
+        """
+        if not rows:
+            return 0
+        stmt = self._insert().values([{**row, "season_id": season_id} for row in rows])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Standing.season_id, Standing.team_id],
+            set_={
+                **{column: stmt.excluded[column] for column in rows[0] if column != "team_id"},
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
+        return len(rows)
+
+    async def delete_except(self, season_id: int, team_ids: Iterable[int]) -> int:
+        """Delete the season's standings for teams not in `team_ids`. Returns rows deleted."""
+        result = await self.session.execute(
+            delete(Standing).where(
+                Standing.season_id == season_id,
+                Standing.team_id.notin_(list(team_ids)),
+            )
+        )
+        return result.rowcount or 0
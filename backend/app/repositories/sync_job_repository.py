@@ -0,0 +1,55 @@
+"""Sync job state repository."""
+
+from datetime import datetime
+from typing import List, Set
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.sync_job import SyncJobState
+from app.repositories.base_repository import BaseRepository
+
+
+class SyncJobRepository(BaseRepository[SyncJobState]):
+    """Data access layer for sync run checkpoints."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(SyncJobState, session)
+
+    async def get_completed_stages(
+        self, run_id: str, season_year: int, league_code: str, since: datetime
+    ) -> Set[str]:
+        """Stages of a league completed in this run or by any run finishing after `since`."""
+        result = await self.session.execute(
+            select(SyncJobState.stage).where(
+                SyncJobState.season_year == season_year,
+                SyncJobState.league_code == league_code,
+                SyncJobState.status == "completed",
+                or_(SyncJobState.run_id == run_id, SyncJobState.finished_at >= since),
+            )
+        )
+        return set(result.scalars().all())
+
+    async def get_run(self, run_id: str) -> List[SyncJobState]:
+        """All stage states of a run, in execution order."""
+        result = await self.session.execute(
+            select(SyncJobState)
+            .where(SyncJobState.run_id == run_id)
+            .order_by(SyncJobState.started_at, SyncJobState.id)
+        )
+        return list(result.scalars().all())
+
+    async def get_recent_runs(self, limit: int = 10) -> List[SyncJobState]:
+        """Stage states of the `limit` most recently started runs."""
+        recent = (
+            select(SyncJobState.run_id)
+            .group_by(SyncJobState.run_id)
+            .order_by(func.max(SyncJobState.started_at).desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(
+            select(SyncJobState)
+            .where(SyncJobState.run_id.in_(recent))
+            .order_by(SyncJobState.started_at.desc(), SyncJobState.id.desc())
+        )
+        return list(result.scalars().all())
@@ -0,0 +1,85 @@
+"""Team feature repository."""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.team_feature import TeamFeature
+from app.repositories.base_repository import BaseRepository
+
+
+class TeamFeatureRepository(BaseRepository[TeamFeature]):
+    """Data access layer for per-season team features."""
+
+    # Rows per INSERT statement; keeps bound parameters under driver limits.
+    UPSERT_BATCH_SIZE = 200
+    # (season, team) keys per IN clause
+    KEY_BATCH_SIZE = 500
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(TeamFeature, session)
+
+    async def get_by_season(self, season_id: int) -> Dict[int, TeamFeature]:
+        """Features of a season keyed by team id."""
+        # Rows are rewritten by bulk_upsert, so never trust the identity map's copies
+        result = await self.session.execute(
+            select(TeamFeature)
+            .where(TeamFeature.season_id == season_id)
+            .execution_options(populate_existing=True)
+        )
+        return {feature.team_id: feature for feature in result.scalars().all()}
+
+    async def get_by_keys(self, keys: Iterable[Tuple[int, int]]) -> Dict[Tuple[int, int], TeamFeature]:
+        """Features keyed by (season id, team id); keys without a row are absent."""
+        keys = list(set(keys))
+        features: Dict[Tuple[int, int], TeamFeature] = {}
+        for start in range(0, len(keys), self.KEY_BATCH_SIZE):
+            result = await self.session.execute(
+                select(TeamFeature)
+                .where(tuple_(TeamFeature.season_id, TeamFeature.team_id).in_(keys[start:start + self.KEY_BATCH_SIZE]))
+                .execution_options(populate_existing=True)
+            )
+            for feature in result.scalars().all():
+                features[(feature.season_id, feature.team_id)] = feature
+        return features
+
+    async def get_latest(self, team_id: int) -> Optional[TeamFeature]:
+        """The team's features in the season it last played in."""
+        result = await self.session.execute(
+            select(TeamFeature)
+            .where(TeamFeature.team_id == team_id)
+            .order_by(TeamFeature.last_match_date.desc().nulls_last(), TeamFeature.season_id.desc())
+            .limit(1)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def bulk_upsert(self, rows: List[dict]) -> int:
+        """
+        Insert or overwrite features keyed on (season_id, team_id).
+
+        A row never replaces one that has seen more matches, so a slower
+        concurrent updater cannot roll features back.
+        """
+        for start in range(0, len(rows), self.UPSERT_BATCH_SIZE):
+            stmt = self._insert().values(rows[start:start + self.UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[TeamFeature.season_id, TeamFeature.team_id],
+                set_={
+                    **{
+                        column: stmt.excluded[column]
+                        for column in rows[0]
+                        if column not in ("season_id", "team_id")
+                    },
+                    "updated_at": func.now(),
+                },
+                where=TeamFeature.matches_played <= stmt.excluded.matches_played,
+            )
+            await self.session.execute(stmt)
+        return len(rows)
+
+    async def delete_seasons(self, season_ids: Iterable[int]) -> None:
+        await self.session.execute(
+            delete(TeamFeature).where(TeamFeature.season_id.in_(set(season_ids)))
+        )
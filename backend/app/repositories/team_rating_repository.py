@@ -0,0 +1,52 @@
+"""Team rating repository."""
+
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.team_rating import TeamRating
+from app.repositories.base_repository import BaseRepository
+
+
+class TeamRatingRepository(BaseRepository[TeamRating]):
+    """Data access layer for team ratings."""
+
+    # Rows per INSERT statement; keeps bound parameters under driver limits.
+    UPSERT_BATCH_SIZE = 500
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(TeamRating, session)
+
+    async def get_by_team(self, team_id: int) -> Optional[TeamRating]:
+        result = await self.session.execute(
+            select(TeamRating).where(TeamRating.team_id == team_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_by_team_ids(self, team_ids: Iterable[int]) -> Dict[int, TeamRating]:
+        """Ratings keyed by team id; teams without a rating are absent."""
+        team_ids = set(team_ids)
+        if not team_ids:
+            return {}
+        result = await self.session.execute(
+            select(TeamRating).where(TeamRating.team_id.in_(team_ids))
+        )
+        return {rating.team_id: rating for rating in result.scalars().all()}
+
+    async def bulk_upsert(self, rows: List[dict]) -> int:
+        """Insert or overwrite ratings keyed on team_id. Returns the number of rows written."""
+        for start in range(0, len(rows), self.UPSERT_BATCH_SIZE):
+            stmt = self._insert().values(rows[start:start + self.UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[TeamRating.team_id],
+                set_={
+                    **{column: stmt.excluded[column] for column in rows[0] if column != "team_id"},
+                    "updated_at": func.now(),
+                },
+            )
+            await self.session.execute(stmt)
+        return len(rows)
+
+    async def delete_all(self) -> None:
+        await self.session.execute(delete(TeamRating))
@@ -1,6 +1,6 @@
 """Team repository."""
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -22,6 +22,26 @@ class TeamRepository(BaseRepository[Team]):
         )
         return result.scalar_one_or_none()
 
+    async def get_id_map(self, api_ids: Iterable[int]) -> Dict[int, int]:
+        """Map API-Football team IDs to local team IDs in a single query."""
+        api_ids = {api_id for api_id in api_ids if api_id is not None}
+        if not api_ids:
+            return {}
+        result = await self.session.execute(
+            select(Team.api_football_id, Team.id).where(Team.api_football_id.in_(api_ids))
+        )
+        return {api_id: team_id for api_id, team_id in result.all()}
+
+    async def get_names(self, team_ids: Iterable[int]) -> Dict[int, str]:
+        """Map local team IDs to names in a single query."""
+        team_ids = set(team_ids)
+        if not team_ids:
+            return {}
+        result = await self.session.execute(
+            select(Team.id, Team.name).where(Team.id.in_(team_ids))
+        )
+        return {team_id: name for team_id, name in result.all()}
+
     async def get_by_league(self, league_id: int) -> List[Team]:
         """Get all teams in a league."""
         result = await self.session.execute(
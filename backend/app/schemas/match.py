@@ -30,10 +30,10 @@ class MatchResponse(BaseModel):
 
 
 class HeadToHeadSummary(BaseModel):
-    """H2H summary between two teams."""
+    """H2H summary between a match's two teams, from the home side."""
     total_matches: int = 0
-    team1_wins: int = 0
-    team2_wins: int = 0
+    home_wins: int = 0
+    away_wins: int = 0
     draws: int = 0
     total_goals: int = 0
     last_matches: Optional[list] = None
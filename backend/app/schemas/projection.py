@@ -0,0 +1,31 @@
+"""League projection schemas."""
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class TeamProjection(BaseModel):
+    """Simulated finishing distribution of one team."""
+    team_id: int
+    team_name: Optional[str] = None
+    position: Optional[int] = None  # current
+    points: int  # current
+    expected_points: float
+    expected_position: float
+    title_prob: float
+    g3_prob: Optional[float] = None  # None for tables under six teams
+    z3_prob: Optional[float] = None
+    position_probs: List[float]  # index 0 = first place
+
+
+class LeagueProjectionsResponse(BaseModel):
+    """Monte Carlo projection of a league's final table."""
+    league_code: str
+    league_name: str
+    season_year: str
+    model_version: Optional[str] = None
+    iterations: int = 0
+    remaining_fixtures: int = 0
+    generated_at: Optional[str] = None
+    teams: List[TeamProjection] = []
@@ -1,5 +1,6 @@
 """Team schemas."""
 
+from datetime import datetime
 from typing import List, Optional
 
 from pydantic import BaseModel
@@ -20,6 +21,42 @@ class TeamResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class TeamRatingResponse(BaseModel):
+    """Team's Elo rating."""
+    rating: float
+    matches_played: int
+    last_match_date: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+
+class TeamFeatureResponse(BaseModel):
+    """Team's rolling features in a season (form strings oldest to newest)."""
+    season_id: int
+    matches_played: int
+    form: Optional[str] = None
+    form_5: Optional[str] = None
+    points_5: int
+    points_10: int
+    home_form: Optional[str] = None
+    away_form: Optional[str] = None
+    streak_result: Optional[str] = None
+    streak_length: int
+    goals_for_ewma: Optional[float] = None
+    goals_against_ewma: Optional[float] = None
+    xg_matches: int
+    xg_for_avg: Optional[float] = None
+    xg_against_avg: Optional[float] = None
+    last_match_date: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+
+class TeamDetailResponse(TeamResponse):
+    """Team with its Elo rating (None until it has played a rated match)."""
+    elo: Optional[TeamRatingResponse] = None
+
+
 class TeamWithStatsResponse(TeamResponse):
     """Team with current season stats."""
     position: Optional[int] = None
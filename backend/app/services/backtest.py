@@ -0,0 +1,316 @@
+"""
+Football Intelligence Dashboard - Backtest
+Offline replay of finished seasons to score the prediction models.
+
+A league's played matches are replayed in kickoff order. Before each match
+date the standings, team features and head-to-head records are rebuilt in
+memory as they stood that morning. Every model predicts the day's fixtures
+from them, and only then are the day's results applied, so no prediction
+sees its own result. Leagues replay independently in a process pool, and
+the 1X2 probabilities are scored with the Brier score, log-loss, ranked
+probability score and calibration curves.
+"""
+
+import copy
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import groupby
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.repositories.head_to_head_repository import canonical_pair
+from app.services import dixon_coles, prediction_engine
+from app.services.prediction_service import MODEL_BAYESIAN, MODEL_DIXON_COLES, MODEL_VERSIONS, PredictionService
+from app.services.team_feature_service import TeamFeatureService
+
+OUTCOMES = ("home", "draw", "away")
+CALIBRATION_BINS = 10
+
+# (match id, season year, kickoff, home id, away id, home goals, away goals, home xG, away xG)
+HistoryMatch = Tuple[int, str, datetime, int, int, int, int, Optional[float], Optional[float]]
+
+
+@dataclass
+class TableRow:
+    """A team's standing in the replayed table; has Standing's attributes."""
+
+    team_id: int
+    position: int = 0
+    points: int = 0
+    played: int = 0
+    goals_for: int = 0
+    goals_against: int = 0
+    goal_difference: int = 0
+    home_won: int = 0
+    home_played: int = 0
+    away_won: int = 0
+    away_played: int = 0
+    form: str = ""  # last five results, oldest first
+
+
+@dataclass
+class ReplayResult:
+    """Predictions of one model for the scored matches of a league, in kickoff order."""
+
+    match_ids: np.ndarray
+    probs: np.ndarray  # (matches, 3): home, draw, away
+    outcomes: np.ndarray  # index into OUTCOMES
+
+
+def replay_league(
+    history: Sequence[HistoryMatch],
+    seasons: Iterable[str],
+    models: Sequence[str] = MODEL_VERSIONS,
+    weights: Optional[Mapping[str, float]] = None,
+    decay_per_day: float = 0.0,
+) -> Dict[str, ReplayResult]:
+    """
+    Replay a league's history and predict every match of `seasons` with each model.
+
+    `history` must be in kickoff order; earlier seasons only feed the
+    head-to-head records. `weights` overrides entries of
+    PredictionService.WEIGHTS for the v1 model.
+    """
+    seasons = set(seasons)
+    weights = {**PredictionService.WEIGHTS, **(weights or {})}
+    h2h: Dict[Tuple[int, int], List[int]] = {}  # pair -> [team1 wins, team2 wins, draws]
+    collected: Dict[str, List[ReplayResult]] = {model: [] for model in models}
+
+    for season_year, season_matches in groupby(history, key=lambda m: m[1]):
+        season_matches = list(season_matches)
+        if season_year not in seasons:
+            for match in season_matches:
+                _apply_h2h(h2h, match)
+            continue
+        for model, result in _replay_season(season_matches, h2h, models, weights, decay_per_day).items():
+            collected[model].append(result)
+
+    return {
+        model: ReplayResult(
+            match_ids=np.concatenate([r.match_ids for r in results]) if results else np.zeros(0, dtype=int),
+            probs=np.concatenate([r.probs for r in results]) if results else np.zeros((0, 3)),
+            outcomes=np.concatenate([r.outcomes for r in results]) if results else np.zeros(0, dtype=int),
+        )
+        for model, results in collected.items()
+    }
+
+
+def _replay_season(
+    matches: List[HistoryMatch],
+    h2h: Dict[Tuple[int, int], List[int]],
+    models: Sequence[str],
+    weights: Mapping[str, float],
+    decay_per_day: float,
+) -> Dict[str, ReplayResult]:
+    team_ids = sorted({team_id for m in matches for team_id in (m[3], m[4])})
+    table = {team_id: TableRow(team_id) for team_id in team_ids}
+    features = {team_id: TeamFeatureService._empty_row(0, team_id) for team_id in team_ids}
+    results: List[dixon_coles.Result] = []
+    ratings: Optional[dixon_coles.Ratings] = None
+
+    home_rows: List[TableRow] = []
+    away_rows: List[TableRow] = []
+    home_xg: List[Optional[float]] = []
+    away_xg: List[Optional[float]] = []
+    h2h_counts: List[Tuple[int, int, int]] = []  # total, home wins, away wins
+    dc_probs: List[np.ndarray] = []
+
+    for _, day in groupby(matches, key=lambda m: m[2].date()):
+        day = list(day)
+        _rank(table)
+        for match in day:
+            home_id, away_id = match[3], match[4]
+            home_rows.append(copy.copy(table[home_id]))
+            away_rows.append(copy.copy(table[away_id]))
+            home_xg.append(_xg_diff(features[home_id]))
+            away_xg.append(_xg_diff(features[away_id]))
+            record = h2h.get(canonical_pair(home_id, away_id))
+            if record is None:
+                h2h_counts.append((0, 0, 0))
+            else:
+                home_first = home_id < away_id
+                h2h_counts.append((
+                    sum(record),
+                    record[0] if home_first else record[1],
+                    record[1] if home_first else record[0],
+                ))
+
+        if MODEL_DIXON_COLES in models:
+            # Refit from the results so far, warm-started from the previous day's ratings
+            ratings = dixon_coles.fit(results, team_ids, decay_per_day=decay_per_day, init=ratings)
+            expected_home, expected_away = ratings.expected_goals([m[3] for m in day], [m[4] for m in day])
+            markets = dixon_coles.market_probabilities(
+                dixon_coles.score_matrix(expected_home, expected_away, ratings.rho)
+            )
+            dc_probs.append(np.column_stack([markets["home"], markets["draw"], markets["away"]]))
+
+        for match in day:
+            match_id, _, kickoff, home_id, away_id, home_goals, away_goals, match_home_xg, match_away_xg = match
+            _apply_table(table[home_id], home_goals, away_goals, home=True)
+            _apply_table(table[away_id], away_goals, home_goals, home=False)
+            TeamFeatureService._apply(
+                features[home_id], match_id, kickoff, True, away_id, home_goals, away_goals, match_home_xg, match_away_xg
+            )
+            TeamFeatureService._apply(
+                features[away_id], match_id, kickoff, False, home_id, away_goals, home_goals, match_away_xg, match_home_xg
+            )
+            _apply_h2h(h2h, match)
+            results.append((home_id, away_id, home_goals, away_goals, kickoff))
+
+    match_ids = np.array([m[0] for m in matches])
+    outcomes = np.array([0 if m[5] > m[6] else 1 if m[5] == m[6] else 2 for m in matches])
+    replayed: Dict[str, ReplayResult] = {}
+    if MODEL_BAYESIAN in models:
+        counts = np.array(h2h_counts).reshape(len(matches), 3)
+        out = prediction_engine.predict(
+            PredictionService._team_arrays(home_rows, home_xg),
+            PredictionService._team_arrays(away_rows, away_xg),
+            prediction_engine.HeadToHeadArrays(total=counts[:, 0], home_wins=counts[:, 1], away_wins=counts[:, 2]),
+            weights,
+        )
+        probs = np.column_stack([out["home_prob"], out["draw_prob"], out["away_prob"]])
+        replayed[MODEL_BAYESIAN] = ReplayResult(match_ids, probs, outcomes)
+    if MODEL_DIXON_COLES in models:
+        probs = np.concatenate(dc_probs)
+        # The scoreline matrix is truncated at MAX_GOALS; renormalise the remainder away
+        replayed[MODEL_DIXON_COLES] = ReplayResult(match_ids, probs / probs.sum(axis=1, keepdims=True), outcomes)
+    return replayed
+
+
+def _rank(table: Dict[int, TableRow]) -> None:
+    """Positions by points, goal difference and goals scored."""
+    ordered = sorted(table.values(), key=lambda row: (-row.points, -row.goal_difference, -row.goals_for, row.team_id))
+    for position, row in enumerate(ordered, start=1):
+        row.position = position
+
+
+def _apply_table(row: TableRow, goals_for: int, goals_against: int, home: bool) -> None:
+    won = goals_for > goals_against
+    row.points += 3 if won else 1 if goals_for == goals_against else 0
+    row.played += 1
+    row.goals_for += goals_for
+    row.goals_against += goals_against
+    row.goal_difference = row.goals_for - row.goals_against
+    if home:
+        row.home_played += 1
+        row.home_won += won
+    else:
+        row.away_played += 1
+        row.away_won += won
+    row.form = (row.form + ("W" if won else "D" if goals_for == goals_against else "L"))[-5:]
+
+
+def _apply_h2h(h2h: Dict[Tuple[int, int], List[int]], match: HistoryMatch) -> None:
+    home_id, away_id, home_goals, away_goals = match[3], match[4], match[5], match[6]
+    record = h2h.setdefault(canonical_pair(home_id, away_id), [0, 0, 0])
+    if home_goals == away_goals:
+        record[2] += 1
+    elif (home_goals > away_goals) == (home_id < away_id):
+        record[0] += 1
+    else:
+        record[1] += 1
+
+
+def _xg_diff(row: dict) -> Optional[float]:
+    return row["xg_for_avg"] - row["xg_against_avg"] if row["xg_matches"] else None
+
+
+def brier_score(probs: np.ndarray, outcomes: np.ndarray) -> float:
+    """Mean squared distance between the probabilities and the one-hot outcome (0 is perfect, 2 worst)."""
+    observed = np.eye(len(OUTCOMES))[outcomes]
+    return float(((probs - observed) ** 2).sum(axis=1).mean())
+
+
+def log_loss(probs: np.ndarray, outcomes: np.ndarray) -> float:
+    """Mean negative log probability of the observed outcome."""
+    observed = np.clip(probs[np.arange(len(outcomes)), outcomes], 1e-15, 1.0)
+    return float(-np.log(observed).mean())
+
+
+def ranked_probability_score(probs: np.ndarray, outcomes: np.ndarray) -> float:
+    """RPS over the ordered outcomes home < draw < away (0 is perfect, 1 worst)."""
+    observed = np.eye(len(OUTCOMES))[outcomes]
+    gaps = np.cumsum(probs, axis=1)[:, :-1] - np.cumsum(observed, axis=1)[:, :-1]
+    return float((gaps ** 2).sum(axis=1).mean() / (len(OUTCOMES) - 1))
+
+
+def calibration_curve(probs: np.ndarray, outcomes: np.ndarray, bins: int = CALIBRATION_BINS) -> Dict[str, List[dict]]:
+    """Per outcome: mean predicted probability vs observed frequency in equal-width probability bins."""
+    curves = {}
+    for k, outcome in enumerate(OUTCOMES):
+        predicted = probs[:, k]
+        index = np.minimum((predicted * bins).astype(int), bins - 1)
+        counts = np.bincount(index, minlength=bins)
+        predicted_sum = np.bincount(index, weights=predicted, minlength=bins)
+        observed_sum = np.bincount(index, weights=(outcomes == k).astype(float), minlength=bins)
+        curves[outcome] = [
+            {
+                "bin": [round(b / bins, 3), round((b + 1) / bins, 3)],
+                "matches": int(counts[b]),
+                "predicted": round(float(predicted_sum[b] / counts[b]), 4),
+                "observed": round(float(observed_sum[b] / counts[b]), 4),
+            }
+            for b in range(bins)
+            if counts[b]
+        ]
+    return curves
+
+
+def score(probs: np.ndarray, outcomes: np.ndarray, calibration: bool = True) -> dict:
+    """All metrics for a set of predictions."""
+    if not len(outcomes):
+        return {"matches": 0}
+    scores = {
+        "matches": int(len(outcomes)),
+        "brier": round(brier_score(probs, outcomes), 5),
+        "log_loss": round(log_loss(probs, outcomes), 5),
+        "rps": round(ranked_probability_score(probs, outcomes), 5),
+    }
+    if calibration:
+        scores["calibration"] = calibration_curve(probs, outcomes)
+    return scores
+
+
+def _replay_job(args: tuple) -> Dict[str, ReplayResult]:
+    history, seasons, models, weights, decay_per_day = args
+    return replay_league(history, seasons, models, weights, decay_per_day)
+
+
+def run(
+    histories: Mapping[str, Sequence[HistoryMatch]],
+    seasons: Iterable[str],
+    models: Sequence[str] = MODEL_VERSIONS,
+    weights: Optional[Mapping[str, float]] = None,
+    decay_per_day: float = 0.0,
+    workers: Optional[int] = None,
+) -> dict:
+    """
+    Backtest every model on `seasons` of each league and score the predictions.
+
+    Leagues replay in a process pool of `workers` processes (default: one per
+    CPU); `workers=1` replays in this process. Returns the overall scores per
+    model with calibration curves, plus per-league scores.
+    """
+    seasons = sorted(set(seasons))
+    codes = list(histories)
+    jobs = [(histories[code], seasons, list(models), dict(weights or {}), decay_per_day) for code in codes]
+    if workers == 1 or len(jobs) <= 1:
+        replays = [_replay_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            replays = list(pool.map(_replay_job, jobs))
+
+    report = {"seasons": seasons, "weights": dict(weights or {}), "models": {}}
+    for model in models:
+        probs = np.concatenate([replay[model].probs for replay in replays]) if replays else np.zeros((0, 3))
+        outcomes = np.concatenate([replay[model].outcomes for replay in replays]) if replays else np.zeros(0, dtype=int)
+        report["models"][model] = {
+            **score(probs, outcomes),
+            "leagues": {
+                code: score(replay[model].probs, replay[model].outcomes, calibration=False)
+                for code, replay in zip(codes, replays)
+            },
+        }
+    return report
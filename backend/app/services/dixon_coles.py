@@ -0,0 +1,269 @@
+"""
+Football Intelligence Dashboard - Dixon-Coles Model
+Poisson scoreline model with per-team attack/defence ratings, home advantage
+and the Dixon-Coles correction for low scores.
+
+Expected goals are `base * home_advantage * attack[home] * defence[away]` for
+the home side and `base * attack[away] * defence[home]` for the away side,
+with attack and defence averaging 1 across the league.
+"""
+
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Goals per side considered in the scoreline matrix (0..MAX_GOALS)
+MAX_GOALS = 10
+# Pseudo-matches at league-average rating added to every team; keeps ratings
+# finite for teams that haven't scored/conceded and neutral for teams without results
+PRIOR_MATCHES = 2.0
+# Used before a season has any results
+DEFAULT_BASE_GOALS = 1.3
+DEFAULT_HOME_ADVANTAGE = 1.2
+# Candidate rho values for the low-score correction
+RHO_GRID = np.linspace(-0.25, 0.25, 201)
+
+# (home team id, away team id, home goals, away goals, kickoff) of a finished match
+Result = Tuple[int, int, int, int, datetime]
+
+
+@dataclass
+class Ratings:
+    """Fitted parameters of one season."""
+
+    team_ids: List[int]
+    attack: np.ndarray
+    defence: np.ndarray
+    base: float
+    home_advantage: float
+    rho: float
+    matches: int
+    iterations: int = 0
+
+    def expected_goals(self, home_ids: Sequence[int], away_ids: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Expected home and away goals per fixture; unknown teams rate as league average."""
+        home_attack, home_defence = self._lookup(home_ids)
+        away_attack, away_defence = self._lookup(away_ids)
+        home_goals = self.base * self.home_advantage * home_attack * away_defence
+        away_goals = self.base * away_attack * home_defence
+        return home_goals, away_goals
+
+    def team(self, team_id: int) -> Tuple[float, float]:
+        """(attack, defence) of a team."""
+        attack, defence = self._lookup([team_id])
+        return float(attack[0]), float(defence[0])
+
+    def _lookup(self, team_ids: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        row_of = {team_id: i for i, team_id in enumerate(self.team_ids)}
+        index = np.array([row_of.get(team_id, -1) for team_id in team_ids], dtype=int)
+        known = index >= 0
+        attack = np.where(known, self.attack[index] if len(self.attack) else 1.0, 1.0)
+        defence = np.where(known, self.defence[index] if len(self.defence) else 1.0, 1.0)
+        return attack, defence
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "team_ids": list(self.team_ids),
+            "attack": self.attack.tolist(),
+            "defence": self.defence.tolist(),
+            "base": self.base,
+            "home_advantage": self.home_advantage,
+            "rho": self.rho,
+            "matches": self.matches,
+            "iterations": self.iterations,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Ratings":
+        return cls(
+            team_ids=list(data["team_ids"]),
+            attack=np.array(data["attack"], dtype=float),
+            defence=np.array(data["defence"], dtype=float),
+            base=data["base"],
+            home_advantage=data["home_advantage"],
+            rho=data["rho"],
+            matches=data["matches"],
+            iterations=data.get("iterations", 0),
+        )
+
+
+def fit(
+    results: List[Result],
+    team_ids: Sequence[int] = (),
+    decay_per_day: float = 0.0,
+    init: Optional[Ratings] = None,
+    tol: float = 1e-8,
+    max_iter: int = 1000,
+) -> Ratings:
+    """
+    Fit ratings to a season's results: (home id, away id, home goals, away goals, kickoff).
+
+    Attack, defence, base rate and home advantage maximise the (time-weighted)
+    Poisson likelihood via alternating closed-form updates; rho is then chosen
+    on a grid for the Dixon-Coles likelihood given those rates. `init` warm
+    starts the updates from earlier ratings, so a refit after a few new
+    results converges in a handful of iterations.
+    """
+    ids = sorted(set(team_ids) | {r[0] for r in results} | {r[1] for r in results})
+    n_teams = len(ids)
+    if not results:
+        return Ratings(
+            team_ids=ids,
+            attack=np.ones(n_teams),
+            defence=np.ones(n_teams),
+            base=DEFAULT_BASE_GOALS,
+            home_advantage=DEFAULT_HOME_ADVANTAGE,
+            rho=0.0,
+            matches=0,
+        )
+
+    row_of = {team_id: i for i, team_id in enumerate(ids)}
+    home = np.array([row_of[r[0]] for r in results])
+    away = np.array([row_of[r[1]] for r in results])
+    home_goals = np.array([r[2] for r in results], dtype=float)
+    away_goals = np.array([r[3] for r in results], dtype=float)
+    weights = _decay_weights([r[4] for r in results], decay_per_day)
+
+    def per_team(values: np.ndarray, index: np.ndarray) -> np.ndarray:
+        return np.bincount(index, weights=values, minlength=n_teams)
+
+    total_weight = weights.sum()
+    home_total = (weights * home_goals).sum()
+    away_total = (weights * away_goals).sum()
+    scored = per_team(weights * home_goals, home) + per_team(weights * away_goals, away)
+    conceded = per_team(weights * away_goals, home) + per_team(weights * home_goals, away)
+
+    if init is not None:
+        attack, defence = init._lookup(ids)
+        base, home_advantage = init.base, init.home_advantage
+    else:
+        attack, defence = np.ones(n_teams), np.ones(n_teams)
+        base = away_total / total_weight or DEFAULT_BASE_GOALS
+        home_advantage = (home_total / away_total) if away_total else DEFAULT_HOME_ADVANTAGE
+
+    iterations = 0
+    for iterations in range(1, max_iter + 1):
+        prior = PRIOR_MATCHES * base
+        # Expected goals for each team at attack 1 (resp. conceded at defence 1)
+        home_rate = base * home_advantage
+        expected_for = per_team(weights * home_rate * defence[away], home) + per_team(weights * base * defence[home], away)
+        new_attack = (scored + prior) / (expected_for + prior)
+        expected_against = per_team(weights * home_rate * new_attack[home], away) + per_team(weights * base * new_attack[away], home)
+        new_defence = (conceded + prior) / (expected_against + prior)
+
+        # Keep both ratings centred on 1; the scale lives in `base`
+        new_attack /= new_attack.mean()
+        new_defence /= new_defence.mean()
+        strength = weights * new_attack[away] * new_defence[home]
+        new_base = away_total / strength.sum() if away_total else base
+        home_strength = (weights * new_base * new_attack[home] * new_defence[away]).sum()
+        new_home_advantage = home_total / home_strength if home_total else home_advantage
+
+        change = max(
+            np.abs(new_attack - attack).max(),
+            np.abs(new_defence - defence).max(),
+            abs(new_base - base),
+            abs(new_home_advantage - home_advantage),
+        )
+        attack, defence, base, home_advantage = new_attack, new_defence, new_base, new_home_advantage
+        if change < tol:
+            break
+
+    ratings = Ratings(
+        team_ids=ids,
+        attack=attack,
+        defence=defence,
+        base=float(base),
+        home_advantage=float(home_advantage),
+        rho=0.0,
+        matches=len(results),
+        iterations=iterations,
+    )
+    expected_home, expected_away = ratings.expected_goals([r[0] for r in results], [r[1] for r in results])
+    ratings.rho = _fit_rho(home_goals, away_goals, expected_home, expected_away, weights)
+    return ratings
+
+
+def _decay_weights(kickoffs: List[datetime], decay_per_day: float) -> np.ndarray:
+    """exp(-decay * days before the latest result) per match."""
+    if not decay_per_day:
+        return np.ones(len(kickoffs))
+    latest = max(kickoffs)
+    age_days = np.array([(latest - kickoff).total_seconds() / 86400 for kickoff in kickoffs])
+    return np.exp(-decay_per_day * age_days)
+
+
+def _fit_rho(
+    home_goals: np.ndarray,
+    away_goals: np.ndarray,
+    expected_home: np.ndarray,
+    expected_away: np.ndarray,
+    weights: np.ndarray,
+) -> float:
+    """Grid-search rho maximising the weighted log of the low-score correction."""
+    low = (home_goals <= 1) & (away_goals <= 1)
+    if not low.any():
+        return 0.0
+    tau = _tau(
+        home_goals[low][:, None], away_goals[low][:, None],
+        expected_home[low][:, None], expected_away[low][:, None], RHO_GRID[None, :],
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_tau = np.where(tau > 0, np.log(tau), -np.inf)
+    likelihood = (weights[low][:, None] * log_tau).sum(axis=0)
+    return float(RHO_GRID[int(np.argmax(likelihood))])
+
+
+def _tau(x: np.ndarray, y: np.ndarray, lam: np.ndarray, mu: np.ndarray, rho: Any) -> np.ndarray:
+    """Dixon-Coles adjustment factor for scores x-y (1 outside the four low scores)."""
+    return np.select(
+        [(x == 0) & (y == 0), (x == 0) & (y == 1), (x == 1) & (y == 0), (x == 1) & (y == 1)],
+        [1 - lam * mu * rho, 1 + lam * rho, 1 + mu * rho, 1 - rho],
+        default=1.0,
+    )
+
+
+_LOG_FACTORIALS = np.array([math.lgamma(k + 1) for k in range(MAX_GOALS + 1)])
+
+
+def score_matrix(expected_home: np.ndarray, expected_away: np.ndarray, rho: float) -> np.ndarray:
+    """
+    Scoreline probabilities, shape (fixtures, MAX_GOALS + 1, MAX_GOALS + 1).
+
+    Entry [n, i, j] is P(home scores i, away scores j) for fixture n; each
+    matrix is renormalised to sum to 1 after truncation.
+    """
+    goals = np.arange(MAX_GOALS + 1)
+    home_pmf = np.exp(goals * np.log(expected_home)[:, None] - expected_home[:, None] - _LOG_FACTORIALS)
+    away_pmf = np.exp(goals * np.log(expected_away)[:, None] - expected_away[:, None] - _LOG_FACTORIALS)
+    matrix = home_pmf[:, :, None] * away_pmf[:, None, :]
+
+    matrix[:, 0, 0] *= 1 - expected_home * expected_away * rho
+    matrix[:, 0, 1] *= 1 + expected_home * rho
+    matrix[:, 1, 0] *= 1 + expected_away * rho
+    matrix[:, 1, 1] *= 1 - rho
+    np.clip(matrix, 0.0, None, out=matrix)
+    return matrix / matrix.sum(axis=(1, 2), keepdims=True)
+
+
+def market_probabilities(matrix: np.ndarray) -> Dict[str, np.ndarray]:
+    """1X2, over 2.5 goals and both-teams-to-score probabilities from score matrices."""
+    goals = np.arange(matrix.shape[1])
+    total_goals = goals[:, None] + goals[None, :]
+    return {
+        "home": np.tril(matrix, -1).sum(axis=(1, 2)),
+        "draw": np.trace(matrix, axis1=1, axis2=2),
+        "away": np.triu(matrix, 1).sum(axis=(1, 2)),
+        "over_2_5": matrix[:, total_goals > 2].sum(axis=1),
+        "btts": matrix[:, 1:, 1:].sum(axis=(1, 2)),
+    }
+
+
+def top_scorelines(matrix: np.ndarray, count: int = 5) -> List[Tuple[str, float]]:
+    """Most likely scorelines of one fixture's matrix as ("h-a", probability)."""
+    flat = np.argsort(matrix, axis=None)[::-1][:count]
+    size = matrix.shape[1]
+    return [(f"{i // size}-{i % size}", float(matrix.flat[i])) for i in flat]
@@ -0,0 +1,159 @@
+"""
+Football Intelligence Dashboard - Elo Service
+Incremental Elo ratings per team, carried across seasons.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.league import League
+from app.models.team_rating import TeamRating
+from app.repositories.match_repository import MatchRepository
+from app.repositories.team_rating_repository import TeamRatingRepository
+
+
+class EloService:
+    """
+    Applies finished matches to the team_ratings table in kickoff order.
+
+    Every applied match is flagged (Match.elo_applied), so `update()` only
+    reads and applies the unflagged ones: O(1) work per new result, never a
+    recomputation. A result recorded late (a suspended match finished, a
+    fixture corrected by a stale refresh) is applied when it arrives, after
+    later matches, as live Elo tables do; `rebuild()` replays everything in
+    kickoff order.
+    """
+
+    INITIAL_RATING = 1500.0
+    K_FACTOR = 20.0
+    HOME_ADVANTAGE = 65.0  # Rating points added to the home side's expectation
+    SEASON_REGRESSION = 0.2  # Share of the distance to INITIAL_RATING removed at a team's first match of a season
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.match_repo = MatchRepository(session)
+        self.rating_repo = TeamRatingRepository(session)
+
+    async def update(self, league_ids: Optional[Iterable[int]] = None) -> int:
+        """Apply the leagues' played matches not applied yet. Returns matches applied."""
+        if league_ids is None:
+            league_ids = (await self.session.execute(select(League.id))).scalars().all()
+
+        applied = 0
+        for league_id in league_ids:
+            applied += await self._update_league(league_id)
+        if applied:
+            logger.info(f"Elo ratings updated from {applied} matches")
+        return applied
+
+    async def rebuild(self) -> int:
+        """Drop every rating and replay all played matches. Returns matches applied."""
+        await self.rating_repo.delete_all()
+        await self.match_repo.reset_elo_applied()
+        applied = await self.update()
+        logger.info(f"Elo ratings rebuilt from {applied} matches")
+        return applied
+
+    async def _update_league(self, league_id: int) -> int:
+        pending = await self.match_repo.get_unrated(league_id)
+        if not pending:
+            return 0
+
+        # Claim the matches first: a concurrent updater that read the same ones
+        # finds them flagged and leaves them to us
+        claimed = await self.match_repo.claim_unrated(row[0] for row in pending)
+        pending = [row for row in pending if row[0] in claimed]
+        if not pending:
+            logger.debug(f"Elo ratings of league {league_id} are being updated elsewhere")
+            return 0
+
+        team_ids = {team_id for row in pending for team_id in (row[2], row[3])}
+        ratings: Dict[int, dict] = {
+            team_id: {
+                "team_id": team_id,
+                "rating": stored.rating,
+                "matches_played": stored.matches_played,
+                "last_match_date": stored.last_match_date,
+                "last_season_id": stored.last_season_id,
+            }
+            for team_id, stored in (await self.rating_repo.get_by_team_ids(team_ids)).items()
+        }
+        for team_id in team_ids - ratings.keys():
+            ratings[team_id] = {
+                "team_id": team_id,
+                "rating": self.INITIAL_RATING,
+                "matches_played": 0,
+                "last_match_date": None,
+                "last_season_id": None,
+            }
+
+        for _, season_id, home_id, away_id, home_goals, away_goals, match_date in pending:
+            self._apply(ratings[home_id], ratings[away_id], home_goals, away_goals, season_id, match_date)
+
+        await self.rating_repo.bulk_upsert(list(ratings.values()))
+        return len(pending)
+
+    def _apply(
+        self,
+        home: dict,
+        away: dict,
+        home_goals: int,
+        away_goals: int,
+        season_id: int,
+        match_date: datetime,
+    ) -> None:
+        """Update two rating rows in place with one result."""
+        # A late result must not move a side back to an earlier season (or
+        # its next match would regress the rating a second time)
+        latest = [
+            side for side in (home, away)
+            if side["last_match_date"] is None or match_date >= side["last_match_date"]
+        ]
+        for side in latest:
+            if side["last_season_id"] is not None and side["last_season_id"] != season_id:
+                side["rating"] -= (side["rating"] - self.INITIAL_RATING) * self.SEASON_REGRESSION
+
+        expected_home = self.expected_score(home["rating"], away["rating"])
+        actual_home = 1.0 if home_goals > away_goals else 0.5 if home_goals == away_goals else 0.0
+        delta = self.K_FACTOR * self._margin_multiplier(abs(home_goals - away_goals)) * (actual_home - expected_home)
+
+        home["rating"] += delta
+        away["rating"] -= delta
+        for side in (home, away):
+            side["matches_played"] += 1
+        for side in latest:
+            side["last_match_date"] = match_date
+            side["last_season_id"] = season_id
+
+    @classmethod
+    def expected_score(cls, home_rating: float, away_rating: float) -> float:
+        """Home side's expected score (win = 1, draw = 0.5) including home advantage."""
+        return 1.0 / (1.0 + 10 ** ((away_rating - home_rating - cls.HOME_ADVANTAGE) / 400.0))
+
+    @staticmethod
+    def _margin_multiplier(goal_difference: int) -> float:
+        """World Football Elo goal-difference weighting."""
+        if goal_difference <= 1:
+            return 1.0
+        if goal_difference == 2:
+            return 1.5
+        return (11 + goal_difference) / 8
+
+    @classmethod
+    def prediction_inputs(
+        cls, ratings: Dict[int, TeamRating], home_team_id: int, away_team_id: int
+    ) -> Dict[str, Optional[float]]:
+        """Elo fields stored in a prediction's model_inputs."""
+        home = ratings.get(home_team_id)
+        away = ratings.get(away_team_id)
+        return {
+            "home_elo": round(home.rating, 1) if home else None,
+            "away_elo": round(away.rating, 1) if away else None,
+            "elo_home_expectancy": (
+                round(cls.expected_score(home.rating, away.rating), 4) if home and away else None
+            ),
+        }
@@ -0,0 +1,158 @@
+"""
+Football Intelligence Dashboard - Head-to-Head Service
+Maintains the head_to_head table from our own matches table.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.integrations.football_api import APIFootballClient, api_football_client
+from app.models.head_to_head import HeadToHead
+from app.repositories.head_to_head_repository import HeadToHeadRepository, Pair, canonical_pair
+from app.repositories.match_repository import MatchRepository
+from app.repositories.team_repository import TeamRepository
+
+
+class HeadToHeadService:
+    """
+    Keeps one aggregate record per team pair.
+
+    Pairs are recomputed from the matches table when one of their matches
+    finishes (`refresh_pairs`), so no API call is needed. The API is only
+    asked about pairs that have no local history at all, and only by the
+    sync job (`fetch_missing`): read paths never call it.
+    """
+
+    # Encounters kept in `last_matches`
+    LAST_MATCHES = 10
+
+    def __init__(self, session: AsyncSession, client: Optional[APIFootballClient] = None):
+        self.session = session
+        self.client = client or api_football_client
+        self.h2h_repo = HeadToHeadRepository(session)
+        self.match_repo = MatchRepository(session)
+        self.team_repo = TeamRepository(session)
+
+    async def refresh_pairs(self, pairs: Iterable[Pair]) -> int:
+        """Recompute the records of the given team pairs (any order) from local matches."""
+        pairs = {canonical_pair(*pair) for pair in pairs if pair[0] != pair[1]}
+        if not pairs:
+            return 0
+
+        results: Dict[Pair, List[dict]] = {}
+        for row in await self.match_repo.get_pair_results(pairs):
+            results.setdefault((row["team1_id"], row["team2_id"]), []).append(row)
+
+        rows = [
+            {**self._aggregate(pair, pair_results), "source": "local"}
+            for pair, pair_results in results.items()
+        ]
+        if rows:
+            await self.h2h_repo.bulk_upsert(rows)
+        return len(rows)
+
+    async def rebuild(self) -> int:
+        """Recompute every pair that has a finished match."""
+        pairs = await self.match_repo.get_finished_pairs()
+        refreshed = await self.refresh_pairs(pairs)
+        logger.info(f"Head-to-head rebuilt for {refreshed} team pairs")
+        return refreshed
+
+    async def get(self, team_a_id: int, team_b_id: int) -> Optional[HeadToHead]:
+        """
+        The record for two teams, computed from local matches if it has none yet.
+
+        Pairs without local history stay None until the sync job fetches
+        them (`fetch_missing`).
+        """
+        record = await self.h2h_repo.get_pair(team_a_id, team_b_id)
+        if record is not None:
+            return record
+        if await self.refresh_pairs([(team_a_id, team_b_id)]):
+            return await self.h2h_repo.get_pair(team_a_id, team_b_id)
+        return None
+
+    async def fetch_missing(self, pairs: Iterable[Pair]) -> int:
+        """
+        Create the records the given pairs lack. Returns pairs fetched from the API.
+
+        Pairs with local history are computed from it; the rest are fetched
+        from the API and stored, so the API is asked at most once per pair.
+        """
+        pairs = {canonical_pair(*pair) for pair in pairs if pair[0] != pair[1]}
+        missing = pairs - (await self.h2h_repo.get_pairs(pairs)).keys()
+        if missing and await self.refresh_pairs(missing):
+            missing -= (await self.h2h_repo.get_pairs(missing)).keys()
+        for pair in sorted(missing):
+            await self._fetch_from_api(*pair)
+        return len(missing)
+
+    async def _fetch_from_api(self, team_a_id: int, team_b_id: int) -> None:
+        """Store the API's head-to-head for a pair with no local history."""
+        team_a = await self.team_repo.get_by_id(team_a_id)
+        team_b = await self.team_repo.get_by_id(team_b_id)
+        if not team_a or not team_b:
+            return
+        local_ids = {team_a.api_football_id: team_a.id, team_b.api_football_id: team_b.id}
+
+        pair_results = []
+        for fixture_data in await self.client.get_head_to_head(
+            team_a.api_football_id, team_b.api_football_id, last=self.LAST_MATCHES
+        ):
+            teams = fixture_data.get("teams", {})
+            goals = fixture_data.get("goals", {})
+            home_id = local_ids.get(teams.get("home", {}).get("id"))
+            away_id = local_ids.get(teams.get("away", {}).get("id"))
+            if not home_id or not away_id or goals.get("home") is None or goals.get("away") is None:
+                continue
+            pair_results.append({
+                "match_id": None,
+                "home_team_id": home_id,
+                "away_team_id": away_id,
+                "home_score": goals["home"],
+                "away_score": goals["away"],
+                "match_date": datetime.fromisoformat(fixture_data["fixture"]["date"]),
+            })
+        pair_results.sort(key=lambda row: row["match_date"], reverse=True)
+
+        # Stored even when empty so the pair isn't fetched again
+        pair = canonical_pair(team_a_id, team_b_id)
+        await self.h2h_repo.bulk_upsert([{**self._aggregate(pair, pair_results), "source": "api"}])
+
+    @classmethod
+    def _aggregate(cls, pair: Pair, pair_results: List[dict]) -> dict:
+        """Record columns for a pair from its results, newest first."""
+        team1_id, team2_id = pair
+        record = {
+            "team1_id": team1_id,
+            "team2_id": team2_id,
+            "total_matches": len(pair_results),
+            "team1_wins": 0,
+            "team2_wins": 0,
+            "draws": 0,
+            "total_goals": 0,
+            "last_match_date": pair_results[0]["match_date"] if pair_results else None,
+            "last_matches": [
+                {
+                    "match_id": row["match_id"],
+                    "date": row["match_date"].isoformat(),
+                    "home_team_id": row["home_team_id"],
+                    "away_team_id": row["away_team_id"],
+                    "home_score": row["home_score"],
+                    "away_score": row["away_score"],
+                }
+                for row in pair_results[:cls.LAST_MATCHES]
+            ],
+        }
+        for row in pair_results:
+            record["total_goals"] += row["home_score"] + row["away_score"]
+            if row["home_score"] == row["away_score"]:
+                record["draws"] += 1
+            elif (row["home_score"] > row["away_score"]) == (row["home_team_id"] == team1_id):
+                record["team1_wins"] += 1
+            else:
+                record["team2_wins"] += 1
+        return record
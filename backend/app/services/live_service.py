@@ -0,0 +1,155 @@
+"""
+Football Intelligence Dashboard - Live Service
+Lightweight in-play poller that writes only changed scores/statuses.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Set, Tuple
+
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import LEAGUES_CONFIG, get_settings
+from app.integrations.football_api import api_football_client
+from app.integrations.rate_limiter import PRIORITY_LIVE
+from app.models.match import FINAL_STATUSES, Match
+from app.models.season import Season
+from app.repositories.match_repository import MatchRepository
+from app.services.elo_service import EloService
+from app.services.head_to_head_service import HeadToHeadService
+from app.services.match_events import publish_match_events
+from app.services.prediction_service import PredictionService
+from app.services.team_feature_service import TeamFeatureService
+
+settings = get_settings()
+
+
+class LiveService:
+    """Polls the API-Football live feed and diffs it against stored matches."""
+
+    # Columns compared against the live feed
+    TRACKED_FIELDS = ("status", "home_score", "away_score", "home_ht_score", "away_ht_score")
+
+    # NS matches whose kickoff passed this long ago still count as "about to go live"
+    KICKED_OFF_WITHIN = timedelta(hours=3)
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.match_repo = MatchRepository(session)
+        self.h2h_service = HeadToHeadService(session)
+        self.elo_service = EloService(session)
+        self.feature_service = TeamFeatureService(session)
+
+    async def should_poll(self) -> bool:
+        """Poll only while matches are live or a kickoff is near."""
+        return await self.match_repo.has_live_or_imminent(
+            lead=timedelta(minutes=settings.LIVE_POLL_KICKOFF_LEAD_MINUTES),
+            kicked_off_within=self.KICKED_OFF_WITHIN,
+        )
+
+    async def poll(self) -> dict:
+        """Fetch the live feed, write changed matches and publish change events."""
+        if not await self.should_poll():
+            return {"skipped": True}
+
+        league_ids = [league_cfg["api_football_id"] for league_cfg in LEAGUES_CONFIG]
+        feed = {
+            fixture_data.get("fixture", {}).get("id"): self._live_state(fixture_data)
+            for fixture_data in await api_football_client.get_live_fixtures(league_ids)
+        }
+
+        stored = await self.match_repo.get_live_candidates(feed.keys())
+
+        # Matches live in our DB that left the feed have finished (or were interrupted)
+        missing = [m for m in stored if m.is_live and m.api_football_id not in feed]
+        if missing:
+            with api_football_client.priority(PRIORITY_LIVE), api_football_client.bypass_cache():
+                for fixture_data in await api_football_client.get_fixtures_by_ids(
+                    [m.api_football_id for m in missing]
+                ):
+                    feed[fixture_data.get("fixture", {}).get("id")] = self._live_state(fixture_data)
+
+        changed_rows: List[dict] = []
+        events: List[dict] = []
+        finished_pairs: List[Tuple[int, int]] = []
+        finished_seasons: Set[int] = set()
+        for match in stored:
+            state = feed.get(match.api_football_id)
+            if state is None:
+                continue
+            diff = {
+                field: state[field]
+                for field in self.TRACKED_FIELDS
+                if getattr(match, field) != state[field]
+            }
+            if not diff:
+                continue
+            changed_rows.append({"id": match.id, **diff})
+            events.append(self._event(match, diff))
+            if diff.get("status") in FINAL_STATUSES:
+                finished_pairs.append((match.home_team_id, match.away_team_id))
+                finished_seasons.add(match.season_id)
+
+        await self.match_repo.bulk_update(changed_rows)
+        await self.h2h_service.refresh_pairs(finished_pairs)
+        await self.session.commit()
+        published = await publish_match_events(events)
+
+        result = {
+            "live": len(feed),
+            "updated": len(changed_rows),
+            "events": published,
+            # Left to `apply_results` in its own task, so the poll stays cheap
+            "finished_seasons": sorted(finished_seasons),
+        }
+        if changed_rows:
+            logger.info(f"Live poll: {result}")
+        return result
+
+    async def apply_results(self, season_ids: Iterable[int]) -> dict:
+        """
+        Fold the seasons' new results into team features, Elo and predictions.
+
+        Queued by the poller once a match finishes. Nothing is lost if it
+        never runs: applied matches are flagged, so the next sync catches up.
+        """
+        season_ids = set(season_ids)
+        league_ids = (await self.session.execute(
+            select(Season.league_id).where(Season.id.in_(season_ids)).distinct()
+        )).scalars().all()
+        result = {
+            "features_applied": await self.feature_service.update(season_ids),
+            "elo_applied": await self.elo_service.update(league_ids),
+            "predictions_written": await PredictionService(self.session).refresh_seasons(season_ids),
+        }
+        await self.session.commit()
+        logger.info(f"Results of seasons {sorted(season_ids)} applied: {result}")
+        return result
+
+    @staticmethod
+    def _live_state(fixture_data: Dict) -> dict:
+        """Score/status fields of an API-Football fixture."""
+        goals = fixture_data.get("goals", {})
+        ht = (fixture_data.get("score") or {}).get("halftime") or {}
+        return {
+            "status": fixture_data.get("fixture", {}).get("status", {}).get("short", "NS"),
+            "home_score": goals.get("home"),
+            "away_score": goals.get("away"),
+            "home_ht_score": ht.get("home"),
+            "away_ht_score": ht.get("away"),
+        }
+
+    @staticmethod
+    def _event(match: Match, diff: dict) -> dict:
+        return {
+            "type": "match_updated",
+            "match_id": match.id,
+            "api_football_id": match.api_football_id,
+            "season_id": match.season_id,
+            "changes": {
+                field: {"old": getattr(match, field), "new": value}
+                for field, value in diff.items()
+            },
+            "at": datetime.now(timezone.utc).isoformat(),
+        }
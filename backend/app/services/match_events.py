@@ -0,0 +1,30 @@
+"""
+Football Intelligence Dashboard - Match Events
+Publishes match change events on Redis pub/sub.
+"""
+
+import json
+from typing import List
+
+import redis.asyncio as aioredis
+from loguru import logger
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+async def publish_match_events(events: List[dict]) -> int:
+    """Publish events to MATCH_EVENTS_CHANNEL. Returns how many were published."""
+    if not events:
+        return 0
+    try:
+        async with aioredis.from_url(settings.REDIS_URL) as redis:
+            async with redis.pipeline(transaction=False) as pipe:
+                for event in events:
+                    pipe.publish(settings.MATCH_EVENTS_CHANNEL, json.dumps(event, default=str))
+                await pipe.execute()
+        return len(events)
+    except Exception as e:
+        logger.warning(f"Could not publish {len(events)} match events: {e}")
+        return 0
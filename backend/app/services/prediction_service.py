@@ -3,20 +3,85 @@ Football Intelligence Dashboard - Prediction Service
 Statistical model for match outcome prediction.
 """
 
-from typing import Dict, List, Optional, Tuple
-
+import asyncio
+import hashlib
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import orjson
 from loguru import logger
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
+from app.core.process_pool import process_pool
+from app.models.head_to_head import HeadToHead
 from app.models.match import Match
 from app.models.prediction import Prediction
+from app.models.season import Season
 from app.models.standing import Standing
+from app.models.team_feature import TeamFeature
+from app.repositories.head_to_head_repository import canonical_pair
 from app.repositories.match_repository import MatchRepository
+from app.repositories.prediction_repository import PredictionRepository
 from app.repositories.standing_repository import StandingRepository
+from app.repositories.team_feature_repository import TeamFeatureRepository
+from app.repositories.team_rating_repository import TeamRatingRepository
+from app.services import dixon_coles, prediction_engine
+from app.services.elo_service import EloService
+from app.services.head_to_head_service import HeadToHeadService
+from app.services.season_cache import dixon_coles_cache
+from app.services.team_feature_service import TeamFeatureService
+
+settings = get_settings()
+
+MODEL_BAYESIAN = "v1.0-bayesian"
+MODEL_DIXON_COLES = "v2.0-dixon-coles"
+MODEL_VERSIONS = (MODEL_BAYESIAN, MODEL_DIXON_COLES)
+
+
+@dataclass
+class RatingFit:
+    """A season's pending Dixon-Coles fit: its results, their fingerprint and the warm start."""
+
+    fingerprint: str
+    results: List[dixon_coles.Result]
+    init: Optional[dixon_coles.Ratings] = None
+
+
+@dataclass
+class ScoringBatch:
+    """
+    The inputs for scoring one season's fixtures, loaded on the event loop.
+
+    Only plain values and arrays, so a batch pickles into a scoring process.
+    """
+
+    model_version: str
+    season_id: int
+    match_ids: List[int]
+    home_team_ids: List[int]
+    away_team_ids: List[int]
+    context: List[dict]  # model_inputs that need no scoring, per match
+    # v1.0
+    weights: Optional[Dict[str, float]] = None
+    home: Optional[prediction_engine.TeamArrays] = None
+    away: Optional[prediction_engine.TeamArrays] = None
+    h2h: Optional[prediction_engine.HeadToHeadArrays] = None
+    # v2.0: cached ratings, or the fit to run first
+    ratings: Optional[dixon_coles.Ratings] = None
+    fit: Optional[RatingFit] = None
 
 
 class PredictionService:
-    """Bayesian-weighted statistical prediction engine."""
+    """
+    Statistical prediction engine.
+
+    `model_version` selects the model: the Bayesian-weighted factor score
+    (v1.0) or the Dixon-Coles scoreline model (v2.0).
+    """
 
     # Weight factors for the prediction model
     WEIGHTS = {
@@ -31,13 +96,24 @@ class PredictionService:
         "momentum": 0.05,     # Season momentum
     }
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, model_version: Optional[str] = None):
+        model_version = model_version or settings.PREDICTION_MODEL_VERSION
+        if model_version not in MODEL_VERSIONS:
+            raise ValueError(f"Unknown prediction model version: {model_version}")
         self.session = session
+        self.model_version = model_version
         self.match_repo = MatchRepository(session)
         self.standing_repo = StandingRepository(session)
+        self.prediction_repo = PredictionRepository(session)
+        self.rating_repo = TeamRatingRepository(session)
+        self.feature_repo = TeamFeatureRepository(session)
+        self.h2h_service = HeadToHeadService(session)
 
     async def predict_match(self, match: Match) -> Prediction:
         """Generate a prediction for a match."""
+        if self.model_version == MODEL_DIXON_COLES:
+            return Prediction(**(await self.predict_many([match]))[0])
+
         home_team_id = match.home_team_id
         away_team_id = match.away_team_id
         season_id = match.season_id
@@ -46,8 +122,9 @@ class PredictionService:
         home_standing = await self.standing_repo.get_team_standing(season_id, home_team_id)
         away_standing = await self.standing_repo.get_team_standing(season_id, away_team_id)
 
-        home_matches = await self.match_repo.get_team_matches(home_team_id, limit=10)
-        away_matches = await self.match_repo.get_team_matches(away_team_id, limit=10)
+        features = await self.feature_repo.get_by_keys([(season_id, home_team_id), (season_id, away_team_id)])
+        h2h = await self.h2h_service.get(home_team_id, away_team_id)
+        elo_ratings = await self.rating_repo.get_by_team_ids([home_team_id, away_team_id])
 
         # Calculate component scores
         home_score = 0.5  # Base probability
@@ -85,6 +162,20 @@ class PredictionService:
             home_score += pts_factor * self.WEIGHTS["form_10"]
             away_score -= pts_factor * self.WEIGHTS["form_10"]
 
+        # 6. Expected goals factor (rolling window of the team features)
+        home_xg_diff = self._xg_diff(features.get((season_id, home_team_id)))
+        away_xg_diff = self._xg_diff(features.get((season_id, away_team_id)))
+        if home_xg_diff is not None and away_xg_diff is not None:
+            xg_factor = max(-0.2, min(0.2, (home_xg_diff - away_xg_diff) * 0.1))
+            home_score += xg_factor * self.WEIGHTS["xg"]
+            away_score -= xg_factor * self.WEIGHTS["xg"]
+
+        # 7. Head-to-head factor
+        if h2h and h2h.total_matches:
+            h2h_factor = self._h2h_factor(h2h, home_team_id)
+            home_score += h2h_factor * self.WEIGHTS["h2h"]
+            away_score -= h2h_factor * self.WEIGHTS["h2h"]
+
         # Normalize to probabilities
         home_prob, draw_prob, away_prob = self._normalize_probabilities(
             home_score, away_score
@@ -94,37 +185,339 @@ class PredictionService:
         over_2_5 = self._calc_over_2_5(home_standing, away_standing)
         btts = self._calc_btts(home_standing, away_standing)
 
-        # Build model inputs for transparency
         model_inputs = {
+            **self._model_inputs(match, home_standing, away_standing, home_xg_diff, away_xg_diff, h2h),
+            "raw_home_score": round(home_score, 4),
+            "raw_away_score": round(away_score, 4),
+            **EloService.prediction_inputs(elo_ratings, home_team_id, away_team_id),
+            **TeamFeatureService.prediction_inputs(features, match),
+        }
+        return Prediction(
+            **self._prediction_values(match.id, home_prob, draw_prob, away_prob, over_2_5, btts, model_inputs)
+        )
+
+    async def predict_many(self, matches: List[Match]) -> List[dict]:
+        """
+        Predict many matches at once.
+
+        Inputs are loaded in bulk on the event loop (see `_scoring_batches`),
+        then every season's batch is scored by `score_batch` in the scoring
+        process pool, one concurrent task per season and so per league.
+        Returns Prediction column values per match, equal to what
+        `predict_match` produces.
+        """
+        if not matches:
+            return []
+        batches = await self._scoring_batches(matches)
+        scored = await asyncio.gather(*(process_pool.run(score_batch, batch) for batch in batches))
+
+        rows: Dict[int, dict] = {}
+        for batch, (batch_rows, fitted) in zip(batches, scored):
+            if fitted is not None:
+                await self._cache_ratings(batch.season_id, batch.fit.fingerprint, fitted)
+            rows.update((row["match_id"], row) for row in batch_rows)
+        return [rows[match.id] for match in matches]
+
+    async def _scoring_batches(self, matches: List[Match]) -> List[ScoringBatch]:
+        """
+        The matches' model inputs as one batch per season.
+
+        Standings, team features, ratings and head-to-head records are read
+        in bulk, and the model_inputs that need no scoring are resolved here.
+        """
+        by_season: Dict[int, List[Match]] = {}
+        for match in matches:
+            by_season.setdefault(match.season_id, []).append(match)
+
+        keys = sorted({(m.season_id, t) for m in matches for t in (m.home_team_id, m.away_team_id)})
+        features = await self.feature_repo.get_by_keys(keys)
+        elo_ratings = await self.rating_repo.get_by_team_ids(key[1] for key in keys)
+
+        if self.model_version == MODEL_DIXON_COLES:
+            ratings, fits = await self._rating_inputs(by_season)
+        else:
+            standings: Dict[Tuple[int, int], Standing] = {}
+            for season_id in by_season:
+                for standing in await self.standing_repo.get_by_season(season_id):
+                    standings[(season_id, standing.team_id)] = standing
+            xg_diffs = {key: self._xg_diff(features.get(key)) for key in keys}
+            h2h_records = await self._get_h2h_records(matches)
+
+        batches = []
+        for season_id, season_matches in by_season.items():
+            batch = ScoringBatch(
+                model_version=self.model_version,
+                season_id=season_id,
+                match_ids=[m.id for m in season_matches],
+                home_team_ids=[m.home_team_id for m in season_matches],
+                away_team_ids=[m.away_team_id for m in season_matches],
+                context=[
+                    {
+                        **EloService.prediction_inputs(elo_ratings, m.home_team_id, m.away_team_id),
+                        **TeamFeatureService.prediction_inputs(features, m),
+                    }
+                    for m in season_matches
+                ],
+            )
+            if self.model_version == MODEL_DIXON_COLES:
+                batch.ratings = ratings.get(season_id)
+                batch.fit = fits.get(season_id)
+                batches.append(batch)
+                continue
+
+            home_keys = [(season_id, m.home_team_id) for m in season_matches]
+            away_keys = [(season_id, m.away_team_id) for m in season_matches]
+            h2h_list = [h2h_records.get(canonical_pair(m.home_team_id, m.away_team_id)) for m in season_matches]
+            batch.weights = dict(self.WEIGHTS)
+            batch.home = self._team_arrays([standings.get(k) for k in home_keys], [xg_diffs[k] for k in home_keys])
+            batch.away = self._team_arrays([standings.get(k) for k in away_keys], [xg_diffs[k] for k in away_keys])
+            batch.h2h = prediction_engine.HeadToHeadArrays(
+                total=np.array([r.total_matches if r else 0 for r in h2h_list]),
+                home_wins=np.array([
+                    self._h2h_wins(r, m.home_team_id) if r else 0 for r, m in zip(h2h_list, season_matches)
+                ]),
+                away_wins=np.array([
+                    self._h2h_wins(r, m.away_team_id) if r else 0 for r, m in zip(h2h_list, season_matches)
+                ]),
+            )
+            batch.context = [
+                {
+                    **self._model_inputs(
+                        match, standings.get(home_key), standings.get(away_key),
+                        xg_diffs[home_key], xg_diffs[away_key], h2h,
+                    ),
+                    **context,
+                }
+                for match, home_key, away_key, h2h, context in zip(
+                    season_matches, home_keys, away_keys, h2h_list, batch.context
+                )
+            ]
+            batches.append(batch)
+        return batches
+
+    async def outcome_distributions(
+        self, matches: List[Match]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Scoreline distributions for simulation: (cell home goals, cell away goals, probabilities).
+
+        The Dixon-Coles model yields its full scoreline matrix per match; the
+        v1 model only has 1X2 probabilities, placed on 1-0 / 0-0 / 0-1.
+        """
+        if self.model_version == MODEL_DIXON_COLES:
+            ratings = await self.get_ratings({m.season_id for m in matches})
+            probs = np.zeros((len(matches), (dixon_coles.MAX_GOALS + 1) ** 2))
+            for season_id, season_ratings in ratings.items():
+                positions = [i for i, m in enumerate(matches) if m.season_id == season_id]
+                if not positions:
+                    continue
+                expected_home, expected_away = season_ratings.expected_goals(
+                    [matches[i].home_team_id for i in positions], [matches[i].away_team_id for i in positions]
+                )
+                matrices = dixon_coles.score_matrix(expected_home, expected_away, season_ratings.rho)
+                probs[positions] = matrices.reshape(len(positions), -1)
+            goals = np.arange(dixon_coles.MAX_GOALS + 1)
+            return np.repeat(goals, len(goals)), np.tile(goals, len(goals)), probs
+
+        rows = await self.predict_many(matches)
+        probs = np.array(
+            [[row["home_win_prob"], row["draw_prob"], row["away_win_prob"]] for row in rows], dtype=float
+        ).reshape(len(rows), 3)
+        return np.array([1, 0, 0]), np.array([0, 0, 1]), probs
+
+    async def refresh_season(self, season_id: int) -> int:
+        """
+        Bring the predictions of a season's upcoming matches up to date. Returns rows written.
+
+        The season is predicted in one batch and each row's inputs_hash
+        compared with the stored one: only fixtures whose inputs (standings,
+        team features, ratings, head-to-head) or model version changed are
+        written, and unaffected predictions are left untouched.
+        """
+        return await self.refresh_seasons([season_id])
+
+    async def refresh_seasons(self, season_ids: Iterable[int]) -> int:
+        """
+        `refresh_season` for several seasons. Returns rows written.
+
+        The seasons are predicted together, so their batches score in
+        parallel processes; the writes then happen here on the event loop.
+        """
+        upcoming = {
+            season_id: await self.match_repo.get_upcoming_prediction_hashes(season_id)
+            for season_id in sorted(set(season_ids))
+        }
+        rows = iter(await self.predict_many([match for pairs in upcoming.values() for match, _ in pairs]))
+
+        written = 0
+        for season_id, pairs in upcoming.items():
+            changed = []
+            for _, stored_hash in pairs:
+                row = next(rows)
+                row["inputs_hash"] = self._inputs_hash(row)
+                if row["inputs_hash"] != stored_hash:
+                    changed.append(row)
+            await self.prediction_repo.bulk_upsert(changed)
+            if changed:
+                logger.info(f"Season {season_id}: {len(changed)} of {len(pairs)} predictions refreshed")
+            written += len(changed)
+        return written
+
+    async def refresh_current(self) -> int:
+        """`refresh_season` for every current season. Returns rows written."""
+        season_ids = (await self.session.execute(
+            select(Season.id).where(Season.is_current == True)
+        )).scalars().all()
+        return await self.refresh_seasons(season_ids)
+
+    async def get_ratings(self, season_ids: Iterable[int]) -> Dict[int, dixon_coles.Ratings]:
+        """
+        Dixon-Coles ratings per season.
+
+        Cached ratings are reused while the season's results are unchanged;
+        otherwise the season is refitted in the scoring process pool,
+        warm-started from the cached ratings.
+        """
+        ratings, fits = await self._rating_inputs(season_ids)
+        fitted = await asyncio.gather(*(process_pool.run(fit_ratings, fit) for fit in fits.values()))
+        for (season_id, fit), season_ratings in zip(fits.items(), fitted):
+            await self._cache_ratings(season_id, fit.fingerprint, season_ratings)
+            ratings[season_id] = season_ratings
+        return ratings
+
+    async def _rating_inputs(
+        self, season_ids: Iterable[int]
+    ) -> Tuple[Dict[int, dixon_coles.Ratings], Dict[int, RatingFit]]:
+        """Cached ratings still matching their season's results, and the fits the other seasons need."""
+        results = await self.match_repo.get_season_results(season_ids)
+        ratings: Dict[int, dixon_coles.Ratings] = {}
+        fits: Dict[int, RatingFit] = {}
+        for season_id, season_results in results.items():
+            fingerprint = self._results_fingerprint(season_results)
+            cached = await dixon_coles_cache.get(season_id)
+            if cached is not None and cached[0] == fingerprint:
+                ratings[season_id] = dixon_coles.Ratings.from_dict(cached[1])
+            else:
+                fits[season_id] = RatingFit(
+                    fingerprint=fingerprint,
+                    results=season_results,
+                    init=dixon_coles.Ratings.from_dict(cached[1]) if cached is not None else None,
+                )
+        return ratings, fits
+
+    async def _cache_ratings(self, season_id: int, fingerprint: str, ratings: dixon_coles.Ratings) -> None:
+        await dixon_coles_cache.set(season_id, fingerprint, ratings.to_dict())
+        logger.debug(
+            f"Dixon-Coles ratings fitted for season {season_id}: "
+            f"{ratings.matches} results, {ratings.iterations} iterations"
+        )
+
+    @staticmethod
+    def _inputs_hash(row: dict) -> str:
+        """Digest of a prediction row's values other than the match id."""
+        values = {column: value for column, value in row.items() if column not in ("match_id", "inputs_hash")}
+        return hashlib.sha1(orjson.dumps(values, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    @staticmethod
+    def _results_fingerprint(results: List[tuple]) -> str:
+        """Digest of a season's results and the fit settings."""
+        digest = hashlib.sha1(orjson.dumps([settings.DIXON_COLES_DECAY_PER_DAY, results]))
+        return digest.hexdigest()
+
+    async def _get_h2h_records(self, matches: List[Match]) -> Dict[Tuple[int, int], HeadToHead]:
+        """Head-to-head records for the matches' pairs, completed like `HeadToHeadService.get` (no API calls)."""
+        pairs = {canonical_pair(m.home_team_id, m.away_team_id) for m in matches}
+        records = await self.h2h_service.h2h_repo.get_pairs(pairs)
+        missing = pairs - records.keys()
+        if missing and await self.h2h_service.refresh_pairs(missing):
+            records.update(await self.h2h_service.h2h_repo.get_pairs(missing))
+        return records
+
+    @classmethod
+    def _team_arrays(
+        cls, standings: List[Optional[Standing]], xg_diffs: List[Optional[float]]
+    ) -> prediction_engine.TeamArrays:
+        """
+        Engine inputs for a list of team sides (standing may be missing).
+
+        Anything with Standing's attributes works, e.g. the backtest's in-memory tables.
+        """
+        def column(attr: str) -> np.ndarray:
+            return np.array([getattr(s, attr) if s else 0 for s in standings])
+
+        return prediction_engine.TeamArrays(
+            has_standing=np.array([s is not None for s in standings], dtype=bool),
+            position=column("position"),
+            points=column("points"),
+            played=column("played"),
+            goals_for=column("goals_for"),
+            goals_against=column("goals_against"),
+            goal_difference=column("goal_difference"),
+            home_won=column("home_won"),
+            home_played=column("home_played"),
+            away_won=column("away_won"),
+            away_played=column("away_played"),
+            has_form=np.array([bool(s and s.form) for s in standings], dtype=bool),
+            form_score=np.array([cls._form_score(s.form[-5:]) if s and s.form else 0.0 for s in standings], dtype=float),
+            has_xg=np.array([x is not None for x in xg_diffs], dtype=bool),
+            xg_diff=np.array([x if x is not None else 0.0 for x in xg_diffs], dtype=float),
+        )
+
+    def _model_inputs(
+        self,
+        match: Match,
+        home_standing: Optional[Standing],
+        away_standing: Optional[Standing],
+        home_xg_diff: Optional[float],
+        away_xg_diff: Optional[float],
+        h2h: Optional[HeadToHead],
+    ) -> dict:
+        """Model inputs stored with a prediction for transparency (the raw scores are added by the caller)."""
+        return {
             "home_position": home_standing.position if home_standing else None,
             "away_position": away_standing.position if away_standing else None,
             "home_form": home_standing.form if home_standing else None,
             "away_form": away_standing.form if away_standing else None,
             "home_points": home_standing.points if home_standing else None,
             "away_points": away_standing.points if away_standing else None,
-            "raw_home_score": round(home_score, 4),
-            "raw_away_score": round(away_score, 4),
+            "home_xg_diff": round(home_xg_diff, 4) if home_xg_diff is not None else None,
+            "away_xg_diff": round(away_xg_diff, 4) if away_xg_diff is not None else None,
+            "h2h_matches": h2h.total_matches if h2h else 0,
+            "h2h_home_wins": self._h2h_wins(h2h, match.home_team_id) if h2h else 0,
+            "h2h_away_wins": self._h2h_wins(h2h, match.away_team_id) if h2h else 0,
+            "h2h_draws": h2h.draws if h2h else 0,
         }
 
-        prediction = Prediction(
-            match_id=match.id,
-            home_win_prob=round(home_prob, 4),
-            draw_prob=round(draw_prob, 4),
-            away_win_prob=round(away_prob, 4),
-            over_2_5_prob=round(over_2_5, 4) if over_2_5 else None,
-            btts_prob=round(btts, 4) if btts else None,
-            model_inputs=model_inputs,
-            model_version="v1.0-bayesian",
-        )
-
-        return prediction
+    @staticmethod
+    def _prediction_values(
+        match_id: int,
+        home_prob: float,
+        draw_prob: float,
+        away_prob: float,
+        over_2_5: Optional[float],
+        btts: Optional[float],
+        model_inputs: dict,
+        model_version: str = MODEL_BAYESIAN,
+    ) -> dict:
+        """Prediction column values, probabilities rounded for storage."""
+        return {
+            "match_id": match_id,
+            "home_win_prob": round(home_prob, 4),
+            "draw_prob": round(draw_prob, 4),
+            "away_win_prob": round(away_prob, 4),
+            "over_2_5_prob": round(over_2_5, 4) if over_2_5 else None,
+            "btts_prob": round(btts, 4) if btts else None,
+            "model_inputs": model_inputs,
+            "model_version": model_version,
+        }
 
     def _position_factor(self, home_pos: int, away_pos: int) -> float:
         """Position-based advantage. Returns -0.3 to 0.3."""
         diff = away_pos - home_pos  # positive = home is better
         return max(-0.3, min(0.3, diff * 0.015))
 
-    def _form_score(self, form: str) -> float:
+    @staticmethod
+    def _form_score(form: str) -> float:
         """Convert form string to score. W=1, D=0.3, L=-0.2. Returns -0.2 to 0.3."""
         scores = {"W": 1.0, "D": 0.3, "L": -0.2}
         if not form:
@@ -153,6 +546,20 @@ class PredictionService:
         diff = home_pts - away_pts
         return max(-0.2, min(0.2, diff * 0.005))
 
+    def _xg_diff(self, feature: Optional[TeamFeature]) -> Optional[float]:
+        """Average xG for minus xG against over the team's rolling window (None without xG)."""
+        return feature.xg_diff if feature else None
+
+    def _h2h_wins(self, h2h: HeadToHead, team_id: int) -> int:
+        """Wins of `team_id` in a canonical head-to-head record."""
+        return h2h.team1_wins if h2h.team1_id == team_id else h2h.team2_wins
+
+    def _h2h_factor(self, h2h: HeadToHead, home_team_id: int) -> float:
+        """Head-to-head advantage of the home side. Returns -0.2 to 0.2."""
+        away_team_id = h2h.team2_id if h2h.team1_id == home_team_id else h2h.team1_id
+        diff = self._h2h_wins(h2h, home_team_id) - self._h2h_wins(h2h, away_team_id)
+        return max(-0.2, min(0.2, diff / h2h.total_matches * 0.2))
+
     def _normalize_probabilities(
         self, home_score: float, away_score: float
     ) -> Tuple[float, float, float]:
@@ -200,3 +607,83 @@ class PredictionService:
 
         prob = (min(home_scores, away_concedes) + min(away_scores, home_concedes)) / 4
         return min(0.9, max(0.1, prob + 0.3))
+
+
+def score_batch(batch: ScoringBatch) -> Tuple[List[dict], Optional[dixon_coles.Ratings]]:
+    """
+    Prediction column values for a batch, in match order.
+
+    Runs in the scoring process pool. Also returns the Dixon-Coles ratings
+    when the batch had to fit them, for the caller to cache.
+    """
+    if batch.model_version == MODEL_DIXON_COLES:
+        return _score_dixon_coles(batch)
+
+    out = prediction_engine.predict(batch.home, batch.away, batch.h2h, batch.weights)
+    rows = []
+    for i, match_id in enumerate(batch.match_ids):
+        over_2_5 = float(out["over_2_5_prob"][i])
+        btts = float(out["btts_prob"][i])
+        model_inputs = {
+            **batch.context[i],
+            "raw_home_score": round(float(out["raw_home_score"][i]), 4),
+            "raw_away_score": round(float(out["raw_away_score"][i]), 4),
+        }
+        rows.append(PredictionService._prediction_values(
+            match_id,
+            float(out["home_prob"][i]),
+            float(out["draw_prob"][i]),
+            float(out["away_prob"][i]),
+            None if math.isnan(over_2_5) else over_2_5,
+            None if math.isnan(btts) else btts,
+            model_inputs,
+        ))
+    return rows, None
+
+
+def _score_dixon_coles(batch: ScoringBatch) -> Tuple[List[dict], Optional[dixon_coles.Ratings]]:
+    """Prediction column values from the season's Dixon-Coles scoreline matrices."""
+    fitted = None
+    ratings = batch.ratings
+    if ratings is None:
+        ratings = fitted = fit_ratings(batch.fit)
+
+    expected_home, expected_away = ratings.expected_goals(batch.home_team_ids, batch.away_team_ids)
+    matrices = dixon_coles.score_matrix(expected_home, expected_away, ratings.rho)
+    markets = dixon_coles.market_probabilities(matrices)
+
+    rows = []
+    for j, match_id in enumerate(batch.match_ids):
+        home_attack, home_defence = ratings.team(batch.home_team_ids[j])
+        away_attack, away_defence = ratings.team(batch.away_team_ids[j])
+        model_inputs = {
+            "home_attack": round(home_attack, 4),
+            "home_defence": round(home_defence, 4),
+            "away_attack": round(away_attack, 4),
+            "away_defence": round(away_defence, 4),
+            "home_advantage": round(ratings.home_advantage, 4),
+            "rho": round(ratings.rho, 4),
+            "expected_home_goals": round(float(expected_home[j]), 4),
+            "expected_away_goals": round(float(expected_away[j]), 4),
+            "top_scorelines": [
+                [score, round(prob, 4)] for score, prob in dixon_coles.top_scorelines(matrices[j])
+            ],
+            "fitted_matches": ratings.matches,
+            **batch.context[j],
+        }
+        rows.append(PredictionService._prediction_values(
+            match_id,
+            float(markets["home"][j]),
+            float(markets["draw"][j]),
+            float(markets["away"][j]),
+            float(markets["over_2_5"][j]),
+            float(markets["btts"][j]),
+            model_inputs,
+            MODEL_DIXON_COLES,
+        ))
+    return rows, fitted
+
+
+def fit_ratings(fit: RatingFit) -> dixon_coles.Ratings:
+    """Run a season's Dixon-Coles fit (in the scoring process pool)."""
+    return dixon_coles.fit(fit.results, decay_per_day=settings.DIXON_COLES_DECAY_PER_DAY, init=fit.init)
@@ -0,0 +1,131 @@
+"""
+Football Intelligence Dashboard - Projection Service
+Final-table projections from Monte Carlo simulation of the remaining fixtures.
+"""
+
+import asyncio
+import hashlib
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import numpy as np
+import orjson
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.models.league import League
+from app.models.season import Season
+from app.repositories.match_repository import MatchRepository
+from app.repositories.standing_repository import StandingRepository
+from app.services import season_simulator
+from app.services.prediction_service import PredictionService
+from app.services.season_cache import projections_cache
+
+settings = get_settings()
+
+
+class ProjectionService:
+    """
+    Simulates the rest of a season from the current standings.
+
+    Remaining fixtures are sampled from the prediction model (see
+    `PredictionService.outcome_distributions`). Projections are cached per
+    season and keyed by a fingerprint of the standings, the remaining
+    fixtures, the model version and the iteration count, so they are only
+    recomputed once the table moves.
+    """
+
+    # Size of the top (G3) and bottom (Z3) groups
+    GROUP_SIZE = 3
+
+    def __init__(self, session: AsyncSession, model_version: Optional[str] = None):
+        self.session = session
+        self.standing_repo = StandingRepository(session)
+        self.match_repo = MatchRepository(session)
+        self.prediction_service = PredictionService(session, model_version=model_version)
+
+    async def project(self, season_id: int, iterations: Optional[int] = None) -> dict:
+        """Finishing-position distribution per team for a season."""
+        iterations = iterations or settings.PROJECTION_ITERATIONS
+        standings = await self.standing_repo.get_by_season(season_id)
+        remaining = await self.match_repo.get_remaining(season_id)
+
+        fingerprint = hashlib.sha1(orjson.dumps([
+            self.prediction_service.model_version,
+            iterations,
+            [(s.team_id, s.points, s.goal_difference, s.goals_for) for s in standings],
+            [(m.id, m.home_team_id, m.away_team_id) for m in remaining],
+        ])).hexdigest()
+        cached = await projections_cache.get(season_id)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        # Teams missing from the table (e.g. before the first standings sync) start from zero
+        team_ids = [s.team_id for s in standings]
+        team_ids += sorted({t for m in remaining for t in (m.home_team_id, m.away_team_id)} - set(team_ids))
+        row_of = {team_id: i for i, team_id in enumerate(team_ids)}
+        by_team = {s.team_id: s for s in standings}
+
+        cell_home, cell_away, probs = await self.prediction_service.outcome_distributions(remaining)
+        result = await asyncio.to_thread(
+            season_simulator.simulate,
+            np.array([by_team[t].points if t in by_team else 0 for t in team_ids], dtype=float),
+            np.array([by_team[t].goal_difference if t in by_team else 0 for t in team_ids], dtype=float),
+            np.array([by_team[t].goals_for if t in by_team else 0 for t in team_ids], dtype=float),
+            np.array([row_of[m.home_team_id] for m in remaining], dtype=int),
+            np.array([row_of[m.away_team_id] for m in remaining], dtype=int),
+            cell_home,
+            cell_away,
+            probs,
+            iterations,
+        )
+
+        projection = {
+            "season_id": season_id,
+            "model_version": self.prediction_service.model_version,
+            "iterations": iterations,
+            "remaining_fixtures": len(remaining),
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "teams": self._team_rows(team_ids, by_team, result),
+        }
+        await projections_cache.set(season_id, fingerprint, projection)
+        logger.info(
+            f"Season {season_id} projected: {len(remaining)} fixtures x {iterations} simulations"
+        )
+        return projection
+
+    async def project_current(self, iterations: Optional[int] = None) -> Dict[str, dict]:
+        """Project every current season, keyed by league code."""
+        rows = (await self.session.execute(
+            select(League.code, Season.id)
+            .join(Season, Season.league_id == League.id)
+            .where(Season.is_current == True)
+        )).all()
+        return {code: await self.project(season_id, iterations) for code, season_id in rows}
+
+    def _team_rows(self, team_ids: List[int], by_team: dict, result: season_simulator.SimulationResult) -> List[dict]:
+        n_teams = len(team_ids)
+        probs = result.position_probs
+        expected_points = result.expected_points
+        expected_position = result.expected_position
+        # Tables under six teams have no separate G3/Z3 (as in StandingRepository)
+        has_groups = n_teams >= 2 * self.GROUP_SIZE
+
+        rows = []
+        for i, team_id in enumerate(team_ids):
+            standing = by_team.get(team_id)
+            rows.append({
+                "team_id": team_id,
+                "team_name": standing.team.name if standing and standing.team else None,
+                "position": standing.position if standing else None,
+                "points": standing.points if standing else 0,
+                "expected_points": round(float(expected_points[i]), 2),
+                "expected_position": round(float(expected_position[i]), 2),
+                "title_prob": round(float(probs[i, 0]), 4),
+                "g3_prob": round(float(probs[i, :self.GROUP_SIZE].sum()), 4) if has_groups else None,
+                "z3_prob": round(float(probs[i, -self.GROUP_SIZE:].sum()), 4) if has_groups else None,
+                "position_probs": [round(float(p), 4) for p in probs[i]],
+            })
+        return rows
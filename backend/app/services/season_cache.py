@@ -0,0 +1,79 @@
+"""
+Football Intelligence Dashboard - Season Cache
+Per-season computed results (model ratings, projections), kept in process
+and shared through Redis.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+import redis.asyncio as aioredis
+from loguru import logger
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class SeasonCache:
+    """
+    One JSON value per season, tagged with a fingerprint of the inputs it was
+    computed from.
+
+    A matching fingerprint means the value is current; a stale entry is still
+    returned so the caller can reuse it (e.g. to warm-start a refit).
+    """
+
+    def __init__(self, namespace: str, ttl: int):
+        self.namespace = namespace
+        self.ttl = ttl
+        self._local: Dict[int, Tuple[str, Dict[str, Any]]] = {}
+        self._redis: Optional[aioredis.Redis] = None
+        self._redis_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_redis(self) -> aioredis.Redis:
+        """Get a Redis client bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._redis is None or self._redis_loop is not loop:
+            self._redis = aioredis.from_url(settings.REDIS_URL)
+            self._redis_loop = loop
+        return self._redis
+
+    def key(self, season_id: int) -> str:
+        return f"{self.namespace}:{season_id}"
+
+    async def get(self, season_id: int) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """(fingerprint, value) for a season, or None."""
+        entry = self._local.get(season_id)
+        if entry is not None:
+            return entry
+        try:
+            raw = await self._get_redis().get(self.key(season_id))
+        except Exception as e:
+            logger.warning(f"Season cache {self.namespace} unavailable: {e}")
+            return None
+        if raw is None:
+            return None
+        data = orjson.loads(raw)
+        entry = (data["fingerprint"], data["value"])
+        self._local[season_id] = entry
+        return entry
+
+    async def set(self, season_id: int, fingerprint: str, value: Dict[str, Any]) -> None:
+        self._local[season_id] = (fingerprint, value)
+        try:
+            payload = orjson.dumps({"fingerprint": fingerprint, "value": value})
+            await self._get_redis().set(self.key(season_id), payload, ex=self.ttl)
+        except Exception as e:
+            logger.warning(f"Season cache {self.namespace} write failed: {e}")
+
+    def clear(self) -> None:
+        """Forget the in-process copies (Redis entries expire on their own)."""
+        self._local.clear()
+
+
+# Dixon-Coles ratings shared by every PredictionService in the process
+dixon_coles_cache = SeasonCache("ratings:dixon-coles", settings.DIXON_COLES_CACHE_TTL_SECONDS)
+# Monte Carlo league projections (see ProjectionService)
+projections_cache = SeasonCache("projections", settings.PROJECTION_CACHE_TTL_SECONDS)
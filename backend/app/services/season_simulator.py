@@ -0,0 +1,111 @@
+"""
+Football Intelligence Dashboard - Season Simulator
+Vectorized Monte Carlo simulation of a league's remaining fixtures.
+
+Every remaining fixture carries a probability distribution over a fixed set
+of scorelines. All fixtures of a batch of simulated seasons are sampled with
+a single `searchsorted` over the stacked CDFs, team totals are accumulated
+with incidence-matrix products and each simulated table is ranked with one
+argsort, so there is no Python loop per match or per simulation.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+# Simulated seasons per batch; bounds the (seasons x fixtures) sample arrays
+BATCH_SIZE = 2000
+
+
+@dataclass
+class SimulationResult:
+    """Aggregates over all simulated seasons, rows in the order of the input teams."""
+
+    iterations: int
+    position_counts: np.ndarray  # (teams, positions): seasons finishing in each position
+    points_sum: np.ndarray  # (teams,): final points summed over seasons
+
+    @property
+    def position_probs(self) -> np.ndarray:
+        return self.position_counts / self.iterations
+
+    @property
+    def expected_points(self) -> np.ndarray:
+        return self.points_sum / self.iterations
+
+    @property
+    def expected_position(self) -> np.ndarray:
+        positions = np.arange(1, self.position_counts.shape[1] + 1)
+        return (self.position_probs * positions).sum(axis=1)
+
+
+def simulate(
+    points: np.ndarray,
+    goal_difference: np.ndarray,
+    goals_for: np.ndarray,
+    home_index: np.ndarray,
+    away_index: np.ndarray,
+    cell_home_goals: np.ndarray,
+    cell_away_goals: np.ndarray,
+    cell_probs: np.ndarray,
+    iterations: int,
+    seed: Optional[int] = None,
+) -> SimulationResult:
+    """
+    Simulate the rest of a season `iterations` times.
+
+    `points`, `goal_difference` and `goals_for` are the current table, one
+    entry per team. Fixture f is team `home_index[f]` against
+    `away_index[f]`; it ends in scoreline cell k, i.e.
+    `cell_home_goals[k]`-`cell_away_goals[k]`, with probability
+    `cell_probs[f, k]`. Final tables rank by points, goal difference, goals
+    for, then at random.
+    """
+    n_teams = len(points)
+    n_fixtures, n_cells = cell_probs.shape
+    rng = np.random.default_rng(seed)
+
+    position_counts = np.zeros((n_teams, n_teams), dtype=np.int64)
+    points_sum = np.zeros(n_teams)
+
+    # Fixture-by-team incidence matrices turn per-fixture samples into team totals
+    home_incidence = np.zeros((n_fixtures, n_teams))
+    home_incidence[np.arange(n_fixtures), home_index] = 1.0
+    away_incidence = np.zeros((n_fixtures, n_teams))
+    away_incidence[np.arange(n_fixtures), away_index] = 1.0
+
+    # Stacked CDFs: fixture f's CDF is shifted by f, so one sorted array serves all fixtures
+    cdf = np.cumsum(cell_probs / cell_probs.sum(axis=1, keepdims=True), axis=1)
+    cdf[:, -1] = 1.0
+    offsets = np.arange(n_fixtures)
+    stacked = (cdf + offsets[:, None]).ravel()
+
+    positions = np.arange(n_teams)
+    done = 0
+    while done < iterations:
+        batch = min(BATCH_SIZE, iterations - done)
+        draws = rng.random((batch, n_fixtures)) + offsets
+        cells = np.searchsorted(stacked, draws, side="right") - offsets * n_cells
+        np.clip(cells, 0, n_cells - 1, out=cells)
+
+        home_goals = cell_home_goals[cells]
+        away_goals = cell_away_goals[cells]
+        home_points = np.where(home_goals > away_goals, 3.0, np.where(home_goals == away_goals, 1.0, 0.0))
+        away_points = np.where(away_goals > home_goals, 3.0, np.where(home_goals == away_goals, 1.0, 0.0))
+        margin = (home_goals - away_goals).astype(float)
+
+        final_points = points + home_points @ home_incidence + away_points @ away_incidence
+        final_gd = goal_difference + margin @ home_incidence - margin @ away_incidence
+        final_gf = goals_for + home_goals.astype(float) @ home_incidence + away_goals.astype(float) @ away_incidence
+
+        # Lexicographic sort key; the random fraction breaks remaining ties
+        key = final_points * 1e8 + (final_gd + 5000) * 1e4 + final_gf + rng.random((batch, n_teams))
+        table = np.argsort(-key, axis=1)  # table[s, p] = team finishing in position p
+        position_counts += np.bincount(
+            (table * n_teams + positions).ravel(), minlength=n_teams * n_teams
+        ).reshape(n_teams, n_teams)
+        points_sum += final_points.sum(axis=0)
+        done += batch
+
+    return SimulationResult(iterations=iterations, position_counts=position_counts, points_sum=points_sum)
@@ -3,34 +3,76 @@ Football Intelligence Dashboard - Sync Service
 Orchestrates data fetching from API-Football and stores in database.
 """
 
-from datetime import datetime
-from typing import Optional
+import asyncio
+import time
+import uuid
+from contextlib import nullcontext
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import LEAGUES_CONFIG
-from app.integrations.football_api import api_football_client
+from app.core.config import LEAGUES_CONFIG, get_settings
+from app.core.database import async_session_factory
+from app.integrations.football_api import APIFootballClient, api_football_client
+from app.integrations.rate_limiter import PRIORITY_BACKFILL
 from app.models.league import League
-from app.models.match import Match
+from app.models.match import FINAL_STATUSES
 from app.models.season import Season
 from app.models.standing import Standing
+from app.models.sync_job import SyncJobState
 from app.models.team import Team
 from app.repositories.league_repository import LeagueRepository
 from app.repositories.match_repository import MatchRepository
 from app.repositories.standing_repository import StandingRepository
+from app.repositories.sync_job_repository import SyncJobRepository
 from app.repositories.team_repository import TeamRepository
+from app.services.elo_service import EloService
+from app.services.head_to_head_service import HeadToHeadService
+from app.services.prediction_service import PredictionService
+from app.services.team_feature_service import TeamFeatureService
+
+settings = get_settings()
+
+T = TypeVar("T")
 
 
 class SyncService:
     """Orchestrates data synchronization from API-Football."""
 
-    def __init__(self, session: AsyncSession):
+    # Columns refreshed when a fixture already exists; is_g3_vs_z3 is
+    # maintained by `recompute_g3_vs_z3` after standings change
+    FIXTURE_UPDATE_COLUMNS = (
+        "status",
+        "match_date",
+        "home_score",
+        "away_score",
+        "home_ht_score",
+        "away_ht_score",
+        "venue",
+        "referee",
+    )
+
+    # Fixtures per write when streaming a season (API_FOOTBALL_STREAM_FIXTURES)
+    FIXTURE_STREAM_BATCH_SIZE = 200
+
+    # Matches per statistics write (fetched 20 per API request)
+    STATS_WRITE_BATCH_SIZE = 100
+
+    def __init__(self, session: AsyncSession, client: Optional[APIFootballClient] = None):
         self.session = session
+        # Injectable so archived payloads can be replayed through the same parsers
+        self.client = client or api_football_client
         self.league_repo = LeagueRepository(session)
         self.team_repo = TeamRepository(session)
         self.standing_repo = StandingRepository(session)
         self.match_repo = MatchRepository(session)
+        self.sync_job_repo = SyncJobRepository(session)
+        self.h2h_service = HeadToHeadService(session, self.client)
+        self.elo_service = EloService(session)
+        self.feature_service = TeamFeatureService(session)
 
     async def sync_leagues(self) -> dict:
         """Seed/update all 14 leagues from config."""
@@ -70,7 +112,7 @@ class SyncService:
         if not league:
             return {"error": f"League {league_code} not found"}
 
-        api_teams = await api_football_client.get_teams(league.api_football_id, season)
+        api_teams = await self.client.get_teams(league.api_football_id, season)
 
         for team_data in api_teams:
             try:
@@ -108,15 +150,52 @@ class SyncService:
         logger.info(f"Teams sync for {league_code}: {results}")
         return results
 
-    async def sync_standings(self, league_code: str, season_year: int) -> dict:
-        """Sync standings for a league from API-Football."""
-        results = {"upserted": 0, "errors": 0}
+    async def sync_standings(self, league_code: str, season_year: int, current: bool = True) -> dict:
+        """
+        Sync standings for a league from API-Football.
+
+        A missing season is created; with `current` it becomes the league's
+        current season, otherwise (backfill) it is stored as a past season.
+        """
+        results = {"upserted": 0, "removed": 0, "g3_vs_z3_flipped": 0, "errors": 0}
 
         league = await self.league_repo.get_by_code(league_code)
         if not league:
             return {"error": f"League {league_code} not found"}
 
-        # Find or create season
+        # Fetch before writing so no write lock is held during the API call
+        api_standings = await self.client.get_standings(
+            league.api_football_id, season_year
+        )
+
+        season = await self._get_or_create_season(league, season_year, current)
+
+        team_ids = await self.team_repo.get_id_map(
+            standing_data.get("team", {}).get("id") for standing_data in api_standings
+        )
+
+        rows: Dict[int, dict] = {}
+        for standing_data in api_standings:
+            try:
+                team_id = team_ids.get(standing_data.get("team", {}).get("id"))
+                if not team_id:
+                    continue
+                rows[team_id] = {"team_id": team_id, **self._parse_standing(standing_data)}
+            except Exception as e:
+                logger.error(f"Error syncing standing: {e}")
+                results["errors"] += 1
+
+        if rows:
+            results["upserted"] = await self.standing_repo.bulk_upsert(season.id, list(rows.values()))
+            # Drop teams that are no longer part of the API table
+            results["removed"] = await self.standing_repo.delete_except(season.id, rows.keys())
+            results["g3_vs_z3_flipped"] = await self.recompute_g3_vs_z3(season.id)
+
+        logger.info(f"Standings sync for {league_code}: {results}")
+        return results
+
+    async def _get_or_create_season(self, league: League, season_year: int, current: bool = True) -> Season:
+        """The league's season for `season_year`, created if missing."""
         from sqlalchemy import select
         season_result = await self.session.execute(
             select(Season).where(
@@ -129,73 +208,94 @@ class SyncService:
             season = Season(
                 league_id=league.id,
                 year=str(season_year),
-                is_current=True,
+                is_current=current,
             )
             self.session.add(season)
             await self.session.flush()
 
-            # Deactivate other seasons for this league to maintain database integrity
-            from sqlalchemy import update
-            await self.session.execute(
-                update(Season)
-                .where(Season.league_id == league.id, Season.id != season.id)
-                .values(is_current=False)
-            )
+            if current:
+                # Deactivate other seasons for this league to maintain database integrity
+                from sqlalchemy import update
+                await self.session.execute(
+                    update(Season)
+                    .where(Season.league_id == league.id, Season.id != season.id)
+                    .values(is_current=False)
+                )
+        return season
+
+    async def sync_fixtures(
+        self,
+        league_code: str,
+        season_year: int,
+        incremental: bool = False,
+        stream: Optional[bool] = None,
+        update_ratings: bool = True,
+    ) -> dict:
+        """
+        Sync fixtures/results for a league from API-Football.
+
+        Incremental mode only fetches the rolling date window around now
+        (see `_fixture_window`) instead of the whole season. `stream`
+        overrides API_FOOTBALL_STREAM_FIXTURES for whole-season fetches.
+        New results are applied to the season's team features and, unless
+        `update_ratings` is False, to the league's Elo ratings.
+        """
+        results = {
+            "created": 0, "updated": 0, "errors": 0, "h2h_refreshed": 0, "elo_applied": 0, "features_applied": 0,
+        }
 
-        api_standings = await api_football_client.get_standings(
-            league.api_football_id, season_year
-        )
+        league = await self.league_repo.get_by_code(league_code)
+        if not league:
+            return {"error": f"League {league_code} not found"}
 
-        for standing_data in api_standings:
-            try:
-                team_info = standing_data.get("team", {})
-                api_team_id = team_info.get("id")
-                team = await self.team_repo.get_by_api_football_id(api_team_id)
-                if not team:
-                    continue
+        from sqlalchemy import select
+        season_result = await self.session.execute(
+            select(Season).where(
+                Season.league_id == league.id,
+                Season.year == str(season_year),
+            )
+        )
+        season = season_result.scalar_one_or_none()
+        if not season:
+            return {"error": f"Season {season_year} not found for {league_code}"}
 
-                all_stats = standing_data.get("all", {})
-                home_stats = standing_data.get("home", {})
-                away_stats = standing_data.get("away", {})
-
-                data = {
-                    "position": standing_data.get("rank", 0),
-                    "played": all_stats.get("played", 0),
-                    "won": all_stats.get("win", 0),
-                    "drawn": all_stats.get("draw", 0),
-                    "lost": all_stats.get("lose", 0),
-                    "goals_for": all_stats.get("goals", {}).get("for", 0),
-                    "goals_against": all_stats.get("goals", {}).get("against", 0),
-                    "goal_difference": standing_data.get("goalsDiff", 0),
-                    "points": standing_data.get("points", 0),
-                    "form": standing_data.get("form", ""),
-                    "description": standing_data.get("description", ""),
-                    "home_played": home_stats.get("played", 0),
-                    "home_won": home_stats.get("win", 0),
-                    "home_drawn": home_stats.get("draw", 0),
-                    "home_lost": home_stats.get("lose", 0),
-                    "home_goals_for": home_stats.get("goals", {}).get("for", 0),
-                    "home_goals_against": home_stats.get("goals", {}).get("against", 0),
-                    "away_played": away_stats.get("played", 0),
-                    "away_won": away_stats.get("win", 0),
-                    "away_drawn": away_stats.get("draw", 0),
-                    "away_lost": away_stats.get("lose", 0),
-                    "away_goals_for": away_stats.get("goals", {}).get("for", 0),
-                    "away_goals_against": away_stats.get("goals", {}).get("against", 0),
-                }
+        if incremental:
+            from_date, to_date = await self._fixture_window(season.id)
+            api_fixtures = await self.client.get_fixtures(
+                league.api_football_id,
+                season_year,
+                from_date=from_date.isoformat(),
+                to_date=to_date.isoformat(),
+            )
+            await self._write_fixtures(season.id, api_fixtures, results)
+        elif settings.API_FOOTBALL_STREAM_FIXTURES if stream is None else stream:
+            # Write the season in batches as it is parsed instead of holding the full list
+            stream = self.client.iter_fixtures(league.api_football_id, season_year)
+            async for batch in _batched(stream, self.FIXTURE_STREAM_BATCH_SIZE):
+                await self._write_fixtures(season.id, batch, results)
+        else:
+            api_fixtures = await self.client.get_fixtures(
+                league.api_football_id, season_year
+            )
+            await self._write_fixtures(season.id, api_fixtures, results)
 
-                await self.standing_repo.upsert(season.id, team.id, data)
-                results["upserted"] += 1
-            except Exception as e:
-                logger.error(f"Error syncing standing: {e}")
-                results["errors"] += 1
+        results["features_applied"] = await self.feature_service.update([season.id])
+        if update_ratings:
+            results["elo_applied"] = await self.elo_service.update([league.id])
 
-        logger.info(f"Standings sync for {league_code}: {results}")
+        logger.info(f"Fixtures sync for {league_code}: {results}")
         return results
 
-    async def sync_fixtures(self, league_code: str, season_year: int) -> dict:
-        """Sync fixtures/results for a league from API-Football."""
-        results = {"created": 0, "updated": 0, "errors": 0}
+    async def sync_fixture_statistics(self, league_code: str, season_year: int) -> dict:
+        """
+        Fetch statistics (incl. xG) for the season's played matches that have none yet.
+
+        Matches are looked up by ID, 20 per request at PRIORITY_BACKFILL, and
+        written in bulk. A match returned by the API gets stats_synced_at even
+        without statistics (not every league is covered), so it is never
+        fetched again; matches missing from a response are retried next run.
+        """
+        results = {"requested": 0, "updated": 0, "without_stats": 0}
 
         league = await self.league_repo.get_by_code(league_code)
         if not league:
@@ -212,117 +312,549 @@ class SyncService:
         if not season:
             return {"error": f"Season {season_year} not found for {league_code}"}
 
-        api_fixtures = await api_football_client.get_fixtures(
-            league.api_football_id, season_year
+        pending = await self.match_repo.get_missing_statistics(
+            season.id,
+            finished_before=datetime.now(timezone.utc) - timedelta(hours=settings.FIXTURE_STATS_DELAY_HOURS),
         )
-
+        pending_by_api_id = {
+            api_id: (match_id, home_api_id, away_api_id)
+            for match_id, api_id, home_api_id, away_api_id in pending
+        }
+        results["requested"] = len(pending_by_api_id)
+        synced_at = datetime.now(timezone.utc)
+        # Fetched in full before the first write: on SQLite the write lock is held
+        # until the stage commits, and concurrent leagues must not wait on our requests
+        with self.client.priority(PRIORITY_BACKFILL):
+            api_fixtures = await self.client.get_fixtures_by_ids(list(pending_by_api_id))
+
+        rows = []
         for fixture_data in api_fixtures:
-            try:
-                fixture = fixture_data.get("fixture", {})
-                teams = fixture_data.get("teams", {})
-                goals = fixture_data.get("goals", {})
-                score = fixture_data.get("score", {})
+            entry = pending_by_api_id.get(fixture_data.get("fixture", {}).get("id"))
+            if entry is None:
+                continue
+            match_id, home_api_id, away_api_id = entry
+            stats = self._parse_statistics(fixture_data, home_api_id, away_api_id)
+            rows.append({
+                "id": match_id,
+                "statistics": stats or None,
+                "home_xg": _parse_float(stats.get("home", {}).get("expected_goals")),
+                "away_xg": _parse_float(stats.get("away", {}).get("expected_goals")),
+                "stats_synced_at": synced_at,
+            })
+            if not stats:
+                results["without_stats"] += 1
+
+        for start in range(0, len(rows), self.STATS_WRITE_BATCH_SIZE):
+            results["updated"] += await self.match_repo.bulk_update(rows[start:start + self.STATS_WRITE_BATCH_SIZE])
+        await self.feature_service.apply_xg(season.id, {
+            row["id"]: (row["home_xg"], row["away_xg"])
+            for row in rows
+            if row["home_xg"] is not None or row["away_xg"] is not None
+        })
+
+        logger.info(f"Fixture statistics sync for {league_code}: {results}")
+        return results
 
-                api_fixture_id = fixture.get("id")
+    async def refresh_predictions(self, league_code: str, season_year: int) -> dict:
+        """
+        Rewrite the season's upcoming predictions whose inputs changed (see `PredictionService.refresh_season`).
 
-                home_api_id = teams.get("home", {}).get("id")
-                away_api_id = teams.get("away", {}).get("id")
+        Head-to-head records the upcoming fixtures lack are fetched first:
+        predictions never call the API themselves.
+        """
+        league = await self.league_repo.get_by_code(league_code)
+        if not league:
+            return {"error": f"League {league_code} not found"}
 
-                home_team = await self.team_repo.get_by_api_football_id(home_api_id)
-                away_team = await self.team_repo.get_by_api_football_id(away_api_id)
+        from sqlalchemy import select
+        season_result = await self.session.execute(
+            select(Season).where(
+                Season.league_id == league.id,
+                Season.year == str(season_year),
+            )
+        )
+        season = season_result.scalar_one_or_none()
+        if not season:
+            return {"error": f"Season {season_year} not found for {league_code}"}
 
-                if not home_team or not away_team:
-                    continue
+        upcoming = await self.match_repo.get_upcoming_prediction_hashes(season.id)
+        h2h_fetched = await self.h2h_service.fetch_missing(
+            (match.home_team_id, match.away_team_id) for match, _ in upcoming
+        )
+        return {
+            "h2h_fetched": h2h_fetched,
+            "written": await PredictionService(self.session).refresh_season(season.id),
+        }
+
+    async def refresh_stale_fixtures(self) -> dict:
+        """
+        Re-fetch only the matches likely to have changed, 20 per API call.
+
+        Targets matches that kicked off but are not final, kick off within
+        FIXTURE_REFRESH_KICKOFF_HOURS, or finished without a final score.
+        """
+        results = {
+            "requested": 0, "created": 0, "updated": 0, "errors": 0,
+            "h2h_refreshed": 0, "elo_applied": 0, "features_applied": 0, "predictions_written": 0,
+        }
+
+        season_by_fixture = await self.match_repo.get_needing_refresh(
+            kickoff_within=timedelta(hours=settings.FIXTURE_REFRESH_KICKOFF_HOURS),
+            lookback=timedelta(days=settings.FIXTURES_PENDING_LOOKBACK_DAYS),
+        )
+        results["requested"] = len(season_by_fixture)
+        if not season_by_fixture:
+            return results
 
-                # Detect G3 vs Z3
-                standings = await self.standing_repo.get_by_season(season.id)
-                is_g3_vs_z3 = False
-                if len(standings) >= 6:
-                    g3_ids = {s.team_id for s in standings[:3]}
-                    z3_ids = {s.team_id for s in standings[-3:]}
-                    is_g3_vs_z3 = (
-                        (home_team.id in g3_ids and away_team.id in z3_ids)
-                        or (home_team.id in z3_ids and away_team.id in g3_ids)
-                    )
+        api_fixtures = await self.client.get_fixtures_by_ids(sorted(season_by_fixture))
 
-                match_date_str = fixture.get("date", "")
-                try:
-                    match_date = datetime.fromisoformat(match_date_str.replace("Z", "+00:00"))
-                except (ValueError, AttributeError):
-                    match_date = datetime.utcnow()
+        fixtures_by_season: Dict[int, List[Dict]] = {}
+        for fixture_data in api_fixtures:
+            season_id = season_by_fixture.get(fixture_data.get("fixture", {}).get("id"))
+            if season_id is not None:
+                fixtures_by_season.setdefault(season_id, []).append(fixture_data)
 
-                ht = score.get("halftime", {})
+        for season_id, season_fixtures in fixtures_by_season.items():
+            await self._write_fixtures(season_id, season_fixtures, results)
+        results["features_applied"] = await self.feature_service.update(fixtures_by_season)
+        results["elo_applied"] = await self.elo_service.update()
+        results["predictions_written"] = await PredictionService(self.session).refresh_seasons(fixtures_by_season)
 
-                existing = await self.match_repo.get_by_api_football_id(api_fixture_id)
-                if existing:
-                    existing.status = fixture.get("status", {}).get("short", "NS")
-                    existing.home_score = goals.get("home")
-                    existing.away_score = goals.get("away")
-                    existing.home_ht_score = ht.get("home")
-                    existing.away_ht_score = ht.get("away")
-                    existing.is_g3_vs_z3 = is_g3_vs_z3
-                    existing.venue = fixture.get("venue", {}).get("name")
-                    existing.referee = fixture.get("referee")
-                    await self.match_repo.update(existing)
-                    results["updated"] += 1
-                else:
-                    match = Match(
-                        season_id=season.id,
-                        home_team_id=home_team.id,
-                        away_team_id=away_team.id,
-                        api_football_id=api_fixture_id,
-                        matchday=fixture_data.get("league", {}).get("round", "").split(" - ")[-1] if fixture_data.get("league", {}).get("round") else None,
-                        match_date=match_date,
-                        status=fixture.get("status", {}).get("short", "NS"),
-                        home_score=goals.get("home"),
-                        away_score=goals.get("away"),
-                        home_ht_score=ht.get("home"),
-                        away_ht_score=ht.get("away"),
-                        venue=fixture.get("venue", {}).get("name"),
-                        referee=fixture.get("referee"),
-                        is_g3_vs_z3=is_g3_vs_z3,
-                    )
-                    # Parse matchday from round string
-                    round_str = fixture_data.get("league", {}).get("round", "")
-                    if "Regular Season" in round_str:
-                        try:
-                            match.matchday = int(round_str.split(" - ")[-1])
-                        except (ValueError, IndexError):
-                            pass
-
-                    await self.match_repo.create(match)
-                    results["created"] += 1
+        logger.info(f"Stale fixtures refresh: {results}")
+        return results
+
+    async def _fixture_window(self, season_id: int) -> Tuple[date, date]:
+        """
+        Date range for an incremental fixture sync.
+
+        Covers FIXTURES_WINDOW_PAST_DAYS before and FIXTURES_WINDOW_AHEAD_DAYS
+        after today, reaching further back (up to FIXTURES_PENDING_LOOKBACK_DAYS)
+        for stored matches that kicked off but never got a final status.
+        Anything older is picked up by the daily full refresh.
+        """
+        now = datetime.now(timezone.utc)
+        window_start = now - timedelta(days=settings.FIXTURES_WINDOW_PAST_DAYS)
+        oldest_pending = await self.match_repo.get_oldest_pending_date(
+            season_id,
+            since=now - timedelta(days=settings.FIXTURES_PENDING_LOOKBACK_DAYS),
+            before=window_start,
+        )
+        from_date = (oldest_pending or window_start).date()
+        to_date = (now + timedelta(days=settings.FIXTURES_WINDOW_AHEAD_DAYS)).date()
+        return from_date, to_date
+
+    async def _write_fixtures(self, season_id: int, api_fixtures: List[Dict], results: dict) -> None:
+        """Bulk upsert API fixtures for a season, updating the results counters."""
+        # Prefetch lookups once per batch instead of once per fixture
+        team_ids = await self.team_repo.get_id_map(
+            api_id
+            for fixture_data in api_fixtures
+            for api_id in (
+                fixture_data.get("teams", {}).get("home", {}).get("id"),
+                fixture_data.get("teams", {}).get("away", {}).get("id"),
+            )
+        )
+        existing_ids = await self.match_repo.get_id_map(
+            fixture_data.get("fixture", {}).get("id") for fixture_data in api_fixtures
+        )
+        g3_ids, z3_ids = await self.standing_repo.get_g3_z3_team_ids(season_id)
+
+        rows: Dict[int, dict] = {}
+        for fixture_data in api_fixtures:
+            try:
+                row = self._parse_fixture(fixture_data, season_id, team_ids)
+                if row is None:
+                    continue
+                row["is_g3_vs_z3"] = (
+                    (row["home_team_id"] in g3_ids and row["away_team_id"] in z3_ids)
+                    or (row["home_team_id"] in z3_ids and row["away_team_id"] in g3_ids)
+                )
+                rows[row["api_football_id"]] = row
             except Exception as e:
                 logger.error(f"Error syncing fixture: {e}")
                 results["errors"] += 1
 
-        logger.info(f"Fixtures sync for {league_code}: {results}")
+        if not rows:
+            return
+
+        already_finished = await self.match_repo.get_finished_api_ids(rows.keys())
+        await self.match_repo.bulk_upsert(list(rows.values()), self.FIXTURE_UPDATE_COLUMNS)
+        for api_fixture_id in rows:
+            if api_fixture_id in existing_ids:
+                results["updated"] += 1
+            else:
+                results["created"] += 1
+
+        # Only pairs with a match that just finished need their head-to-head recomputed
+        results["h2h_refreshed"] += await self.h2h_service.refresh_pairs(
+            (row["home_team_id"], row["away_team_id"])
+            for api_fixture_id, row in rows.items()
+            if row["status"] in FINAL_STATUSES and api_fixture_id not in already_finished
+        )
+
+    async def recompute_g3_vs_z3(self, season_id: int) -> int:
+        """Refresh the G3 vs Z3 flag of the season's unfinished matches. Returns flags flipped."""
+        g3_ids, z3_ids = await self.standing_repo.get_g3_z3_team_ids(season_id)
+        flipped = await self.match_repo.recompute_g3_vs_z3(season_id, g3_ids, z3_ids)
+        if flipped:
+            logger.info(f"G3 vs Z3 flag flipped on {flipped} matches of season {season_id}")
+        return flipped
+
+    @staticmethod
+    def _parse_standing(standing_data: Dict) -> dict:
+        """Map an API-Football standings entry to Standing columns."""
+        all_stats = standing_data.get("all", {})
+        home_stats = standing_data.get("home", {})
+        away_stats = standing_data.get("away", {})
+
+        return {
+            "position": standing_data.get("rank", 0),
+            "played": all_stats.get("played", 0),
+            "won": all_stats.get("win", 0),
+            "drawn": all_stats.get("draw", 0),
+            "lost": all_stats.get("lose", 0),
+            "goals_for": all_stats.get("goals", {}).get("for", 0),
+            "goals_against": all_stats.get("goals", {}).get("against", 0),
+            "goal_difference": standing_data.get("goalsDiff", 0),
+            "points": standing_data.get("points", 0),
+            "form": standing_data.get("form", ""),
+            "description": standing_data.get("description", ""),
+            "home_played": home_stats.get("played", 0),
+            "home_won": home_stats.get("win", 0),
+            "home_drawn": home_stats.get("draw", 0),
+            "home_lost": home_stats.get("lose", 0),
+            "home_goals_for": home_stats.get("goals", {}).get("for", 0),
+            "home_goals_against": home_stats.get("goals", {}).get("against", 0),
+            "away_played": away_stats.get("played", 0),
+            "away_won": away_stats.get("win", 0),
+            "away_drawn": away_stats.get("draw", 0),
+            "away_lost": away_stats.get("lose", 0),
+            "away_goals_for": away_stats.get("goals", {}).get("for", 0),
+            "away_goals_against": away_stats.get("goals", {}).get("against", 0),
+        }
+
+    @staticmethod
+    def _parse_statistics(fixture_data: Dict, home_api_id: int, away_api_id: int) -> Dict[str, Dict]:
+        """Per-side {type: value} statistics of an API-Football fixture."""
+        sides = {home_api_id: "home", away_api_id: "away"}
+        stats: Dict[str, Dict] = {}
+        for team_stats in fixture_data.get("statistics") or []:
+            side = sides.get(team_stats.get("team", {}).get("id"))
+            if side:
+                stats[side] = {
+                    item["type"]: item.get("value")
+                    for item in team_stats.get("statistics") or []
+                    if item.get("type")
+                }
+        return stats
+
+    @staticmethod
+    def _parse_fixture(
+        fixture_data: Dict, season_id: int, team_ids: Dict[int, int]
+    ) -> Optional[dict]:
+        """Map an API-Football fixture to a matches row, or None if a team is unknown."""
+        fixture = fixture_data.get("fixture", {})
+        teams = fixture_data.get("teams", {})
+        goals = fixture_data.get("goals", {})
+        score = fixture_data.get("score", {})
+
+        home_team_id = team_ids.get(teams.get("home", {}).get("id"))
+        away_team_id = team_ids.get(teams.get("away", {}).get("id"))
+        if not home_team_id or not away_team_id:
+            return None
+
+        match_date_str = fixture.get("date", "")
+        try:
+            match_date = datetime.fromisoformat(match_date_str.replace("Z", "+00:00"))
+        except (ValueError, AttributeError):
+            match_date = datetime.utcnow()
+
+        # Parse matchday from round string
+        matchday = None
+        round_str = fixture_data.get("league", {}).get("round") or ""
+        if "Regular Season" in round_str:
+            try:
+                matchday = int(round_str.split(" - ")[-1])
+            except (ValueError, IndexError):
+                pass
+
+        ht = score.get("halftime") or {}
+
+        return {
+            "season_id": season_id,
+            "home_team_id": home_team_id,
+            "away_team_id": away_team_id,
+            "api_football_id": fixture.get("id"),
+            "matchday": matchday,
+            "match_date": match_date,
+            "status": fixture.get("status", {}).get("short", "NS"),
+            "home_score": goals.get("home"),
+            "away_score": goals.get("away"),
+            "home_ht_score": ht.get("home"),
+            "away_ht_score": ht.get("away"),
+            "venue": (fixture.get("venue") or {}).get("name"),
+            "referee": fixture.get("referee"),
+            "is_g3_vs_z3": False,
+        }
+
+    async def sync_league(
+        self,
+        league_code: str,
+        season_year: int,
+        incremental: bool = False,
+        run_id: Optional[str] = None,
+        force: bool = False,
+        backfill: bool = False,
+    ) -> dict:
+        """
+        Sync a single league: teams → standings → fixtures → statistics → predictions.
+
+        Every stage is committed on its own and checkpointed as a
+        SyncJobState under `run_id`. Stages already completed in the same
+        run, or by any run within SYNC_STAGE_FRESHNESS_MINUTES, are skipped
+        unless `force` is set. A failed stage stops the league.
+        `incremental` is passed on to `sync_fixtures`.
+
+        `backfill` loads a past season: it is stored with is_current=False,
+        fixtures are streamed, requests queue at PRIORITY_BACKFILL, there
+        is no predictions stage and a stage completed by any earlier run
+        counts as done.
+        """
+        run_id = run_id or uuid.uuid4().hex
+        if backfill:
+            stages: List[Tuple[str, Callable[[str, int], Awaitable[dict]]]] = [
+                ("teams", self.sync_teams),
+                ("standings", partial(self.sync_standings, current=False)),
+                ("fixtures", self._backfill_fixtures),
+                ("statistics", self.sync_fixture_statistics),
+            ]
+        else:
+            stages = [
+                ("teams", self.sync_teams),
+                ("standings", self.sync_standings),
+                (
+                    "fixtures_incremental" if incremental else "fixtures",
+                    partial(self.sync_fixtures, incremental=incremental),
+                ),
+                ("statistics", self.sync_fixture_statistics),
+                ("predictions", self.refresh_predictions),
+            ]
+
+        done = set()
+        if not force:
+            if backfill:
+                # Past seasons don't change once loaded
+                since = datetime.min.replace(tzinfo=timezone.utc)
+            else:
+                since = datetime.now(timezone.utc) - timedelta(minutes=settings.SYNC_STAGE_FRESHNESS_MINUTES)
+            done = await self.sync_job_repo.get_completed_stages(run_id, season_year, league_code, since)
+
+        results = {}
+        with self.client.priority(PRIORITY_BACKFILL) if backfill else nullcontext():
+            for stage, sync in stages:
+                if stage in done:
+                    results[stage] = {"skipped": True}
+                    continue
+                results[stage] = await self._run_stage(run_id, league_code, season_year, stage, sync)
+                if "error" in results[stage]:
+                    break
         return results
 
-    async def sync_all(self, season_year: int = 2024) -> dict:
-        """Full sync: leagues → teams → standings → fixtures."""
-        logger.info(f"Starting full sync for season {season_year}...")
+    async def _backfill_fixtures(self, league_code: str, season_year: int) -> dict:
+        """
+        Stream a past season's fixtures; an empty season fails so a later run retries it.
+
+        Past results would reach the Elo ratings after the current season's,
+        so ratings are left to the rebuild (in kickoff order) at the end of
+        the backfill.
+        """
+        result = await self.sync_fixtures(league_code, season_year, stream=True, update_ratings=False)
+        if "error" not in result and not (result["created"] or result["updated"]):
+            # Not loaded yet upstream; failed requests raise instead (see APIFootballError)
+            result["error"] = f"No fixtures returned for {league_code} {season_year}"
+        return result
+
+    async def _run_stage(
+        self,
+        run_id: str,
+        league_code: str,
+        season_year: int,
+        stage: str,
+        sync: Callable[[str, int], Awaitable[dict]],
+    ) -> dict:
+        """Run one stage, commit it and record its outcome and duration."""
+        state = SyncJobState(
+            run_id=run_id,
+            season_year=season_year,
+            league_code=league_code,
+            stage=stage,
+            status="running",
+            started_at=datetime.now(timezone.utc),
+        )
+        # Committed up front so a crashed worker leaves a visible "running" row
+        self.session.add(state)
+        await self.session.commit()
+
+        started = time.perf_counter()
+        try:
+            result = await sync(league_code, season_year)
+            state.status = "failed" if "error" in result else "completed"
+            state.result = result
+            state.error = result.get("error")
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Sync stage {league_code}/{stage} failed: {e}")
+            result = {"error": str(e)}
+            state.status = "failed"
+            state.error = str(e)[:500]
+        state.finished_at = datetime.now(timezone.utc)
+        state.duration_ms = int((time.perf_counter() - started) * 1000)
+        await self.session.commit()
+        return result
+
+    async def sync_all(
+        self,
+        season_year: int = 2024,
+        concurrent: bool = False,
+        max_concurrency: Optional[int] = None,
+        incremental: bool = False,
+        run_id: Optional[str] = None,
+        force: bool = False,
+    ) -> dict:
+        """
+        Full sync: leagues → teams → standings → fixtures → statistics → predictions.
+
+        In concurrent mode leagues run in parallel (bounded by
+        `max_concurrency`, default SYNC_MAX_CONCURRENCY), each in its own
+        session; stage order is preserved within every league.
+        `incremental` limits the fixtures stage to the rolling date window.
+        Passing the `run_id` of an interrupted run resumes it (see `sync_league`).
+        """
+        run_id = run_id or uuid.uuid4().hex
+        logger.info(f"Starting full sync {run_id} for season {season_year}...")
 
         # 1. Sync leagues from config
         await self.sync_leagues()
-
-        all_results = {}
-        for league_cfg in LEAGUES_CONFIG:
-            code = league_cfg["code"]
-            logger.info(f"Syncing {code}...")
-
-            # 2. Teams
-            teams_result = await self.sync_teams(code, season_year)
-            # 3. Standings
-            standings_result = await self.sync_standings(code, season_year)
-            # 4. Fixtures
-            fixtures_result = await self.sync_fixtures(code, season_year)
-
-            all_results[code] = {
-                "teams": teams_result,
-                "standings": standings_result,
-                "fixtures": fixtures_result,
-            }
+        await self.session.commit()
+
+        if concurrent:
+            all_results = await self._sync_all_concurrently(
+                season_year,
+                max_concurrency or settings.SYNC_MAX_CONCURRENCY,
+                incremental,
+                run_id,
+                force,
+                self.client,
+            )
+        else:
+            all_results = {}
+            for league_cfg in LEAGUES_CONFIG:
+                code = league_cfg["code"]
+                logger.info(f"Syncing {code}...")
+                # 2. Teams, 3. Standings, 4. Fixtures
+                all_results[code] = await self.sync_league(
+                    code, season_year, incremental=incremental, run_id=run_id, force=force
+                )
 
         logger.info("Full sync completed!")
         return all_results
+
+    async def backfill(
+        self,
+        seasons: List[int],
+        league_codes: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        run_id: Optional[str] = None,
+        force: bool = False,
+    ) -> dict:
+        """
+        Load past seasons for model training, one (league, season) pair per task.
+
+        Pairs run in parallel (bounded by `max_concurrency`, default
+        SYNC_MAX_CONCURRENCY), each in its own session; the shared rate limiter
+        keeps them within the API budget. Re-running skips pairs and stages
+        already loaded, so an interrupted backfill resumes (see `sync_league`).
+        Elo ratings are rebuilt once every pair has finished.
+        """
+        run_id = run_id or uuid.uuid4().hex
+        codes = league_codes or [league_cfg["code"] for league_cfg in LEAGUES_CONFIG]
+        pairs = [(code, season) for season in sorted(seasons) for code in codes]
+        logger.info(f"Starting backfill {run_id}: {len(pairs)} league seasons")
+
+        await self.sync_leagues()
+        await self.session.commit()
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or settings.SYNC_MAX_CONCURRENCY))
+        client = self.client
+
+        async def _run(code: str, season: int) -> dict:
+            async with semaphore:
+                logger.info(f"Backfilling {code} {season}...")
+                async with async_session_factory() as session:
+                    try:
+                        return await SyncService(session, client).sync_league(
+                            code, season, run_id=run_id, force=force, backfill=True
+                        )
+                    except Exception as e:
+                        await session.rollback()
+                        logger.error(f"Error backfilling {code} {season}: {e}")
+                        return {"error": str(e)}
+
+        pair_results = await asyncio.gather(*(_run(code, season) for code, season in pairs))
+        results: Dict[int, dict] = {}
+        for (code, season), result in zip(pairs, pair_results):
+            results.setdefault(season, {})[code] = result
+
+        await self.elo_service.rebuild()
+        await self.session.commit()
+        logger.info(f"Backfill {run_id} completed")
+        return results
+
+    @staticmethod
+    async def _sync_all_concurrently(
+        season_year: int,
+        max_concurrency: int,
+        incremental: bool = False,
+        run_id: Optional[str] = None,
+        force: bool = False,
+        client: Optional[APIFootballClient] = None,
+    ) -> dict:
+        """Run every configured league in parallel, one session per league."""
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _run(code: str) -> dict:
+            async with semaphore:
+                logger.info(f"Syncing {code}...")
+                async with async_session_factory() as session:
+                    try:
+                        return await SyncService(session, client).sync_league(
+                            code, season_year, incremental=incremental, run_id=run_id, force=force
+                        )
+                    except Exception as e:
+                        await session.rollback()
+                        logger.error(f"Error syncing league {code}: {e}")
+                        return {"error": str(e)}
+
+        codes = [league_cfg["code"] for league_cfg in LEAGUES_CONFIG]
+        league_results = await asyncio.gather(*(_run(code) for code in codes))
+        return dict(zip(codes, league_results))
+
+
+def _parse_float(value: Any) -> Optional[float]:
+    """API-Football numeric statistic (often a string) as a float."""
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+async def _batched(items: AsyncIterator[T], size: int) -> AsyncIterator[List[T]]:
+    """Group an async iterator into lists of up to `size` items."""
+    batch: List[T] = []
+    async for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,259 @@
+"""
+Football Intelligence Dashboard - Team Feature Service
+Incrementally maintained rolling features per team and season.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.match import Match
+from app.models.season import Season
+from app.models.team_feature import TeamFeature
+from app.repositories.match_repository import MatchRepository
+from app.repositories.team_feature_repository import TeamFeatureRepository
+
+
+class TeamFeatureService:
+    """
+    Folds finished matches into the team_features table in kickoff order.
+
+    Every applied match is flagged (Match.features_applied), so `update()`
+    only reads and applies the season's unflagged ones: constant work per
+    new result. A result that kicked off before a team's last applied match
+    (a suspended match finished, a fixture corrected late) would break the
+    windows' order, so it rebuilds that season instead. xG arrives after the
+    result (see `SyncService.sync_fixture_statistics`) and is patched into
+    the rolling window by `apply_xg()`.
+    """
+
+    WINDOW = 10  # Matches in the rolling form / xG window
+    SHORT_WINDOW = 5
+    VENUE_WINDOW = 5  # Home and away form length
+    EWMA_ALPHA = 0.3  # Weight of the newest match in the goal averages
+    POINTS = {"W": 3, "D": 1, "L": 0}
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.match_repo = MatchRepository(session)
+        self.feature_repo = TeamFeatureRepository(session)
+
+    async def update(self, season_ids: Optional[Iterable[int]] = None) -> int:
+        """Apply matches played since the teams' marks (default: current seasons). Returns matches applied."""
+        if season_ids is None:
+            season_ids = (await self.session.execute(
+                select(Season.id).where(Season.is_current == True)
+            )).scalars().all()
+
+        applied = 0
+        for season_id in set(season_ids):
+            applied += await self._update_season(season_id)
+        if applied:
+            logger.info(f"Team features updated from {applied} matches")
+        return applied
+
+    async def rebuild(self, season_ids: Optional[Iterable[int]] = None) -> int:
+        """Drop the features of the seasons (default: current) and replay their matches."""
+        if season_ids is None:
+            season_ids = (await self.session.execute(
+                select(Season.id).where(Season.is_current == True)
+            )).scalars().all()
+        season_ids = set(season_ids)
+        await self.feature_repo.delete_seasons(season_ids)
+        await self.match_repo.reset_features_applied(season_ids)
+        applied = await self.update(season_ids)
+        logger.info(f"Team features rebuilt from {applied} matches")
+        return applied
+
+    async def apply_xg(self, season_id: int, xg: Dict[int, Tuple[Optional[float], Optional[float]]]) -> int:
+        """Write late (home xG, away xG) per match id into the season's windows. Returns rows changed."""
+        if not xg:
+            return 0
+        changed = []
+        for feature in (await self.feature_repo.get_by_season(season_id)).values():
+            row = self._row(feature)
+            touched = False
+            for entry in row["recent"]:
+                if entry["match_id"] not in xg:
+                    continue
+                home_xg, away_xg = xg[entry["match_id"]]
+                entry["xg_for"], entry["xg_against"] = (home_xg, away_xg) if entry["home"] else (away_xg, home_xg)
+                touched = True
+            if touched:
+                self._derive(row)
+                changed.append(row)
+        if changed:
+            await self.feature_repo.bulk_upsert(changed)
+        return len(changed)
+
+    async def _update_season(self, season_id: int) -> int:
+        pending = await self.match_repo.get_season_unfeatured(season_id)
+        if not pending:
+            return 0
+
+        stored = await self.feature_repo.get_by_season(season_id)
+        marks = {
+            team_id: (feature.last_match_date, feature.last_match_id)
+            for team_id, feature in stored.items()
+            if feature.last_match_id is not None
+        }
+        if any(
+            team_id in marks and (match_date, match_id) < marks[team_id]
+            for match_id, home_id, away_id, _, _, match_date, _, _ in pending
+            for team_id in (home_id, away_id)
+        ):
+            logger.info(f"Late result in season {season_id}, rebuilding its team features")
+            await self.feature_repo.delete_seasons([season_id])
+            await self.match_repo.reset_features_applied([season_id])
+            pending = await self.match_repo.get_season_unfeatured(season_id)
+            stored = {}
+
+        # Claim the matches first: a concurrent updater that read the same ones
+        # finds them flagged and leaves them to us
+        claimed = await self.match_repo.claim_unfeatured(row[0] for row in pending)
+        pending = [row for row in pending if row[0] in claimed]
+        if not pending:
+            return 0
+
+        rows: Dict[int, dict] = {team_id: self._row(feature) for team_id, feature in stored.items()}
+        touched = set()
+        for match_id, home_id, away_id, home_goals, away_goals, match_date, home_xg, away_xg in pending:
+            sides = (
+                (home_id, away_id, True, home_goals, away_goals, home_xg, away_xg),
+                (away_id, home_id, False, away_goals, home_goals, away_xg, home_xg),
+            )
+            for team_id, opponent_id, home, goals_for, goals_against, xg_for, xg_against in sides:
+                row = rows.setdefault(team_id, self._empty_row(season_id, team_id))
+                self._apply(row, match_id, match_date, home, opponent_id, goals_for, goals_against, xg_for, xg_against)
+                touched.add(team_id)
+
+        await self.feature_repo.bulk_upsert([rows[team_id] for team_id in touched])
+        return len(pending)
+
+    @classmethod
+    def _apply(
+        cls,
+        row: dict,
+        match_id: int,
+        match_date: datetime,
+        home: bool,
+        opponent_id: int,
+        goals_for: int,
+        goals_against: int,
+        xg_for: Optional[float],
+        xg_against: Optional[float],
+    ) -> None:
+        """Fold one result into a feature row in place."""
+        result = "W" if goals_for > goals_against else "D" if goals_for == goals_against else "L"
+        row["form"] = ((row["form"] or "") + result)[-cls.WINDOW:]
+        venue = "home_form" if home else "away_form"
+        row[venue] = ((row[venue] or "") + result)[-cls.VENUE_WINDOW:]
+
+        if row["streak_result"] == result:
+            row["streak_length"] += 1
+        else:
+            row["streak_result"], row["streak_length"] = result, 1
+
+        for column, goals in (("goals_for_ewma", goals_for), ("goals_against_ewma", goals_against)):
+            previous = row[column]
+            row[column] = float(goals) if previous is None else cls.EWMA_ALPHA * goals + (1 - cls.EWMA_ALPHA) * previous
+
+        row["recent"] = (row["recent"] + [{
+            "match_id": match_id,
+            "date": match_date.isoformat(),
+            "home": home,
+            "opponent_id": opponent_id,
+            "goals_for": goals_for,
+            "goals_against": goals_against,
+            "xg_for": xg_for,
+            "xg_against": xg_against,
+        }])[-cls.WINDOW:]
+        row["matches_played"] += 1
+        row["last_match_date"] = match_date
+        row["last_match_id"] = match_id
+        cls._derive(row)
+
+    @classmethod
+    def _derive(cls, row: dict) -> None:
+        """Recompute the window aggregates of a row."""
+        form = row["form"] or ""
+        row["points_10"] = sum(cls.POINTS[result] for result in form)
+        row["points_5"] = sum(cls.POINTS[result] for result in form[-cls.SHORT_WINDOW:])
+
+        with_xg = [
+            entry for entry in row["recent"]
+            if entry["xg_for"] is not None and entry["xg_against"] is not None
+        ]
+        row["xg_matches"] = len(with_xg)
+        row["xg_for_avg"] = sum(entry["xg_for"] for entry in with_xg) / len(with_xg) if with_xg else None
+        row["xg_against_avg"] = sum(entry["xg_against"] for entry in with_xg) / len(with_xg) if with_xg else None
+
+    @staticmethod
+    def _row(feature: TeamFeature) -> dict:
+        return {
+            "season_id": feature.season_id,
+            "team_id": feature.team_id,
+            "matches_played": feature.matches_played,
+            "form": feature.form,
+            "points_5": feature.points_5,
+            "points_10": feature.points_10,
+            "home_form": feature.home_form,
+            "away_form": feature.away_form,
+            "streak_result": feature.streak_result,
+            "streak_length": feature.streak_length,
+            "goals_for_ewma": feature.goals_for_ewma,
+            "goals_against_ewma": feature.goals_against_ewma,
+            "xg_matches": feature.xg_matches,
+            "xg_for_avg": feature.xg_for_avg,
+            "xg_against_avg": feature.xg_against_avg,
+            "last_match_date": feature.last_match_date,
+            "last_match_id": feature.last_match_id,
+            "recent": [dict(entry) for entry in feature.recent or []],
+        }
+
+    @staticmethod
+    def _empty_row(season_id: int, team_id: int) -> dict:
+        return {
+            "season_id": season_id,
+            "team_id": team_id,
+            "matches_played": 0,
+            "form": None,
+            "points_5": 0,
+            "points_10": 0,
+            "home_form": None,
+            "away_form": None,
+            "streak_result": None,
+            "streak_length": 0,
+            "goals_for_ewma": None,
+            "goals_against_ewma": None,
+            "xg_matches": 0,
+            "xg_for_avg": None,
+            "xg_against_avg": None,
+            "last_match_date": None,
+            "last_match_id": None,
+            "recent": [],
+        }
+
+    @staticmethod
+    def prediction_inputs(features: Dict[Tuple[int, int], TeamFeature], match: Match) -> dict:
+        """Feature fields stored in a prediction's model_inputs."""
+        inputs = {}
+        for side, team_id in (("home", match.home_team_id), ("away", match.away_team_id)):
+            feature = features.get((match.season_id, team_id))
+            inputs.update({
+                f"{side}_form_10": feature.form if feature else None,
+                f"{side}_streak": (
+                    f"{feature.streak_result}{feature.streak_length}" if feature and feature.streak_result else None
+                ),
+                f"{side}_goals_for_ewma": (
+                    round(feature.goals_for_ewma, 3) if feature and feature.goals_for_ewma is not None else None
+                ),
+                f"{side}_goals_against_ewma": (
+                    round(feature.goals_against_ewma, 3) if feature and feature.goals_against_ewma is not None else None
+                ),
+                f"{side}_rest_days": feature.rest_days(match.match_date) if feature else None,
+            })
+        return inputs
@@ -27,19 +27,50 @@ celery_app.conf.update(
     worker_prefetch_multiplier=1,
 )
 
+# Short live tasks get their own queue so a long sync can't hold up a poll;
+# scoring runs on a solo worker that may start the scoring process pool.
+# Everything else stays on the default "celery" queue (see docker-compose.yml).
+celery_app.conf.task_routes = {
+    "app.workers.tasks.poll_live_matches_task": {"queue": "live"},
+    "app.workers.tasks.refresh_stale_fixtures_task": {"queue": "live"},
+    "app.workers.tasks.apply_live_results_task": {"queue": "scoring"},
+    "app.workers.tasks.compute_predictions_task": {"queue": "scoring"},
+    "app.workers.tasks.compute_projections_task": {"queue": "scoring"},
+}
+
 # Periodic tasks schedule
 celery_app.conf.beat_schedule = {
     "sync-all-leagues": {
         "task": "app.workers.tasks.sync_all_leagues_task",
         "schedule": crontab(minute=0, hour="*/6"),  # Every 6 hours
+        "kwargs": {"concurrent": True, "incremental": True},
     },
     "sync-fixtures": {
         "task": "app.workers.tasks.sync_fixtures_task",
         "schedule": crontab(minute=0, hour="*/2"),  # Every 2 hours
+        "kwargs": {"incremental": True},
+    },
+    "sync-fixtures-full": {
+        "task": "app.workers.tasks.sync_fixtures_task",
+        "schedule": crontab(minute=30, hour=3),  # Daily at 03:30, whole season
+        "kwargs": {"incremental": False},
+    },
+    "refresh-stale-fixtures": {
+        "task": "app.workers.tasks.refresh_stale_fixtures_task",
+        "schedule": crontab(minute="*/15"),  # Every 15 minutes
+    },
+    "poll-live-matches": {
+        "task": "app.workers.tasks.poll_live_matches_task",
+        "schedule": float(settings.LIVE_POLL_INTERVAL_SECONDS),
+        "options": {"expires": settings.LIVE_POLL_INTERVAL_SECONDS},
     },
     "compute-predictions": {
         "task": "app.workers.tasks.compute_predictions_task",
-        "schedule": crontab(minute=0, hour=6),  # Daily at 06:00
+        "schedule": crontab(minute=0, hour=6),  # Daily sweep at 06:00; syncs refresh in between
+    },
+    "compute-projections": {
+        "task": "app.workers.tasks.compute_projections_task",
+        "schedule": crontab(minute=15, hour=6),  # Daily at 06:15, after predictions
     },
     "send-weekly-g3z3-digest": {
         "task": "app.workers.tasks.send_weekly_digest_task",
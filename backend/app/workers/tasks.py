@@ -4,89 +4,291 @@ Background task definitions for data sync, predictions, and notifications.
 """
 
 import asyncio
+from typing import List, Optional
+
+from celery import chord
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
 from loguru import logger
 
 from app.workers import celery_app
 from app.core.database import async_session_factory
+from app.core.http import http_clients
+from app.core.process_pool import process_pool
+
+# One event loop per worker process, so pooled HTTP/DB connections survive between tasks
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
 
 
 def run_async(coro):
     """Helper to run async functions in Celery sync context."""
-    loop = asyncio.new_event_loop()
+    return _get_loop().run_until_complete(coro)
+
+
+@worker_process_init.connect
+def _open_worker_resources(**kwargs):
+    """Open the shared HTTP pools in each process that runs tasks (prefork child or solo worker)."""
+    run_async(http_clients.open())
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _close_worker_resources(**kwargs):
+    """
+    Close the HTTP pools, the scoring processes and the worker's event loop.
+
+    Prefork children get worker_process_shutdown; the solo pool only sends
+    worker_shutdown, in the process that ran the tasks.
+    """
+    global _loop
+    process_pool.shutdown()
+    if _loop is None or _loop.is_closed():
+        return
     try:
-        return loop.run_until_complete(coro)
+        _loop.run_until_complete(http_clients.close())
     finally:
-        loop.close()
+        _loop.close()
+        _loop = None
+
 
+@celery_app.task(
+    bind=True,
+    name="app.workers.tasks.sync_all_leagues_task",
+    max_retries=3,
+    default_retry_delay=300,
+)
+def sync_all_leagues_task(self, season: int = 2024, concurrent: bool = False, incremental: bool = False):
+    """
+    Sync all leagues from API-Football.
 
-@celery_app.task(name="app.workers.tasks.sync_all_leagues_task")
-def sync_all_leagues_task(season: int = 2024):
-    """Sync all leagues from API-Football."""
+    The task id is the sync run id, so a retry resumes after the last
+    completed stage instead of starting over.
+    """
     async def _sync():
         async with async_session_factory() as session:
             from app.services.sync_service import SyncService
             service = SyncService(session)
-            result = await service.sync_all(season_year=season)
+            result = await service.sync_all(
+                season_year=season,
+                concurrent=concurrent,
+                incremental=incremental,
+                run_id=self.request.id,
+            )
             await session.commit()
             logger.info(f"Full sync completed: {result}")
             return result
 
-    return run_async(_sync())
+    result = run_async(_sync())
+    failed = [
+        code for code, stages in result.items()
+        if "error" in stages or any("error" in stage for stage in stages.values() if isinstance(stage, dict))
+    ]
+    if failed and self.request.retries < self.max_retries:
+        logger.warning(f"Sync failed for {failed}; retrying run {self.request.id}")
+        raise self.retry()
+    return result
+
+
+@celery_app.task(bind=True, name="app.workers.tasks.backfill_task")
+def backfill_task(self, from_season: int, to_season: int, leagues: Optional[List[str]] = None, force: bool = False):
+    """
+    Fan a historical backfill out as one task per (league, season).
+
+    The pair tasks share this task's id as their sync run id; the Redis rate
+    limiter paces them across workers at backfill priority. Elo ratings are
+    rebuilt once all pairs have finished.
+    """
+    from app.core.config import LEAGUES_CONFIG
+
+    async def _seed():
+        async with async_session_factory() as session:
+            from app.services.sync_service import SyncService
+            await SyncService(session).sync_leagues()
+            await session.commit()
+
+    run_async(_seed())
+    codes = leagues or [league["code"] for league in LEAGUES_CONFIG]
+    pairs = [
+        backfill_league_season_task.s(code, season, run_id=self.request.id, force=force)
+        for season in range(from_season, to_season + 1)
+        for code in codes
+    ]
+    chord(pairs)(rebuild_ratings_task.si())
+    logger.info(f"Backfill {self.request.id}: {len(pairs)} league seasons queued")
+    return {"run_id": self.request.id, "queued": len(pairs)}
+
+
+@celery_app.task(
+    bind=True,
+    name="app.workers.tasks.backfill_league_season_task",
+    max_retries=5,
+    default_retry_delay=900,
+)
+def backfill_league_season_task(self, league_code: str, season: int, run_id: str, force: bool = False):
+    """Load one past league season; retries resume after the last completed stage."""
+    async def _backfill():
+        async with async_session_factory() as session:
+            from app.services.sync_service import SyncService
+            return await SyncService(session).sync_league(
+                league_code, season, run_id=run_id, force=force, backfill=True
+            )
+
+    result = run_async(_backfill())
+    if any("error" in stage for stage in result.values()) and self.request.retries < self.max_retries:
+        logger.warning(f"Backfill of {league_code} {season} failed; retrying")
+        # A retry must not redo stages this attempt completed
+        raise self.retry(kwargs={**self.request.kwargs, "force": False})
+    return result
+
+
+@celery_app.task(name="app.workers.tasks.rebuild_ratings_task")
+def rebuild_ratings_task():
+    """Replay every played match into the Elo ratings."""
+    async def _rebuild():
+        async with async_session_factory() as session:
+            from app.services.elo_service import EloService
+            applied = await EloService(session).rebuild()
+            await session.commit()
+            return {"matches_applied": applied}
+
+    return run_async(_rebuild())
 
 
 @celery_app.task(name="app.workers.tasks.sync_fixtures_task")
-def sync_fixtures_task(season: int = 2024):
-    """Sync fixtures for all leagues."""
+def sync_fixtures_task(season: int = 2024, incremental: bool = False):
+    """
+    Sync fixtures for all leagues (only the rolling date window if `incremental`).
+
+    Each league's upcoming predictions are refreshed after its fixtures.
+    """
     async def _sync():
         async with async_session_factory() as session:
             from app.services.sync_service import SyncService
             from app.core.config import LEAGUES_CONFIG
+            from app.integrations.football_api import APIFootballError
 
             service = SyncService(session)
             results = {}
             for league in LEAGUES_CONFIG:
-                result = await service.sync_fixtures(league["code"], season)
+                try:
+                    result = await service.sync_fixtures(
+                        league["code"], season, incremental=incremental
+                    )
+                    if "error" not in result:
+                        result["predictions"] = await service.refresh_predictions(league["code"], season)
+                    await session.commit()
+                except APIFootballError as e:
+                    # Drop the league's partial writes; the other leagues still sync
+                    await session.rollback()
+                    result = {"error": str(e)}
                 results[league["code"]] = result
-            await session.commit()
             logger.info(f"Fixtures sync completed: {results}")
             return results
 
     return run_async(_sync())
 
 
+@celery_app.task(name="app.workers.tasks.refresh_stale_fixtures_task")
+def refresh_stale_fixtures_task():
+    """Re-fetch in-progress, imminent and score-less finished fixtures by ID."""
+    async def _refresh():
+        async with async_session_factory() as session:
+            from app.services.sync_service import SyncService
+            result = await SyncService(session).refresh_stale_fixtures()
+            await session.commit()
+            return result
+
+    return run_async(_refresh())
+
+
+@celery_app.task(name="app.workers.tasks.poll_live_matches_task")
+def poll_live_matches_task():
+    """Poll in-play fixtures; a no-op unless matches are live or about to kick off."""
+    import redis
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    lock = None
+    try:
+        # Skip if the previous poll is still running
+        lock = redis.Redis.from_url(settings.REDIS_URL).lock(
+            "live-poller", timeout=settings.LIVE_POLL_INTERVAL_SECONDS * 3, blocking=False
+        )
+        if not lock.acquire():
+            return {"skipped": True, "reason": "previous poll still running"}
+    except redis.RedisError as e:
+        logger.warning(f"Live poller lock unavailable: {e}")
+        lock = None
+
+    async def _poll():
+        async with async_session_factory() as session:
+            from app.services.live_service import LiveService
+            return await LiveService(session).poll()
+
+    try:
+        result = run_async(_poll())
+    finally:
+        if lock is not None:
+            try:
+                lock.release()
+            except redis.RedisError:
+                pass
+    if result.get("finished_seasons"):
+        # Scores are committed and published; the re-scoring runs elsewhere
+        apply_live_results_task.delay(result["finished_seasons"])
+    return result
+
+
+@celery_app.task(name="app.workers.tasks.apply_live_results_task")
+def apply_live_results_task(season_ids: List[int]):
+    """Fold results the live poller saw finish into features, Elo and predictions."""
+    async def _apply():
+        async with async_session_factory() as session:
+            from app.services.live_service import LiveService
+            return await LiveService(session).apply_results(season_ids)
+
+    return run_async(_apply())
+
+
 @celery_app.task(name="app.workers.tasks.compute_predictions_task")
 def compute_predictions_task():
-    """Compute predictions for upcoming matches."""
+    """
+    Sweep the predictions of every current season.
+
+    Syncs refresh the seasons they changed; this catches anything they
+    missed (e.g. a model version change) and writes only changed rows.
+    """
     async def _predict():
         async with async_session_factory() as session:
             from app.services.prediction_service import PredictionService
-            from app.repositories.match_repository import MatchRepository
-            from sqlalchemy import select
-            from app.models.season import Season
-            from app.models.match import Match
 
-            pred_service = PredictionService(session)
-            match_repo = MatchRepository(session)
+            count = await PredictionService(session).refresh_current()
+            await session.commit()
+            logger.info(f"Predictions refreshed for {count} matches")
+            return {"predictions_written": count}
 
-            # Get all current seasons
-            seasons = (await session.execute(
-                select(Season).where(Season.is_current == True)
-            )).scalars().all()
+    return run_async(_predict())
 
-            count = 0
-            for season in seasons:
-                upcoming = await match_repo.get_upcoming(season.id)
-                for match in upcoming:
-                    if not match.prediction:
-                        prediction = await pred_service.predict_match(match)
-                        session.add(prediction)
-                        count += 1
 
+@celery_app.task(name="app.workers.tasks.compute_projections_task")
+def compute_projections_task():
+    """Simulate the remaining fixtures of every current season (warms the projections cache)."""
+    async def _project():
+        async with async_session_factory() as session:
+            from app.services.projection_service import ProjectionService
+            projections = await ProjectionService(session).project_current()
+            # Head-to-head records computed along the way are kept
             await session.commit()
-            logger.info(f"Predictions computed for {count} matches")
-            return {"predictions_created": count}
+            return {code: projection["remaining_fixtures"] for code, projection in projections.items()}
 
-    return run_async(_predict())
+    return run_async(_project())
 
 
 @celery_app.task(name="app.workers.tasks.send_weekly_digest_task")
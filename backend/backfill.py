@@ -0,0 +1,73 @@
+"""
+Backfill past seasons from API-Football for model training.
+
+Each (league, season) pair is synced teams → standings → fixtures with
+fixtures streamed into the bulk write path. Backfilled seasons are stored
+with is_current=False; the current season is left untouched. Re-running
+the same command skips what is already loaded.
+
+Usage:
+    python backfill.py --from-season 2019 --to-season 2023
+    python backfill.py --from-season 2021 --to-season 2023 --leagues PL BL1 --concurrency 2
+    python backfill.py --from-season 2019 --to-season 2023 --celery   # fan out to workers
+"""
+
+import argparse
+import asyncio
+import time
+
+from loguru import logger
+
+from app.core.config import LEAGUES_CONFIG, get_settings
+from app.core.database import async_session_factory, engine
+from app.services.sync_service import SyncService
+
+settings = get_settings()
+
+
+async def backfill(seasons, leagues, concurrency: int, run_id, force: bool) -> None:
+    started = time.perf_counter()
+    async with async_session_factory() as session:
+        results = await SyncService(session).backfill(
+            seasons, league_codes=leagues, max_concurrency=concurrency, run_id=run_id, force=force
+        )
+
+    failed = [
+        f"{code} {season}"
+        for season, leagues_results in results.items()
+        for code, stages in leagues_results.items()
+        if "error" in stages or any("error" in stage for stage in stages.values() if isinstance(stage, dict))
+    ]
+    logger.info(f"Backfill finished in {time.perf_counter() - started:.1f}s")
+    if failed:
+        logger.warning(f"Incomplete, re-run to resume: {', '.join(failed)}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--from-season", type=int, required=True)
+    parser.add_argument("--to-season", type=int, required=True)
+    parser.add_argument("--leagues", nargs="*", help="League codes (default: all configured)")
+    parser.add_argument("--concurrency", type=int, default=settings.SYNC_MAX_CONCURRENCY,
+                        help="League seasons synced in parallel")
+    parser.add_argument("--run-id", help="Resume a previous run's checkpoints")
+    parser.add_argument("--force", action="store_true", help="Reload stages that were already loaded")
+    parser.add_argument("--celery", action="store_true", help="Queue the backfill on the Celery workers")
+    args = parser.parse_args()
+
+    known = {league["code"] for league in LEAGUES_CONFIG}
+    leagues = [code.upper() for code in args.leagues] if args.leagues else None
+    unknown = sorted(set(leagues or []) - known)
+    if unknown:
+        parser.error(f"Unknown league codes: {', '.join(unknown)}")
+    if args.from_season > args.to_season:
+        parser.error("--from-season must not be after --to-season")
+
+    if args.celery:
+        from app.workers.tasks import backfill_task
+        task = backfill_task.delay(args.from_season, args.to_season, leagues, args.force)
+        logger.info(f"Backfill queued as task {task.id}")
+    else:
+        seasons = list(range(args.from_season, args.to_season + 1))
+        asyncio.run(backfill(seasons, leagues, args.concurrency, args.run_id, args.force))
@@ -0,0 +1,130 @@
+"""
+Backtest the prediction models on finished seasons.
+
+Replays each league's played matches in kickoff order, rebuilding the
+standings, team features and head-to-head records as of every match date
+in memory, and scores each model's 1X2 probabilities with the Brier score,
+log-loss, ranked probability score and calibration curves. Leagues replay
+in parallel worker processes.
+
+With --baseline the run fails (exit status 1) when a model's Brier score or
+RPS is worse than the saved report by more than --tolerance, so it can gate
+model and weight changes.
+
+Usage:
+    python backtest.py --seasons 2022 2023
+    python backtest.py --seasons 2023 --leagues PL BL1 --models v1.0-bayesian --weights xg=0.2
+    python backtest.py --seasons 2023 --output baseline.json
+    python backtest.py --seasons 2023 --baseline baseline.json --tolerance 0.002
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from loguru import logger
+
+from app.core.config import LEAGUES_CONFIG, get_settings
+from app.core.database import async_session_factory, engine
+from app.repositories.league_repository import LeagueRepository
+from app.repositories.match_repository import MatchRepository
+from app.services import backtest
+from app.services.prediction_service import MODEL_VERSIONS, PredictionService
+
+settings = get_settings()
+
+GATED_METRICS = ("brier", "rps")
+
+
+async def load_histories(leagues) -> dict:
+    histories = {}
+    async with async_session_factory() as session:
+        league_repo = LeagueRepository(session)
+        match_repo = MatchRepository(session)
+        for code in leagues:
+            league = await league_repo.get_by_code(code)
+            if league is None:
+                logger.warning(f"League {code} not in the database, skipped")
+                continue
+            histories[code] = await match_repo.get_league_history(league.id)
+    await engine.dispose()
+    return histories
+
+
+def regressions(report: dict, baseline: dict, tolerance: float) -> list:
+    failed = []
+    for model, scores in report["models"].items():
+        previous = baseline.get("models", {}).get(model)
+        if not previous or not scores["matches"]:
+            continue
+        for metric in GATED_METRICS:
+            if scores[metric] > previous[metric] + tolerance:
+                failed.append(f"{model} {metric} {scores[metric]:.5f} > {previous[metric]:.5f}")
+    return failed
+
+
+def parse_weights(parser: argparse.ArgumentParser, items) -> dict:
+    weights = {}
+    for item in items or []:
+        name, _, value = item.partition("=")
+        if name not in PredictionService.WEIGHTS:
+            parser.error(f"Unknown weight {name!r}; expected one of {', '.join(PredictionService.WEIGHTS)}")
+        try:
+            weights[name] = float(value)
+        except ValueError:
+            parser.error(f"Weight {name} needs a number, got {value!r}")
+    return weights
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seasons", nargs="+", required=True, help="Season years to score")
+    parser.add_argument("--leagues", nargs="*", help="League codes (default: all configured)")
+    parser.add_argument("--models", nargs="*", choices=MODEL_VERSIONS, default=list(MODEL_VERSIONS))
+    parser.add_argument("--weights", nargs="*", metavar="NAME=VALUE", help="Override v1 model weights")
+    parser.add_argument("--decay", type=float, default=settings.DIXON_COLES_DECAY_PER_DAY,
+                        help="Dixon-Coles time decay per day")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU; 1 runs inline)")
+    parser.add_argument("--output", help="Write the JSON report here")
+    parser.add_argument("--baseline", help="Report to compare against; exit 1 on a regression")
+    parser.add_argument("--tolerance", type=float, default=0.001, help="Allowed worsening of Brier/RPS")
+    args = parser.parse_args()
+
+    known = {league["code"] for league in LEAGUES_CONFIG}
+    leagues = [code.upper() for code in args.leagues] if args.leagues else [league["code"] for league in LEAGUES_CONFIG]
+    unknown = sorted(set(leagues) - known)
+    if unknown:
+        parser.error(f"Unknown league codes: {', '.join(unknown)}")
+    weights = parse_weights(parser, args.weights)
+
+    started = time.perf_counter()
+    histories = asyncio.run(load_histories(leagues))
+    loaded = time.perf_counter()
+    report = backtest.run(histories, args.seasons, args.models, weights, args.decay, args.workers)
+    logger.info(
+        f"Backtest of {len(histories)} leagues loaded in {loaded - started:.1f}s, "
+        f"replayed in {time.perf_counter() - loaded:.1f}s"
+    )
+    for model, scores in report["models"].items():
+        if scores["matches"]:
+            logger.info(
+                f"{model}: {scores['matches']} matches, brier {scores['brier']:.4f}, "
+                f"log-loss {scores['log_loss']:.4f}, rps {scores['rps']:.4f}"
+            )
+        else:
+            logger.warning(f"{model}: no played matches in seasons {', '.join(args.seasons)}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Report written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            failed = regressions(report, json.load(f), args.tolerance)
+        if failed:
+            logger.error(f"Worse than {args.baseline}: {'; '.join(failed)}")
+            sys.exit(1)
+        logger.info(f"No regression against {args.baseline}")
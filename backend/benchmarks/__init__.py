@@ -0,0 +1 @@
+"""Offline API-Football stand-in and sync benchmarks."""
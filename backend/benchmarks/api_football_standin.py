@@ -0,0 +1,475 @@
+"""
+Football Intelligence Dashboard - API-Football Stand-in Server
+Offline replacement for the v3 endpoints used by APIFootballClient.
+
+Modes:
+    synth   Generate deterministic seasons on the fly (default).
+    record  Proxy to the real API and store every response under --data-dir.
+    replay  Serve recorded responses, synthesizing anything not recorded.
+
+Usage (from backend/):
+    python -m benchmarks.api_football_standin --port 8099 --latency-ms 80
+    API_FOOTBALL_BASE_URL=http://127.0.0.1:8099 uvicorn app.main:app
+"""
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import math
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+UPSTREAM_URL = "https://v3.football.api-sports.io"
+# Kept standalone (no `app` imports) so the server runs without the app's database settings
+LIVE_STATUSES = ("1H", "HT", "2H", "ET", "P")
+
+
+class SeasonSynthesizer:
+    """Deterministic double round-robin seasons with Poisson scorelines."""
+
+    def __init__(self, teams_per_league: int = 20, seed: int = 2024):
+        self.teams_per_league = teams_per_league - teams_per_league % 2
+        self.seed = seed
+        self._seasons: Dict[Tuple[int, int], dict] = {}
+
+    @staticmethod
+    def team_id(league_id: int, index: int) -> int:
+        return league_id * 1000 + index
+
+    def season(self, league_id: int, season: int) -> dict:
+        """Teams, fixtures and strengths for one league season (cached)."""
+        key = (league_id, season)
+        if key not in self._seasons:
+            self._seasons[key] = self._build(league_id, season)
+        return self._seasons[key]
+
+    def _build(self, league_id: int, season: int) -> dict:
+        rng = random.Random(f"{self.seed}:{league_id}:{season}")
+        n = self.teams_per_league
+        team_ids = [self.team_id(league_id, i) for i in range(n)]
+        strength = {tid: rng.uniform(0.6, 1.6) for tid in team_ids}
+        teams = [
+            {
+                "team": {
+                    "id": tid,
+                    "name": f"League {league_id} Team {i + 1}",
+                    "code": f"T{i + 1:02d}",
+                    "country": "Standin",
+                    "founded": 1880 + i,
+                    "national": False,
+                    "logo": f"https://media.api-sports.io/football/teams/{tid}.png",
+                },
+                "venue": {"id": tid, "name": f"Stadium {tid}", "city": "Standin"},
+            }
+            for i, tid in enumerate(team_ids)
+        ]
+
+        # Circle-method double round robin, one round per week from August
+        rotation = team_ids[:]
+        rounds = []
+        for _ in range(n - 1):
+            rounds.append([(rotation[i], rotation[n - 1 - i]) for i in range(n // 2)])
+            rotation = [rotation[0], rotation[-1]] + rotation[1:-1]
+        rounds += [[(away, home) for home, away in pairs] for pairs in rounds]
+
+        kickoff = datetime(season, 8, 10, 15, 0, tzinfo=timezone.utc)
+        fixtures = []
+        number = 0
+        for round_no, pairs in enumerate(rounds, start=1):
+            for home, away in pairs:
+                number += 1
+                lam = 1.45 * strength[home] / strength[away] ** 0.5
+                mu = 1.15 * strength[away] / strength[home] ** 0.5
+                fixtures.append({
+                    "id": league_id * 1_000_000 + (season % 100) * 10_000 + number,
+                    "date": kickoff + timedelta(days=7 * (round_no - 1), hours=(number % 4) * 2),
+                    "round": round_no,
+                    "home": home,
+                    "away": away,
+                    "goals": (_poisson(rng, lam), _poisson(rng, mu)),
+                    "ht": (_poisson(rng, lam / 2), _poisson(rng, mu / 2)),
+                })
+        return {"teams": teams, "fixtures": fixtures, "league_id": league_id, "season": season}
+
+    # --- API shapes ---
+
+    def fixture_payload(self, league_id: int, season: int, fx: dict, now: datetime) -> dict:
+        elapsed = (now - fx["date"]).total_seconds() / 60
+        if elapsed < 0:
+            status, goals, ht = "NS", (None, None), (None, None)
+        elif elapsed < 45:
+            status, goals, ht = "1H", tuple(min(g, int(elapsed / 30)) for g in fx["ht"]), (None, None)
+        elif elapsed < 60:
+            status, goals, ht = "HT", fx["ht"], fx["ht"]
+        elif elapsed < 110:
+            status, goals, ht = "2H", fx["ht"], fx["ht"]
+        else:
+            status, goals, ht = "FT", fx["goals"], fx["ht"]
+        return {
+            "fixture": {
+                "id": fx["id"],
+                "referee": f"Referee {fx['id'] % 37}",
+                "timezone": "UTC",
+                "date": fx["date"].isoformat(),
+                "timestamp": int(fx["date"].timestamp()),
+                "venue": {"id": fx["home"], "name": f"Stadium {fx['home']}", "city": "Standin"},
+                "status": {"long": status, "short": status, "elapsed": max(0, min(90, int(elapsed)))},
+            },
+            "league": {"id": league_id, "season": season, "round": f"Regular Season - {fx['round']}"},
+            "teams": {"home": {"id": fx["home"]}, "away": {"id": fx["away"]}},
+            "goals": {"home": goals[0], "away": goals[1]},
+            "score": {
+                "halftime": {"home": ht[0], "away": ht[1]},
+                "fulltime": {"home": goals[0] if status == "FT" else None, "away": goals[1] if status == "FT" else None},
+            },
+            "statistics": self._statistics(fx) if status == "FT" else [],
+        }
+
+    @staticmethod
+    def _statistics(fx: dict) -> List[dict]:
+        rng = random.Random(fx["id"])
+        return [
+            {
+                "team": {"id": team_id},
+                "statistics": [
+                    {"type": "Total Shots", "value": rng.randint(5, 20)},
+                    {"type": "Ball Possession", "value": f"{rng.randint(35, 65)}%"},
+                    {"type": "expected_goals", "value": f"{max(0.1, goals + rng.uniform(-0.8, 0.8)):.2f}"},
+                ],
+            }
+            for team_id, goals in ((fx["home"], fx["goals"][0]), (fx["away"], fx["goals"][1]))
+        ]
+
+    def standings_payload(self, league_id: int, season: int, now: datetime) -> List[dict]:
+        data = self.season(league_id, season)
+        table = {
+            t["team"]["id"]: {
+                "all": _blank_split(), "home": _blank_split(), "away": _blank_split(), "form": "",
+            }
+            for t in data["teams"]
+        }
+        for fx in sorted(data["fixtures"], key=lambda f: f["date"]):
+            if (now - fx["date"]).total_seconds() / 60 < 110:
+                continue
+            hg, ag = fx["goals"]
+            for team_id, side, gf, ga in ((fx["home"], "home", hg, ag), (fx["away"], "away", ag, hg)):
+                row = table[team_id]
+                result = "win" if gf > ga else "draw" if gf == ga else "lose"
+                for split in (row["all"], row[side]):
+                    split["played"] += 1
+                    split[result] += 1
+                    split["goals"]["for"] += gf
+                    split["goals"]["against"] += ga
+                row["form"] = (row["form"] + {"win": "W", "draw": "D", "lose": "L"}[result])[-5:]
+
+        def points(team_id: int) -> int:
+            split = table[team_id]["all"]
+            return split["win"] * 3 + split["draw"]
+
+        def goal_diff(team_id: int) -> int:
+            goals = table[team_id]["all"]["goals"]
+            return goals["for"] - goals["against"]
+
+        order = sorted(table, key=lambda tid: (-points(tid), -goal_diff(tid), tid))
+        return [
+            {
+                "rank": rank,
+                "team": {"id": tid},
+                "points": points(tid),
+                "goalsDiff": goal_diff(tid),
+                "form": table[tid]["form"][::-1],
+                "description": "Promotion" if rank <= 3 else "Relegation" if rank > len(order) - 3 else None,
+                "all": table[tid]["all"],
+                "home": table[tid]["home"],
+                "away": table[tid]["away"],
+            }
+            for rank, tid in enumerate(order, start=1)
+        ]
+
+
+class StandinAPI:
+    """Request handling, recording/replay, latency and quota simulation."""
+
+    def __init__(
+        self,
+        mode: str,
+        data_dir: str,
+        synthesizer: SeasonSynthesizer,
+        default_season: int,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        rate_limit: int = 0,
+        daily_quota: int = 0,
+        upstream: str = UPSTREAM_URL,
+    ):
+        self.mode = mode
+        self.data_dir = data_dir
+        self.synth = synthesizer
+        self.default_season = default_season
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit = rate_limit
+        self.daily_quota = daily_quota
+        self.upstream = upstream
+        self._minute_window = (0, 0)  # (minute, requests)
+        self._day_window = ("", 0)  # (date, requests)
+        self._upstream_client: Optional[httpx.AsyncClient] = None
+
+    # --- quota ---
+
+    def _quota_headers(self) -> Tuple[Dict[str, str], bool]:
+        """Count the request and return (headers, rejected)."""
+        now = time.time()
+        minute = int(now // 60)
+        day = datetime.now(timezone.utc).date().isoformat()
+        minute_count = self._minute_window[1] + 1 if self._minute_window[0] == minute else 1
+        day_count = self._day_window[1] + 1 if self._day_window[0] == day else 1
+        self._minute_window = (minute, minute_count)
+        self._day_window = (day, day_count)
+
+        headers: Dict[str, str] = {}
+        rejected = False
+        if self.rate_limit:
+            headers["X-RateLimit-Limit"] = str(self.rate_limit)
+            headers["X-RateLimit-Remaining"] = str(max(0, self.rate_limit - minute_count))
+            rejected = minute_count > self.rate_limit
+        if self.daily_quota:
+            headers["x-ratelimit-requests-limit"] = str(self.daily_quota)
+            headers["x-ratelimit-requests-remaining"] = str(max(0, self.daily_quota - day_count))
+            rejected = rejected or day_count > self.daily_quota
+        return headers, rejected
+
+    # --- recording ---
+
+    def _record_path(self, endpoint: str, params: Dict[str, str]) -> str:
+        normalized = urlencode(sorted(params.items()))
+        digest = hashlib.sha1(f"{endpoint}?{normalized}".encode("utf-8")).hexdigest()
+        return os.path.join(self.data_dir, endpoint.strip("/").replace("/", "_"), f"{digest}.json.gz")
+
+    def _load_recording(self, endpoint: str, params: Dict[str, str]) -> Optional[dict]:
+        path = self._record_path(endpoint, params)
+        if not os.path.exists(path):
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)["body"]
+
+    def _save_recording(self, endpoint: str, params: Dict[str, str], body: dict) -> None:
+        path = self._record_path(endpoint, params)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump({"endpoint": endpoint, "params": params, "body": body}, f)
+
+    async def _fetch_upstream(self, endpoint: str, params: Dict[str, str]) -> dict:
+        if self._upstream_client is None:
+            self._upstream_client = httpx.AsyncClient(
+                base_url=self.upstream,
+                headers={"x-apisports-key": os.environ.get("API_FOOTBALL_KEY", "")},
+                timeout=30.0,
+            )
+        response = await self._upstream_client.get(endpoint, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    # --- dispatch ---
+
+    async def handle(self, endpoint: str, params: Dict[str, str]) -> JSONResponse:
+        if self.latency_ms or self.jitter_ms:
+            await asyncio.sleep(max(0.0, self.latency_ms + random.uniform(-1, 1) * self.jitter_ms) / 1000)
+
+        headers, rejected = self._quota_headers()
+        if rejected:
+            body = _envelope(endpoint, params, [])
+            body["errors"] = {"rateLimit": "Too many requests. Your rate limit is exceeded."}
+            return JSONResponse(body, headers=headers)
+
+        body = None
+        if self.mode == "record":
+            body = await self._fetch_upstream(endpoint, params)
+            self._save_recording(endpoint, params, body)
+        elif self.mode == "replay":
+            body = self._load_recording(endpoint, params)
+        if body is None:
+            body = _envelope(endpoint, params, self.synthesize(endpoint, params))
+        return JSONResponse(body, headers=headers)
+
+    def synthesize(self, endpoint: str, params: Dict[str, str]) -> list:
+        now = datetime.now(timezone.utc)
+        season = int(params.get("season", self.default_season))
+        league_id = int(params["league"]) if "league" in params else None
+
+        if endpoint == "/teams":
+            return self.synth.season(league_id, season)["teams"] if league_id else []
+        if endpoint == "/standings":
+            if not league_id:
+                return []
+            return [{"league": {"id": league_id, "season": season, "standings": [
+                self.synth.standings_payload(league_id, season, now)
+            ]}}]
+        if endpoint == "/fixtures":
+            return self._fixtures(params, league_id, season, now)
+        if endpoint == "/fixtures/headtohead":
+            return self._head_to_head(params, now)
+        if endpoint == "/players/topscorers":
+            return self._top_scorers(league_id, season) if league_id else []
+        if endpoint == "/predictions":
+            return [_prediction(int(params.get("fixture", 0)))]
+        return []
+
+    def _fixtures(self, params: Dict[str, str], league_id: Optional[int], season: int, now: datetime) -> list:
+        if "id" in params or "ids" in params:
+            wanted = {int(i) for i in (params.get("ids") or params["id"]).split("-") if i}
+            found = []
+            for fixture_id in wanted:
+                league, fx_season = fixture_id // 1_000_000, 2000 + (fixture_id // 10_000) % 100
+                for fx in self.synth.season(league, fx_season)["fixtures"]:
+                    if fx["id"] == fixture_id:
+                        found.append(self.synth.fixture_payload(league, fx_season, fx, now))
+            return found
+
+        if "live" in params:
+            leagues = [int(x) for x in params["live"].split("-")] if params["live"] != "all" else [
+                lid for lid, _ in self.synth._seasons
+            ]
+            items = [
+                self.synth.fixture_payload(lid, self.default_season, fx, now)
+                for lid in set(leagues)
+                for fx in self.synth.season(lid, self.default_season)["fixtures"]
+            ]
+            return [item for item in items if item["fixture"]["status"]["short"] in LIVE_STATUSES]
+
+        if not league_id:
+            return []
+        items = [
+            self.synth.fixture_payload(league_id, season, fx, now)
+            for fx in self.synth.season(league_id, season)["fixtures"]
+        ]
+        if "from" in params:
+            items = [i for i in items if i["fixture"]["date"][:10] >= params["from"]]
+        if "to" in params:
+            items = [i for i in items if i["fixture"]["date"][:10] <= params["to"]]
+        if "status" in params:
+            statuses = set(params["status"].split("-"))
+            items = [i for i in items if i["fixture"]["status"]["short"] in statuses]
+        if "last" in params:
+            items = [i for i in items if i["fixture"]["status"]["short"] == "FT"][-int(params["last"]):]
+        if "next" in params:
+            items = [i for i in items if i["fixture"]["status"]["short"] == "NS"][:int(params["next"])]
+        return items
+
+    def _head_to_head(self, params: Dict[str, str], now: datetime) -> list:
+        team1, team2 = (int(x) for x in params["h2h"].split("-"))
+        league_id = team1 // 1000
+        items = []
+        for season in range(self.default_season - 4, self.default_season + 1):
+            for fx in self.synth.season(league_id, season)["fixtures"]:
+                if {fx["home"], fx["away"]} == {team1, team2}:
+                    item = self.synth.fixture_payload(league_id, season, fx, now)
+                    if item["fixture"]["status"]["short"] == "FT":
+                        items.append(item)
+        items.sort(key=lambda i: i["fixture"]["date"], reverse=True)
+        return items[:int(params.get("last", 10))]
+
+    def _top_scorers(self, league_id: int, season: int) -> list:
+        rng = random.Random(f"scorers:{league_id}:{season}")
+        teams = self.synth.season(league_id, season)["teams"]
+        return [
+            {
+                "player": {"id": league_id * 100_000 + i, "name": f"Player {i + 1}"},
+                "statistics": [{
+                    "team": {"id": teams[i % len(teams)]["team"]["id"]},
+                    "goals": {"total": 25 - i + rng.randint(0, 2)},
+                }],
+            }
+            for i in range(20)
+        ]
+
+
+def _poisson(rng: random.Random, lam: float) -> int:
+    threshold, k, p = math.exp(-lam), 0, 1.0
+    while True:
+        p *= rng.random()
+        if p <= threshold:
+            return k
+        k += 1
+
+
+def _blank_split() -> dict:
+    return {"played": 0, "win": 0, "draw": 0, "lose": 0, "goals": {"for": 0, "against": 0}}
+
+
+def _prediction(fixture_id: int) -> dict:
+    rng = random.Random(fixture_id)
+    home, draw = rng.randint(25, 60), rng.randint(15, 35)
+    return {"predictions": {"percent": {"home": f"{home}%", "draw": f"{draw}%", "away": f"{100 - home - draw}%"}}}
+
+
+def _envelope(endpoint: str, params: Dict[str, str], response: list) -> dict:
+    return {
+        "get": endpoint.strip("/"),
+        "parameters": params,
+        "errors": [],
+        "results": len(response),
+        "paging": {"current": 1, "total": 1},
+        "response": response,
+    }
+
+
+def create_app(api: StandinAPI) -> FastAPI:
+    app = FastAPI(title="API-Football stand-in")
+
+    for endpoint in ("/fixtures", "/fixtures/headtohead", "/fixtures/statistics", "/standings",
+                     "/teams", "/players/topscorers", "/predictions", "/leagues"):
+        async def route(request: Request, _endpoint: str = endpoint) -> JSONResponse:
+            return await api.handle(_endpoint, dict(request.query_params))
+        app.add_api_route(endpoint, route, methods=["GET"])
+
+    @app.get("/status")
+    async def status():
+        return {"mode": api.mode, "requests_today": api._day_window[1]}
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=("synth", "record", "replay"), default="synth")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--data-dir", default=os.path.join("data", "api_football_recordings"))
+    parser.add_argument("--upstream", default=UPSTREAM_URL)
+    parser.add_argument("--season", type=int, default=2024, help="Season used when a request omits one")
+    parser.add_argument("--teams", type=int, default=20, help="Teams per synthesized league")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=0, help="Requests per minute (0 = unlimited)")
+    parser.add_argument("--daily-quota", type=int, default=0, help="Requests per day (0 = unlimited)")
+    args = parser.parse_args()
+
+    api = StandinAPI(
+        mode=args.mode,
+        data_dir=args.data_dir,
+        synthesizer=SeasonSynthesizer(teams_per_league=args.teams, seed=args.seed),
+        default_season=args.season,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit=args.rate_limit,
+        daily_quota=args.daily_quota,
+        upstream=args.upstream,
+    )
+    uvicorn.run(create_app(api), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Football Intelligence Dashboard - Sync Benchmark
+Times a full SyncService.sync_all against the API-Football stand-in.
+
+Starts the stand-in on a free port (unless --base-url points at a running
+one), syncs into a scratch SQLite database and prints per-run timings.
+
+Usage (from backend/):
+    python -m benchmarks.sync_benchmark --runs 2 --modes sequential concurrent --latency-ms 80
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_standin(args: argparse.Namespace) -> "tuple[subprocess.Popen, str]":
+    port = _free_port()
+    cmd = [
+        sys.executable, "-m", "benchmarks.api_football_standin",
+        "--port", str(port),
+        "--mode", args.standin_mode,
+        "--season", str(args.season),
+        "--teams", str(args.teams),
+        "--latency-ms", str(args.latency_ms),
+        "--jitter-ms", str(args.jitter_ms),
+        "--rate-limit", str(args.rate_limit),
+    ]
+    if args.data_dir:
+        cmd += ["--data-dir", args.data_dir]
+    proc = subprocess.Popen(cmd, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    base_url = f"http://127.0.0.1:{port}"
+
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/status", timeout=1).status_code == 200:
+                return proc, base_url
+        except httpx.HTTPError:
+            pass
+        if proc.poll() is not None:
+            break
+        time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError("API-Football stand-in did not start")
+
+
+async def _run(args: argparse.Namespace) -> None:
+    # Imported here: settings are read from the environment configured in main()
+    from app.core.database import Base, async_session_factory, engine
+    from app.integrations.football_api import api_football_client
+    import app.models  # noqa: F401 - registers every table on Base.metadata
+    from app.services.sync_service import SyncService
+
+    print(f"{'mode':<12}{'run':>4}{'seconds':>10}{'fixtures':>10}{'requests':>10}")
+    for mode in args.modes:
+        for run in range(1, args.runs + 1):
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+                await conn.run_sync(Base.metadata.create_all)
+
+            before = await _request_count(args.base_url)
+            started = time.perf_counter()
+            async with async_session_factory() as session:
+                result = await SyncService(session).sync_all(
+                    season_year=args.season,
+                    concurrent=mode == "concurrent",
+                    max_concurrency=args.max_concurrency,
+                )
+                await session.commit()
+            elapsed = time.perf_counter() - started
+            requests = await _request_count(args.base_url) - before
+
+            fixtures = sum(
+                league.get("fixtures", {}).get("created", 0) + league.get("fixtures", {}).get("updated", 0)
+                for league in result.values()
+                if isinstance(league, dict)
+            )
+            print(f"{mode:<12}{run:>4}{elapsed:>10.2f}{fixtures:>10}{requests:>10}")
+
+    await api_football_client.close()
+    await engine.dispose()
+
+
+async def _request_count(base_url: str) -> int:
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        return (await client.get("/status")).json().get("requests_today", 0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", help="Use an already running stand-in instead of starting one")
+    parser.add_argument("--modes", nargs="+", choices=("sequential", "concurrent"), default=["sequential", "concurrent"])
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--season", type=int, default=2024)
+    parser.add_argument("--max-concurrency", type=int, default=None)
+    parser.add_argument("--database-url", help="Defaults to a temporary SQLite file")
+    parser.add_argument("--standin-mode", choices=("synth", "replay"), default="synth")
+    parser.add_argument("--data-dir", help="Recordings directory for --standin-mode replay")
+    parser.add_argument("--teams", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--rate-limit", type=int, default=0, help="Stand-in requests per minute (0 = unlimited)")
+    args = parser.parse_args()
+
+    proc = None
+    if not args.base_url:
+        proc, args.base_url = _start_standin(args)
+
+    scratch = tempfile.mkdtemp(prefix="sync-bench-")
+    os.environ["API_FOOTBALL_BASE_URL"] = args.base_url
+    os.environ["API_FOOTBALL_KEY"] = "standin"
+    os.environ["API_FOOTBALL_CACHE_ENABLED"] = "false"
+    # Synthetic payloads must never land in the raw archive that reprocess_archive.py replays
+    os.environ["API_FOOTBALL_ARCHIVE_ENABLED"] = "false"
+    os.environ["API_FOOTBALL_ARCHIVE_DIR"] = os.path.join(scratch, "api_archive")
+    os.environ["API_FOOTBALL_RATE_LIMIT_ENABLED"] = "true" if args.rate_limit else "false"
+    os.environ["API_FOOTBALL_RATE_LIMIT_PER_MINUTE"] = str(args.rate_limit or 1)
+    os.environ["APP_DEBUG"] = "false"
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite+aiosqlite:///{scratch}/bench.db"
+
+    try:
+        asyncio.run(_run(args))
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
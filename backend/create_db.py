@@ -11,6 +11,7 @@ from app.models.prediction import Prediction
 from app.models.ai_analysis import AIAnalysis
 from app.models.notification_log import NotificationLog
 from app.models.user import User
+from app.models.sync_job import SyncJobState
 
 async def create_tables():
     print("Creating tables in database via SQLAlchemy...")
@@ -0,0 +1,60 @@
+"""
+Rebuild the database from the raw API-Football archive without network access.
+
+Replays archived responses (see app.integrations.raw_archive) through the
+regular SyncService parsers, oldest season first.
+
+Usage:
+    python reprocess_archive.py                      # every archived season
+    python reprocess_archive.py --season 2023 2024 --create-tables
+"""
+
+import argparse
+import asyncio
+import time
+
+from loguru import logger
+
+from app.core.config import get_settings
+from app.core.database import Base, async_session_factory, engine
+from app.integrations.football_api import ArchiveReplayClient
+from app.integrations.raw_archive import RawArchive
+import app.models  # noqa: F401 - registers every table on Base.metadata
+from app.services.sync_service import SyncService
+
+settings = get_settings()
+
+
+async def reprocess(seasons, archive_dir: str, concurrent: bool, create_tables: bool) -> None:
+    if create_tables:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    client = ArchiveReplayClient(RawArchive(archive_dir, enabled=False))
+    seasons = seasons or client.archive.seasons()
+    if not seasons:
+        logger.warning(f"No archived seasons found in {archive_dir}")
+        return
+
+    for season in sorted(seasons):
+        started = time.perf_counter()
+        async with async_session_factory() as session:
+            await SyncService(session, client=client).sync_all(
+                season_year=season, concurrent=concurrent, force=True
+            )
+            await session.commit()
+        logger.info(f"Season {season} reprocessed in {time.perf_counter() - started:.1f}s")
+
+    logger.info(f"Archive replay: {client.served} responses served, {client.missing} not archived")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--season", type=int, nargs="*", help="Seasons to replay (default: all archived)")
+    parser.add_argument("--archive-dir", default=settings.API_FOOTBALL_ARCHIVE_DIR)
+    parser.add_argument("--concurrent", action="store_true", help="Replay leagues in parallel")
+    parser.add_argument("--create-tables", action="store_true", help="Create missing tables first")
+    args = parser.parse_args()
+
+    asyncio.run(reprocess(args.season, args.archive_dir, args.concurrent, args.create_tables))